@@ -22,6 +22,8 @@ from .routers.utility import router as utility_router
 # from .api.routes.rhythm_patterns import router as rhythm_patterns_router
 # from .routers.sequence_routes import router as sequence_routes_router
 from .database.db import init_db, close_mongo_connection
+from .generators.executor import get_generation_executor
+from .core.preset_registry import get_preset_registry
 
 # Configure rate limiter
 limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
@@ -30,7 +32,9 @@ limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
 async def lifespan(_: FastAPI):
     """Handle startup and shutdown events."""
     await init_db()
+    get_preset_registry()  # compile and validate the generation presets
     yield
+    get_generation_executor().shutdown()
     await close_mongo_connection()
 
 app = FastAPI(
@@ -14,6 +14,7 @@ from note_gen.core.enums import ScaleType, PatternDirection, ValidationLevel
 from note_gen.models.scale_info import ScaleInfo
 from note_gen.factories.pattern_factory import PatternFactory
 from note_gen.validation.base_validation import ValidationResult, ValidationViolation
+from note_gen.validation.validation_manager import ValidationManager
 
 
 class PatternController:
@@ -171,17 +172,10 @@ class PatternController:
         Returns:
             The validation result
         """
-        # For now, we'll implement a simple validation
-        # In a real implementation, this would use a validation service
+        # Note patterns check their musical rules, rhythm patterns run the
+        # registered rules; both through the validation cache
         try:
-            if isinstance(pattern, NotePattern):
-                # Validate the pattern
-                pattern.validate_musical_rules()
-                # If we get here, validation passed
-                return ValidationResult(is_valid=True)
-            else:
-                # For rhythm patterns, we'll just return valid for now
-                return ValidationResult(is_valid=True)
+            return ValidationManager.validate_content(pattern, validation_level)
         except ValueError as e:
             # If validation fails, return the error
             result = ValidationResult(is_valid=False)
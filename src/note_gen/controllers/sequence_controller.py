@@ -5,17 +5,25 @@ This controller handles the business logic for sequence operations,
 including generating, retrieving, and manipulating sequences.
 """
 
-from typing import List, Optional, Dict, Any, Union, cast
+from typing import List, Optional, Dict, Any, Tuple, Union, Awaitable, Callable, cast
 
+from note_gen.core.enums import VoicingMode
 from note_gen.database.repositories.base import BaseRepository
 from note_gen.models.sequence import Sequence
 from note_gen.models.note_sequence import NoteSequence
 from note_gen.models.chord_progression import ChordProgression
 from note_gen.controllers.pattern_controller import PatternController
-from note_gen.generators.note_sequence_generator import NoteSequenceGenerator
-from note_gen.core.enums import ValidationLevel
+from note_gen.generators.executor import GenerationExecutor, get_generation_executor
+from note_gen.generators.generation_cache import (
+    NOTE_PATTERN_COLLECTION, PROGRESSION_COLLECTION, RHYTHM_PATTERN_COLLECTION,
+    GenerationCache, content_key, get_generation_cache, input_dependencies
+)
+from note_gen.generators.long_form import CheckpointStore, LongFormCheckpoint, LongFormGenerator
+from note_gen.generators.note_sequence_generator import GenerationRequest, NoteSequenceGenerator
 from note_gen.models.patterns import NotePattern
 from note_gen.models.rhythm import RhythmPattern
+from note_gen.models.scale_info import ScaleInfo
+from note_gen.schemas.sequence_request import SequenceGenerationRequest
 
 
 class SequenceController:
@@ -25,7 +33,9 @@ class SequenceController:
         self,
         sequence_repository: BaseRepository,
         pattern_controller: PatternController,
-        chord_progression_repository: BaseRepository
+        chord_progression_repository: BaseRepository,
+        executor: Optional[GenerationExecutor] = None,
+        cache: Optional[GenerationCache] = None
     ):
         """
         Initialize the sequence controller.
@@ -34,10 +44,14 @@ class SequenceController:
             sequence_repository: Repository for sequence data access
             pattern_controller: Controller for pattern operations
             chord_progression_repository: Repository for chord progression data access
+            executor: Executor that runs generation (defaults to the one configured in settings)
+            cache: Cache of generated sequences (defaults to the shared one)
         """
         self.sequence_repository = sequence_repository
         self.pattern_controller = pattern_controller
         self.chord_progression_repository = chord_progression_repository
+        self.executor = executor or get_generation_executor()
+        self.cache = cache if cache is not None else get_generation_cache()
 
     async def get_sequence(self, sequence_id: str) -> Optional[Sequence]:
         """
@@ -77,7 +91,8 @@ class SequenceController:
         self,
         progression_name: str,
         pattern_name: str,
-        rhythm_pattern_name: str
+        rhythm_pattern_name: str,
+        voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION
     ) -> NoteSequence:
         """
         Generate a sequence from a chord progression and patterns.
@@ -86,11 +101,206 @@ class SequenceController:
             progression_name: Name of the chord progression to use
             pattern_name: Name of the note pattern to use
             rhythm_pattern_name: Name of the rhythm pattern to use
+            voicing_mode: How the progression's chords are voiced
 
         Returns:
             The generated note sequence
         """
-        # Get the chord progression
+        # A repeat of a recent request skips both the lookups and generation
+        voicing_mode = VoicingMode(voicing_mode)
+        alias = (progression_name, pattern_name, rhythm_pattern_name, voicing_mode.value)
+        sequence = self.cache.get_alias(alias)
+        if sequence is None:
+            sequence = await self._generate_cached(
+                progression_name, pattern_name, rhythm_pattern_name, voicing_mode
+            )
+        sequence.name = f"Generated sequence from {progression_name}"
+
+        # Save the sequence
+        return await self.sequence_repository.create(sequence)
+
+    async def _generate_cached(
+        self,
+        progression_name: str,
+        pattern_name: str,
+        rhythm_pattern_name: str,
+        voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION
+    ) -> NoteSequence:
+        """Load the inputs, then return the cached sequence for them or generate and cache it."""
+        progression, note_pattern, rhythm_pattern = await self._load_generation_inputs(
+            progression_name, pattern_name, rhythm_pattern_name
+        )
+        key = content_key(
+            progression, note_pattern, rhythm_pattern, progression.key, progression.scale_type,
+            voicing_mode=voicing_mode
+        )
+        sequence = self.cache.get(key)
+        if sequence is None:
+            # Generate the sequence on the configured executor
+            scale_info = ScaleInfo(key=progression.key, scale_type=progression.scale_type)
+            sequence = await self.executor.generate(GenerationRequest(
+                chord_progression=progression,
+                note_pattern=note_pattern,
+                rhythm_pattern=rhythm_pattern,
+                scale_info=scale_info,
+                note_pattern_name=pattern_name,
+                rhythm_pattern_name=rhythm_pattern_name,
+                voicing_mode=voicing_mode
+            ))
+        dependencies = (
+            input_dependencies(PROGRESSION_COLLECTION, progression)
+            | input_dependencies(NOTE_PATTERN_COLLECTION, note_pattern)
+            | input_dependencies(RHYTHM_PATTERN_COLLECTION, rhythm_pattern)
+        )
+        alias = (progression_name, pattern_name, rhythm_pattern_name, voicing_mode.value)
+        self.cache.put(key, sequence, dependencies, alias=alias)
+        return sequence
+
+    async def generate_sequences_batch(
+        self, requests: List[SequenceGenerationRequest]
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate many sequences in one batch.
+
+        Each progression, note pattern and rhythm pattern is loaded once by
+        name however many requests use it, and requests sharing inputs share
+        their generation work (see NoteSequenceGenerator.generate_many).
+
+        Args:
+            requests: Sequences to generate
+
+        Returns:
+            One dict per request, in order: {"sequence": saved sequence} or
+            {"error": message}
+        """
+        loaded: Dict[Tuple[str, str], Any] = {}
+
+        async def load(kind: str, name: str, loader: Callable[[str], Awaitable[Any]]) -> Any:
+            if (kind, name) not in loaded:
+                try:
+                    loaded[kind, name] = await loader(name)
+                except ValueError as e:
+                    loaded[kind, name] = e
+            return loaded[kind, name]
+
+        scales: Dict[Tuple[str, Any], ScaleInfo] = {}
+        batch: List[GenerationRequest] = []
+        indices: List[int] = []
+        results: List[Dict[str, Any]] = [{} for _ in requests]
+        for index, request in enumerate(requests):
+            inputs = (
+                await load("progression", request.progression_name, self._load_progression),
+                await load("note", request.pattern_name, self._load_note_pattern),
+                await load("rhythm", request.rhythm_pattern_name, self._load_rhythm_pattern)
+            )
+            error = next((item for item in inputs if isinstance(item, ValueError)), None)
+            if error is not None:
+                results[index] = {"error": str(error)}
+                continue
+            progression, note_pattern, rhythm_pattern = inputs
+            scale_key = (progression.key, progression.scale_type)
+            if scale_key not in scales:
+                scales[scale_key] = ScaleInfo(key=progression.key, scale_type=progression.scale_type)
+            batch.append(GenerationRequest(
+                chord_progression=progression,
+                note_pattern=note_pattern,
+                rhythm_pattern=rhythm_pattern,
+                scale_info=scales[scale_key],
+                transpose=request.transpose,
+                note_pattern_name=request.pattern_name,
+                rhythm_pattern_name=request.rhythm_pattern_name,
+                voicing_mode=request.voicing_mode
+            ))
+            indices.append(index)
+
+        sequences = await self.executor.generate_many(batch, return_exceptions=True)
+        for index, generation, sequence in zip(indices, batch, sequences):
+            if isinstance(sequence, Exception):
+                results[index] = {"error": str(sequence)}
+                continue
+            sequence.name = f"Generated sequence from {generation.chord_progression.name}"
+            results[index] = {"sequence": await self.sequence_repository.create(sequence)}
+        return results
+
+    async def generate_long_form(
+        self,
+        progression_name: str,
+        pattern_name: str,
+        rhythm_pattern_name: str,
+        total_bars: int,
+        chunk_bars: Optional[int] = None,
+        job_id: Optional[str] = None,
+        genre: Optional[str] = None,
+        seed: Optional[int] = None,
+        voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION,
+        store: Optional[CheckpointStore] = None
+    ) -> LongFormCheckpoint:
+        """
+        Generate a long piece chunk by chunk, saving each chunk as it completes.
+
+        Running a job id again resumes it after its last saved chunk (see
+        note_gen.generators.long_form).
+
+        Args:
+            progression_name: Name of the chord progression to use (repeated
+                unless a genre is given)
+            pattern_name: Name of the note pattern to use
+            rhythm_pattern_name: Name of the rhythm pattern to use
+            total_bars: Length of the piece in bars
+            chunk_bars: Bars per saved chunk
+            job_id: Id of the job to start or resume
+            genre: Sample chords from this genre's Markov model
+            seed: Seed for the sampled chords
+            voicing_mode: How the chords are voiced
+            store: Where checkpoints are kept (defaults to the shared store)
+
+        Returns:
+            The job's final checkpoint
+        """
+        progression, note_pattern, rhythm_pattern = await self._load_generation_inputs(
+            progression_name, pattern_name, rhythm_pattern_name
+        )
+        generator = NoteSequenceGenerator(
+            chord_progression=progression,
+            note_pattern=note_pattern,
+            rhythm_pattern=rhythm_pattern,
+            note_pattern_name=pattern_name,
+            rhythm_pattern_name=rhythm_pattern_name,
+            voicing_mode=voicing_mode
+        )
+        options: Dict[str, Any] = {} if chunk_bars is None else {"chunk_bars": chunk_bars}
+        job = LongFormGenerator(
+            generator,
+            total_bars,
+            ScaleInfo(key=progression.key, scale_type=progression.scale_type),
+            genre=genre,
+            seed=seed,
+            job_id=job_id,
+            **options
+        )
+        # Chunk ids are deterministic, so a chunk rewritten after a crash replaces its first copy
+        return await job.run(self.sequence_repository.upsert, store)
+
+    async def _load_generation_inputs(
+        self,
+        progression_name: str,
+        pattern_name: str,
+        rhythm_pattern_name: str
+    ) -> Tuple[ChordProgression, NotePattern, RhythmPattern]:
+        """
+        Load the chord progression and patterns a generation needs.
+
+        Raises:
+            ValueError: If any of them is missing or the progression is empty
+        """
+        return (
+            await self._load_progression(progression_name),
+            await self._load_note_pattern(pattern_name),
+            await self._load_rhythm_pattern(rhythm_pattern_name)
+        )
+
+    async def _load_progression(self, progression_name: str) -> ChordProgression:
+        """Load a chord progression by name, raising ValueError if it is missing or empty."""
         progressions = await self.chord_progression_repository.find_many({"name": progression_name})
         if not progressions:
             raise ValueError(f"Chord progression not found: {progression_name}")
@@ -99,37 +309,21 @@ class SequenceController:
         # Ensure the chord progression has items
         if not progression.items or len(progression.items) == 0:
             raise ValueError(f"Chord progression '{progression_name}' is empty")
+        return progression
 
-        # Get the note pattern
+    async def _load_note_pattern(self, pattern_name: str) -> NotePattern:
+        """Load a note pattern by name, raising ValueError if it is missing."""
         pattern = await self.pattern_controller.get_pattern_by_name(pattern_name, "note")
         if not pattern:
             raise ValueError(f"Note pattern not found: {pattern_name}")
-        note_pattern = cast(NotePattern, pattern)  # Explicitly cast to NotePattern
+        return cast(NotePattern, pattern)  # Explicitly cast to NotePattern
 
-        # Get the rhythm pattern
+    async def _load_rhythm_pattern(self, rhythm_pattern_name: str) -> RhythmPattern:
+        """Load a rhythm pattern by name, raising ValueError if it is missing."""
         pattern = await self.pattern_controller.get_pattern_by_name(rhythm_pattern_name, "rhythm")
         if not pattern:
             raise ValueError(f"Rhythm pattern not found: {rhythm_pattern_name}")
-        rhythm_pattern = cast(RhythmPattern, pattern)  # Explicitly cast to RhythmPattern
-
-        # Generate the sequence using the generator
-        generator = NoteSequenceGenerator(
-            chord_progression=progression,
-            note_pattern=note_pattern,
-            rhythm_pattern=rhythm_pattern,
-            validation_level=ValidationLevel.NORMAL,
-            note_pattern_name=pattern_name,
-            rhythm_pattern_name=rhythm_pattern_name
-        )
-
-        # Generate the sequence
-        from note_gen.models.scale_info import ScaleInfo
-        scale_info = ScaleInfo(key=progression.key, scale_type=progression.scale_type)
-        sequence = await generator.generate_sequence_async(scale_info=scale_info)
-        sequence.name = f"Generated sequence from {progression_name}"
-
-        # Save the sequence
-        return await self.sequence_repository.create(sequence)
+        return cast(RhythmPattern, pattern)  # Explicitly cast to RhythmPattern
 
     async def get_sequence_by_name(self, sequence_name: str) -> Optional[Sequence]:
         """
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from note_gen.core.enums import ValidationLevel
 from note_gen.validation.base_validation import ValidationResult, ValidationViolation
+from note_gen.validation.validation_cache import get_validation_cache
 from note_gen.validation.validation_manager import ValidationManager
 from note_gen.validation.validation_factory import ValidationFactory
 from note_gen.models.patterns import NotePattern, Pattern
@@ -37,38 +38,68 @@ class ValidationController:
         Returns:
             ValidationResult: The validation result
         """
+        return self._validate_instance(model, level)
+
+    def _validate_instance(self, model: Any, level: Optional[ValidationLevel]) -> ValidationResult:
+        """Validate a model instance, through the validation cache where its content can be validated."""
         # Use default level if None is provided
         validation_level = level if level is not None else ValidationLevel.NORMAL
 
+        if self.validation_manager.can_validate_content(type(model)):
+            return self.validation_manager.validate_content(model, validation_level)
         if hasattr(model, 'model_validate'):
             return model.model_validate(validation_level)
         elif hasattr(model, 'validate'):  # For backward compatibility
             return model.validate(validation_level)
         return self.validation_manager.validate(model)
 
-    async def validate_note_pattern(self, pattern: Union[Dict[str, Any], NotePattern],
-                              level: Optional[ValidationLevel] = ValidationLevel.NORMAL) -> ValidationResult:
+    def _validate_payload(self, model_type: Type[BaseModel], payload: Dict[str, Any],
+                          level: Optional[ValidationLevel], label: str) -> ValidationResult:
         """
-        Validate a note pattern.
+        Validate a request payload as a model, through the validation cache.
+
+        The model is only built when the payload's result is not cached.
 
         Args:
-            pattern: The note pattern to validate
+            model_type: Model the payload describes
+            payload: The request payload
             level: The validation level to apply
+            label: Name of the model in error messages
 
         Returns:
             ValidationResult: The validation result
         """
-        if isinstance(pattern, dict):
+        validation_level = level if level is not None else ValidationLevel.NORMAL
+
+        def validate() -> ValidationResult:
             try:
-                pattern = NotePattern.model_validate(pattern)
+                model = model_type.model_validate(payload)
             except Exception as e:
                 return ValidationResult(
                     is_valid=False,
                     violations=[ValidationViolation(
-                        message=f"Invalid note pattern format: {str(e)}",
+                        message=f"Invalid {label} format: {str(e)}",
                         code="VALIDATION_ERROR"
                     )]
                 )
+            return self._validate_instance(model, validation_level)
+
+        return get_validation_cache().get_or_validate(model_type, payload, validation_level, validate)
+
+    async def validate_note_pattern(self, pattern: Union[Dict[str, Any], NotePattern],
+                              level: Optional[ValidationLevel] = ValidationLevel.NORMAL) -> ValidationResult:
+        """
+        Validate a note pattern.
+
+        Args:
+            pattern: The note pattern to validate
+            level: The validation level to apply
+
+        Returns:
+            ValidationResult: The validation result
+        """
+        if isinstance(pattern, dict):
+            return self._validate_payload(NotePattern, pattern, level, "note pattern")
 
         return await self.validate_model(pattern, level)
 
@@ -85,16 +116,7 @@ class ValidationController:
             ValidationResult: The validation result
         """
         if isinstance(pattern, dict):
-            try:
-                pattern = RhythmPattern.model_validate(pattern)
-            except Exception as e:
-                return ValidationResult(
-                    is_valid=False,
-                    violations=[ValidationViolation(
-                        message=f"Invalid rhythm pattern format: {str(e)}",
-                        code="VALIDATION_ERROR"
-                    )]
-                )
+            return self._validate_payload(RhythmPattern, pattern, level, "rhythm pattern")
 
         return await self.validate_model(pattern, level)
 
@@ -111,16 +133,7 @@ class ValidationController:
             ValidationResult: The validation result
         """
         if isinstance(sequence, dict):
-            try:
-                sequence = NoteSequence.model_validate(sequence)
-            except Exception as e:
-                return ValidationResult(
-                    is_valid=False,
-                    violations=[ValidationViolation(
-                        message=f"Invalid note sequence format: {str(e)}",
-                        code="VALIDATION_ERROR"
-                    )]
-                )
+            return self._validate_payload(NoteSequence, sequence, level, "note sequence")
 
         return await self.validate_model(sequence, level)
 
@@ -137,19 +150,19 @@ class ValidationController:
             ValidationResult: The validation result
         """
         if isinstance(progression, dict):
-            try:
-                progression = ChordProgression.model_validate(progression)
-            except Exception as e:
-                return ValidationResult(
-                    is_valid=False,
-                    violations=[ValidationViolation(
-                        message=f"Invalid chord progression format: {str(e)}",
-                        code="VALIDATION_ERROR"
-                    )]
-                )
+            return self._validate_payload(ChordProgression, progression, level, "chord progression")
 
         return await self.validate_model(progression, level)
 
+    async def cache_metrics(self) -> Dict[str, Any]:
+        """
+        Get the validation cache's size and hit rate.
+
+        Returns:
+            Dict[str, Any]: The cache metrics
+        """
+        return get_validation_cache().metrics()
+
     async def validate_config(self, config: Dict[str, Any], config_type: str) -> bool:
         """
         Validate a configuration dictionary.
@@ -2,10 +2,11 @@
 from typing import List, Tuple
 from note_gen.core.constants import (
     NOTES,
-    NOTE_TO_SEMITONE,
-    SCALE_INTERVALS
+    NOTE_TO_SEMITONE
 )
 from note_gen.core.enums import ScaleType
+from note_gen.core.note_parser import parse_pitch
+from note_gen.core.scale_catalog import get_scale_table
 
 class NoteAccessor:
     """Accessor for note-related operations."""
@@ -45,14 +46,10 @@ class NoteAccessor:
         if not note_name:
             raise ValueError("Note name cannot be empty")
 
-        # Remove any whitespace and capitalize
-        normalized = note_name.strip().upper()
-
-        # Check if the normalized note is in NOTES or is a flat equivalent
-        if normalized not in NOTES and normalized not in NOTE_TO_SEMITONE:
-            raise ValueError(f"Invalid note name: {note_name}")
-
-        return normalized
+        try:
+            return parse_pitch(note_name)
+        except ValueError:
+            raise ValueError(f"Invalid note name: {note_name}") from None
 
     @staticmethod
     def get_midi_number(note_name: str, octave: int) -> int:
@@ -91,15 +88,15 @@ class ScaleDegreeAccessor:
     @staticmethod
     def get_scale_degree(degree: int, scale_type: ScaleType) -> int:
         """Get semitone value for a scale degree in a given scale."""
-        intervals = SCALE_INTERVALS[scale_type.value]
+        intervals = get_scale_table('C', scale_type).intervals
         if 1 <= degree <= len(intervals):
-            return int(intervals[degree - 1])
+            return intervals[degree - 1]
         return 0
 
     @staticmethod
     def validate_degree(degree: int, scale_type: ScaleType) -> bool:
         """Validate if a scale degree is valid for the given scale type."""
-        return 1 <= degree <= len(SCALE_INTERVALS[scale_type.value])
+        return 1 <= degree <= len(get_scale_table('C', scale_type).intervals)
 
 class ScaleAccessor:
     """Accessor for scale-related operations."""
@@ -107,9 +104,7 @@ class ScaleAccessor:
     @staticmethod
     def get_scale_intervals(scale_type: ScaleType) -> Tuple[int, ...]:
         """Get intervals for a scale type."""
-        intervals = SCALE_INTERVALS[scale_type.value]
-        # Ensure the return type is correct
-        return tuple(int(i) for i in intervals)
+        return get_scale_table('C', scale_type).intervals
 
     # Remove  as it belongs in Scale/ScaleInfo classes
 
@@ -0,0 +1,191 @@
+"""Chord recognition from arbitrary note sets.
+
+Every 12-bit pitch-class set is mapped once to its best matching chords
+(root + :class:`~note_gen.core.enums.ChordQuality`), so identifying the
+harmony of a group of notes is a single table lookup. The table is built on
+first use from the interval registry in ``CHORD_INTERVALS``.
+
+A chord matches a set best when the fewest notes differ between the two
+(chord tones missing from the set plus set notes outside the chord). Ties
+prefer fewer missing chord tones, then the registry order of qualities. When
+several roots spell the very same notes (augmented triads, diminished
+sevenths, sus2/sus4), the root equal to the bass note wins.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from note_gen.core.constants import CHORD_INTERVALS, SEMITONE_TO_NOTE
+from note_gen.core.enums import ChordQuality
+from note_gen.core.pitch_class_set import FULL_MASK, PitchClassSet
+from note_gen.models.note import Note
+
+if TYPE_CHECKING:
+    from note_gen.models.chord import Chord
+
+# Qualities that only alias another quality's intervals
+_ALIAS_QUALITIES = frozenset({ChordQuality.DOMINANT})
+
+# Fewest chord tones that must be present in a set to name a chord
+MIN_MATCHED_TONES = 2
+
+# (chord mask, root pitch class, quality)
+Candidate = Tuple[int, int, ChordQuality]
+NoteLike = Union[Note, int]
+
+
+@dataclass(frozen=True, slots=True)
+class ChordMatch:
+    """A recognized chord.
+
+    Attributes:
+        root: Root pitch name, spelled with sharps
+        quality: Chord quality
+        inversion: Index of the bass note among the chord tones (0 = root position)
+    """
+    root: str
+    quality: ChordQuality
+    inversion: int = 0
+
+    @property
+    def symbol(self) -> str:
+        """Get the chord as 'root quality', e.g. 'C# MINOR'."""
+        return f"{self.root} {self.quality.value}"
+
+    def to_chord(self, **kwargs: Any) -> 'Chord':
+        """Create a Chord model for this match."""
+        from note_gen.models.chord import Chord
+        return Chord(root=self.root, quality=self.quality, **kwargs)
+
+
+def _candidates() -> List[Tuple[int, int, int, ChordQuality]]:
+    """Get (mask, rank, root, quality) for every root and quality."""
+    candidates = []
+    for rank, (quality, intervals) in enumerate(CHORD_INTERVALS.items()):
+        if quality in _ALIAS_QUALITIES:
+            continue
+        base = PitchClassSet.of(intervals)
+        for root in range(12):
+            candidates.append((base.transpose(root).mask, rank, root, quality))
+    return candidates
+
+
+@lru_cache(maxsize=1)
+def _recognition_table() -> Tuple[Tuple[Candidate, ...], ...]:
+    """Map every pitch-class mask to its best match plus same-note alternatives.
+
+    The first candidate of each entry is the best match; the rest spell the
+    same chord mask from other roots.
+    """
+    candidates = _candidates()
+    table: List[Tuple[Candidate, ...]] = []
+    for mask in range(FULL_MASK + 1):
+        scored = []
+        for chord_mask, rank, root, quality in candidates:
+            if not mask >> root & 1 or (mask & chord_mask).bit_count() < MIN_MATCHED_TONES:
+                continue
+            missing = (chord_mask & ~mask).bit_count()
+            score = (missing + (mask & ~chord_mask).bit_count(), missing, rank, root)
+            scored.append((score, (chord_mask, root, quality)))
+        if not scored:
+            table.append(())
+            continue
+        scored.sort(key=lambda item: item[0])
+        best = scored[0][1]
+        table.append(tuple(c for _, c in scored if c[0] == best[0]))
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def _inversion(quality: ChordQuality, bass_interval: int) -> int:
+    """Get the inversion for a bass note the given interval above the root."""
+    for index, interval in enumerate(CHORD_INTERVALS[quality]):
+        if interval % 12 == bass_interval:
+            return index
+    return 0
+
+
+def identify(pitch_classes: PitchClassSet, bass: Optional[int] = None) -> Optional[ChordMatch]:
+    """
+    Identify the chord formed by a set of pitch classes.
+
+    Args:
+        pitch_classes: The sounding pitch classes
+        bass: Pitch class (or MIDI number) of the lowest note, used to break
+            ties between symmetric chords and to compute the inversion
+
+    Returns:
+        The best matching chord, or None if fewer than two chord tones match
+    """
+    matches = _recognition_table()[pitch_classes.mask]
+    if not matches:
+        return None
+    _, root, quality = matches[0]
+    if bass is not None:
+        bass %= 12
+        _, root, quality = next((m for m in matches if m[1] == bass), matches[0])
+    inversion = 0 if bass is None else _inversion(quality, (bass - root) % 12)
+    return ChordMatch(root=SEMITONE_TO_NOTE[root], quality=quality, inversion=inversion)
+
+
+def _to_midi(note: NoteLike) -> int:
+    return note if isinstance(note, int) else note.to_midi_number()
+
+
+def recognize_chord(notes: Iterable[NoteLike]) -> Optional[ChordMatch]:
+    """
+    Identify the chord formed by a group of notes.
+
+    Args:
+        notes: Notes or MIDI numbers; the lowest is taken as the bass
+
+    Returns:
+        The best matching chord, or None if no chord matches
+    """
+    midi = [_to_midi(note) for note in notes]
+    if not midi:
+        return None
+    return identify(PitchClassSet.of(midi), bass=min(midi))
+
+
+def recognize_many(groups: Iterable[Iterable[NoteLike]]) -> List[Optional[ChordMatch]]:
+    """
+    Identify the chord of each group of notes in one pass.
+
+    Args:
+        groups: Groups of notes or MIDI numbers
+
+    Returns:
+        One match (or None) per group, in input order
+    """
+    return [recognize_chord(group) for group in groups]
+
+
+def label_sequence(notes: Sequence[Note]) -> List[Tuple[float, Optional[ChordMatch]]]:
+    """
+    Label the harmony of a note sequence, grouping notes that start together.
+
+    Args:
+        notes: Notes with positions, in any order
+
+    Returns:
+        (position, chord or None) pairs in ascending position order
+    """
+    masks: Dict[float, int] = {}
+    basses: Dict[float, int] = {}
+    for note in notes:
+        midi = note.to_midi_number()
+        position = note.position
+        masks[position] = masks.get(position, 0) | 1 << midi % 12
+        if midi < basses.get(position, midi + 1):
+            basses[position] = midi
+    return [
+        (position, identify(PitchClassSet(masks[position]), bass=basses[position]))
+        for position in sorted(masks)
+    ]
+
+
+__all__ = [
+    'ChordMatch', 'MIN_MATCHED_TONES', 'identify', 'recognize_chord',
+    'recognize_many', 'label_sequence'
+]
@@ -0,0 +1,169 @@
+"""Table-driven chord-symbol grammar.
+
+A chord symbol is ``<root><suffix>[/<bass>]``, e.g. 'C', 'F#m7', 'Bbmaj9',
+'Dm7b5', 'Gsus4/C'. Roots and basses are any legal pitch name; suffixes come
+from :data:`QUALITY_SUFFIXES`, which covers every ChordQuality (the quality's
+own value, e.g. 'CMAJOR_SEVENTH', is accepted as well). Parsing is a pair of
+dictionary lookups and is memoized, so repeated symbols cost one cache hit.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from note_gen.core.constants import NOTE_TO_SEMITONE, SEMITONE_TO_NOTE
+from note_gen.core.enums import ChordQuality
+from note_gen.core.note_parser import NOTE_NAME_TABLE
+
+if TYPE_CHECKING:
+    from note_gen.models.chord import Chord
+
+# Accepted suffixes per quality; the first is the canonical spelling
+QUALITY_SUFFIXES: Mapping[ChordQuality, Tuple[str, ...]] = MappingProxyType({
+    ChordQuality.MAJOR: ('', 'maj', 'M'),
+    ChordQuality.MINOR: ('m', 'min', '-'),
+    ChordQuality.DIMINISHED: ('dim', '°', 'o'),
+    ChordQuality.AUGMENTED: ('aug', '+'),
+    ChordQuality.DOMINANT: ('dom',),
+    ChordQuality.DOMINANT_SEVENTH: ('7', 'dom7'),
+    ChordQuality.MAJOR_SEVENTH: ('maj7', 'M7', 'Δ7', 'Δ'),
+    ChordQuality.MINOR_SEVENTH: ('m7', 'min7', '-7'),
+    ChordQuality.DIMINISHED_SEVENTH: ('dim7', '°7', 'o7'),
+    ChordQuality.HALF_DIMINISHED_SEVENTH: ('m7b5', 'ø', 'ø7', 'min7b5', '-7b5'),
+    ChordQuality.SUSPENDED_SECOND: ('sus2',),
+    ChordQuality.SUSPENDED_FOURTH: ('sus4', 'sus'),
+    ChordQuality.MAJOR_NINTH: ('maj9', 'M9', 'Δ9'),
+    ChordQuality.MINOR_NINTH: ('m9', 'min9', '-9'),
+    ChordQuality.MAJOR_ELEVENTH: ('maj11', 'M11', 'Δ11'),
+    ChordQuality.MINOR_ELEVENTH: ('m11', 'min11', '-11'),
+    ChordQuality.DOMINANT_ELEVENTH: ('11',)
+})
+
+
+def _build_suffix_table() -> Dict[str, ChordQuality]:
+    """Map every accepted suffix to its quality."""
+    table: Dict[str, ChordQuality] = {}
+    for quality, suffixes in QUALITY_SUFFIXES.items():
+        for suffix in suffixes + (quality.value,):
+            table[suffix] = quality
+    return table
+
+
+SUFFIX_TABLE: Mapping[str, ChordQuality] = MappingProxyType(_build_suffix_table())
+
+# Pitch names without octave, e.g. 'C#', 'bb' -> canonical spelling
+_ROOT_TABLE: Mapping[str, str] = MappingProxyType({
+    name: pitch for name, (pitch, octave) in NOTE_NAME_TABLE.items() if octave is None
+})
+
+
+@dataclass(frozen=True, slots=True)
+class ChordSymbol:
+    """A parsed chord symbol.
+
+    Attributes:
+        root: Canonical root spelling
+        quality: Chord quality
+        bass: Canonical bass spelling for slash chords, else None
+    """
+    root: str
+    quality: ChordQuality
+    bass: Optional[str] = None
+
+    @property
+    def symbol(self) -> str:
+        """Get the canonical symbol, e.g. 'F#m7/E'."""
+        symbol = f"{self.root}{QUALITY_SUFFIXES[self.quality][0]}"
+        return symbol if self.bass is None else f"{symbol}/{self.bass}"
+
+    def transpose(self, semitones: int) -> 'ChordSymbol':
+        """Transpose root and bass; transposed names are spelled with sharps."""
+        def shift(pitch: str) -> str:
+            return SEMITONE_TO_NOTE[(NOTE_TO_SEMITONE[pitch] + semitones) % 12]
+        return ChordSymbol(
+            root=shift(self.root),
+            quality=self.quality,
+            bass=None if self.bass is None else shift(self.bass)
+        )
+
+    def to_chord(self, **kwargs: Any) -> 'Chord':
+        """Create a Chord model (Chord has no bass, so slash basses are dropped)."""
+        from note_gen.models.chord import Chord
+        return Chord(root=self.root, quality=self.quality, **kwargs)
+
+    def __str__(self) -> str:
+        return self.symbol
+
+
+def _split_pitch(text: str) -> Tuple[str, str]:
+    """Split a leading pitch name off text, preferring the two-character spelling."""
+    for length in (2, 1):
+        pitch = _ROOT_TABLE.get(text[:length])
+        if pitch is not None:
+            return pitch, text[length:]
+    raise ValueError
+
+
+@lru_cache(maxsize=4096)
+def parse_symbol(symbol: str) -> ChordSymbol:
+    """
+    Parse a chord symbol.
+
+    Args:
+        symbol: Chord symbol such as 'C', 'Am', 'F7', 'Bbmaj9' or 'Gsus4/C'
+
+    Returns:
+        The shared, immutable parsed symbol
+
+    Raises:
+        ValueError: If the symbol does not match the grammar
+    """
+    text = symbol.strip()
+    head, slash, bass_text = text.partition('/')
+    try:
+        root, suffix = _split_pitch(head)
+        quality = SUFFIX_TABLE[suffix]
+        bass = _ROOT_TABLE[bass_text] if slash else None
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid chord symbol: {text}") from None
+    return ChordSymbol(root=root, quality=quality, bass=bass)
+
+
+def parse_many(symbols: Iterable[str], strict: bool = True) -> List[Optional[ChordSymbol]]:
+    """
+    Parse many chord symbols, parsing each distinct symbol once.
+
+    Args:
+        symbols: Chord symbols to parse
+        strict: If True, raise on the first illegal symbol; otherwise yield
+            None in its place
+
+    Returns:
+        Parsed symbols in input order
+
+    Raises:
+        ValueError: If strict and a symbol is illegal
+    """
+    parsed: Dict[str, Optional[ChordSymbol]] = {}
+    result: List[Optional[ChordSymbol]] = []
+    for symbol in symbols:
+        if symbol not in parsed:
+            try:
+                parsed[symbol] = parse_symbol(symbol)
+            except ValueError:
+                if strict:
+                    raise
+                parsed[symbol] = None
+        result.append(parsed[symbol])
+    return result
+
+
+def format_symbol(root: str, quality: ChordQuality, bass: Optional[str] = None) -> str:
+    """Format a chord symbol using the canonical suffix of the quality."""
+    return ChordSymbol(root=root, quality=quality, bass=bass).symbol
+
+
+__all__ = [
+    'ChordSymbol', 'QUALITY_SUFFIXES', 'SUFFIX_TABLE',
+    'parse_symbol', 'parse_many', 'format_symbol'
+]
@@ -0,0 +1,114 @@
+"""Cached chord voicings.
+
+A voicing is the tuple of pooled :class:`~note_gen.core.pitch.Pitch` values a
+chord sounds as, for a given root, quality, octave, inversion and
+:class:`~note_gen.core.enums.VoicingStyle`. Voicings are immutable, so they
+are computed once and shared from a bounded LRU cache.
+"""
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+from note_gen.core.constants import CHORD_INTERVALS, MIDI_MIN, MIDI_MAX, NOTE_TO_SEMITONE
+from note_gen.core.enums import ChordQuality, VoicingStyle
+from note_gen.core.note_parser import parse_pitch
+from note_gen.core.pitch import Pitch
+
+# Maximum number of distinct voicings kept in the cache
+VOICING_CACHE_SIZE = 1024
+
+Voicing = Tuple[Pitch, ...]
+
+
+def _apply_style(midi: List[int], style: VoicingStyle) -> List[int]:
+    """Spread an ascending close voicing according to the voicing style."""
+    if len(midi) < 3 or style == VoicingStyle.CLOSE:
+        return midi
+    if style == VoicingStyle.DROP2:
+        midi[-2] -= 12
+    elif style == VoicingStyle.OPEN:
+        midi[1] += 12
+    return sorted(midi)
+
+
+@lru_cache(maxsize=VOICING_CACHE_SIZE)
+def _voice(root: str, quality: ChordQuality, octave: int, inversion: int, style: VoicingStyle) -> Voicing:
+    """Compute a voicing from canonical, already-validated arguments."""
+    intervals = CHORD_INTERVALS[quality]
+    if not 0 <= inversion < len(intervals):
+        raise ValueError(f"Inversion must be between 0 and {len(intervals) - 1} for {quality.value}, got {inversion}")
+
+    root_midi = (octave + 1) * 12 + NOTE_TO_SEMITONE[root]
+    midi = [root_midi + interval for interval in intervals]
+    # Raise the lowest notes an octave, one per inversion
+    midi = sorted(midi[inversion:] + [m + 12 for m in midi[:inversion]])
+    midi = _apply_style(midi, style)
+
+    if midi[0] < MIDI_MIN or midi[-1] > MIDI_MAX:
+        raise ValueError(f"Voicing of {root}{octave} {quality.value} is outside the MIDI range")
+    return tuple(Pitch.from_midi(m) for m in midi)
+
+
+def get_voicing(
+    root: str,
+    quality: Union[ChordQuality, str],
+    octave: int = 4,
+    inversion: int = 0,
+    style: Union[VoicingStyle, str] = VoicingStyle.CLOSE
+) -> Voicing:
+    """
+    Get the shared, immutable voicing of a chord.
+
+    Pitches are ascending and spelled with sharps, matching Note.transpose.
+
+    Args:
+        root: Root pitch name, e.g. 'C', 'F#', 'Bb'
+        quality: Chord quality
+        octave: Octave of the root before inversion
+        inversion: Number of lowest notes raised an octave
+        style: Voicing style
+
+    Returns:
+        Tuple of pooled pitches
+
+    Raises:
+        ValueError: If any argument is invalid or the voicing leaves the MIDI range
+    """
+    quality = ChordQuality(quality)
+    if quality not in CHORD_INTERVALS:
+        raise ValueError(f"Invalid chord quality: {quality}")
+    return _voice(parse_pitch(root), quality, octave, inversion, VoicingStyle(style))
+
+
+def fit_octave(root: str, quality: Union[ChordQuality, str], octave: int = 4) -> int:
+    """
+    Get the highest octave, up to the given one, where a chord fits in the MIDI range.
+
+    A chord placed near the top of the range (e.g. B8 dominant seventh) is
+    dropped an octave at a time until its close, root-position voicing fits.
+
+    Args:
+        root: Root pitch name, e.g. 'C', 'F#', 'Bb'
+        quality: Chord quality
+        octave: Requested octave of the root
+
+    Returns:
+        The octave to voice the chord in
+
+    Raises:
+        ValueError: If the root or quality is invalid
+    """
+    quality = ChordQuality(quality)
+    if quality not in CHORD_INTERVALS:
+        raise ValueError(f"Invalid chord quality: {quality}")
+    top = (octave + 1) * 12 + NOTE_TO_SEMITONE[parse_pitch(root)] + max(CHORD_INTERVALS[quality])
+    return octave - max(0, -(-(top - MIDI_MAX) // 12))
+
+
+def clear_voicing_cache() -> None:
+    """Drop all cached voicings."""
+    _voice.cache_clear()
+
+
+voicing_cache_info = _voice.cache_info
+
+__all__ = ['Voicing', 'VOICING_CACHE_SIZE', 'get_voicing', 'fit_octave', 'clear_voicing_cache', 'voicing_cache_info']
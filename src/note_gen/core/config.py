@@ -16,6 +16,17 @@ class Settings(BaseSettings):
     mongodb_test_uri: Optional[str] = None
     database_name: Optional[str] = None
 
+    # Generation executor settings
+    generation_executor: str = "inline"  # inline, thread or process
+    generation_max_workers: Optional[int] = None  # Pool size; None = one per core
+    generation_max_queue: int = 64  # Generation jobs allowed in flight before rejecting
+    generation_cache_size: int = 512  # Cached generated sequences; 0 disables the cache
+    generation_cache_ttl: float = 300.0  # Seconds a cached sequence stays valid
+    generation_checkpoint_dir: str = "checkpoints"  # Where long-form generation checkpoints are kept
+
+    # Validation settings
+    validation_cache_size: int = 1024  # Cached validation results; 0 disables the cache
+
     # Test settings
     testing: Optional[str] = None
     clear_db_after_tests: Optional[str] = "0"
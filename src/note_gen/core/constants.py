@@ -1,5 +1,6 @@
 """Constants for note generation."""
-from typing import Dict, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
 from note_gen.core.enums import ScaleType, ChordQuality
 
 # Note-related constants
@@ -178,11 +179,30 @@ ROMAN_QUALITY_MAP = {
     }
 }
 
-# Define the missing constants
-CHORD_INTERVALS = {
+# Chord intervals in semitones above the root; the single source of truth for
+# ChordQuality.get_intervals, Chord.QUALITY_INTERVALS and chord voicings
+CHORD_INTERVALS: Mapping[ChordQuality, Tuple[int, ...]] = MappingProxyType({
     ChordQuality.MAJOR: (0, 4, 7),
-    # Add other chord qualities as needed
-}
+    ChordQuality.MINOR: (0, 3, 7),
+    ChordQuality.DIMINISHED: (0, 3, 6),
+    ChordQuality.AUGMENTED: (0, 4, 8),
+    ChordQuality.DOMINANT: (0, 4, 7, 10),  # Same as dominant seventh
+    ChordQuality.DOMINANT_SEVENTH: (0, 4, 7, 10),
+    ChordQuality.MAJOR_SEVENTH: (0, 4, 7, 11),
+    ChordQuality.MINOR_SEVENTH: (0, 3, 7, 10),
+    ChordQuality.DIMINISHED_SEVENTH: (0, 3, 6, 9),
+    ChordQuality.HALF_DIMINISHED_SEVENTH: (0, 3, 6, 10),
+    ChordQuality.SUSPENDED_SECOND: (0, 2, 7),
+    ChordQuality.SUSPENDED_FOURTH: (0, 5, 7),
+    ChordQuality.MAJOR_NINTH: (0, 4, 7, 11, 14),
+    ChordQuality.MINOR_NINTH: (0, 3, 7, 10, 14),
+    ChordQuality.MAJOR_ELEVENTH: (0, 4, 7, 11, 14, 17),
+    ChordQuality.MINOR_ELEVENTH: (0, 3, 7, 10, 14, 17),
+    ChordQuality.DOMINANT_ELEVENTH: (0, 4, 7, 10, 14, 17)
+})
+
+# Compound intervals allowed above the octave: b9, 9, #9, 11, #11, b13, 13
+CHORD_EXTENSION_INTERVALS = frozenset({13, 14, 15, 17, 18, 20, 21})
 
 RHYTHM_PATTERNS: Dict[str, Any] = {
     "quarter_notes": {
@@ -295,7 +315,8 @@ def validate_constants() -> None:
     for quality, intervals in CHORD_INTERVALS.items():
         assert isinstance(intervals, tuple), f"Chord intervals for {quality} must be a tuple"
         assert all(isinstance(i, int) for i in intervals), "Chord intervals must be integers"
-        assert all(0 <= i <= 11 for i in intervals), "Chord intervals must be between 0 and 11"
+        assert all(0 <= i <= 11 or i in CHORD_EXTENSION_INTERVALS for i in intervals), \
+            "Chord intervals must be between 0 and 11, or a ninth, eleventh or thirteenth extension"
 
     # Validate scale intervals
     for scale_type, intervals in SCALE_INTERVALS.items():  # type: ignore
@@ -425,6 +446,34 @@ COMMON_PROGRESSIONS: Dict[str, Dict[str, Any]] = {
     }
 }
 
+# Characteristic (scale degree, quality) patterns per genre
+GENRE_PATTERNS: Mapping[str, Tuple[Tuple[int, ChordQuality], ...]] = MappingProxyType({
+    "pop": (
+        (1, ChordQuality.MAJOR),
+        (4, ChordQuality.MAJOR),
+        (5, ChordQuality.MAJOR),
+        (1, ChordQuality.MAJOR)
+    ),
+    "jazz": (
+        (2, ChordQuality.MINOR),
+        (5, ChordQuality.DOMINANT_SEVENTH),
+        (1, ChordQuality.MAJOR_SEVENTH),
+        (4, ChordQuality.MAJOR_SEVENTH)
+    ),
+    "blues": (
+        (1, ChordQuality.DOMINANT_SEVENTH),
+        (4, ChordQuality.DOMINANT_SEVENTH),
+        (5, ChordQuality.DOMINANT_SEVENTH),
+        (1, ChordQuality.DOMINANT_SEVENTH)
+    ),
+    "classical": (
+        (1, ChordQuality.MAJOR),
+        (5, ChordQuality.MAJOR),
+        (4, ChordQuality.MAJOR),
+        (1, ChordQuality.MAJOR)
+    )
+})
+
 # Pattern presets
 PATTERN_PRESETS = {
     "basic": {
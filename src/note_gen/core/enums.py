@@ -68,53 +68,58 @@ class ChordQuality(str, Enum):
 
     @classmethod
     def from_string(cls, s: str) -> 'ChordQuality':
-        """Convert string to ChordQuality."""
-        mapping = {
-            '': cls.MAJOR,
-            'maj': cls.MAJOR,
-            'm': cls.MINOR,
-            'dim': cls.DIMINISHED,
-            'aug': cls.AUGMENTED,
-            '7': cls.DOMINANT_SEVENTH,
-            'maj7': cls.MAJOR_SEVENTH,
-            'm7': cls.MINOR_SEVENTH
-        }
-        if s not in mapping:
+        """Convert a chord-symbol suffix (e.g. 'm7', 'sus4') to ChordQuality."""
+        from .chord_symbols import SUFFIX_TABLE
+        if s not in SUFFIX_TABLE:
             raise ValueError(f"Unknown chord quality: {s}")
-        return mapping[s]
+        return SUFFIX_TABLE[s]
 
     @classmethod
     def get_intervals(cls, quality: 'ChordQuality') -> List[int]:
         """Get the intervals for a given chord quality."""
-        QUALITY_INTERVALS: Dict[ChordQuality, List[int]] = {
-            cls.MAJOR: [0, 4, 7],
-            cls.MINOR: [0, 3, 7],
-            cls.DIMINISHED: [0, 3, 6],
-            cls.AUGMENTED: [0, 4, 8],
-            cls.DOMINANT_SEVENTH: [0, 4, 7, 10],
-            cls.MAJOR_SEVENTH: [0, 4, 7, 11],
-            cls.MINOR_SEVENTH: [0, 3, 7, 10],
-            cls.DIMINISHED_SEVENTH: [0, 3, 6, 9],
-            cls.HALF_DIMINISHED_SEVENTH: [0, 3, 6, 10],
-            cls.SUSPENDED_SECOND: [0, 2, 7],
-            cls.SUSPENDED_FOURTH: [0, 5, 7],
-            cls.MAJOR_ELEVENTH: [0, 4, 7, 11, 14, 17],
-            cls.MINOR_ELEVENTH: [0, 3, 7, 10, 14, 17],
-            cls.DOMINANT_ELEVENTH: [0, 4, 7, 10, 14, 17],
-            cls.DOMINANT: [0, 4, 7, 10],  # Same as dominant seventh
-            cls.MAJOR_NINTH: [0, 4, 7, 11, 14],
-            cls.MINOR_NINTH: [0, 3, 7, 10, 14]
-        }
-
-        if quality not in QUALITY_INTERVALS:
-            raise ValueError(f"Invalid chord quality: {quality}")
-
-        return QUALITY_INTERVALS[quality]
+        from .constants import CHORD_INTERVALS
+        try:
+            return list(CHORD_INTERVALS[quality])
+        except KeyError:
+            raise ValueError(f"Invalid chord quality: {quality}") from None
 
     def __str__(self) -> str:
         return self.name.replace('ChordQuality.', '')
 
 
+class VoicingStyle(str, Enum):
+    """How the notes of a chord are spread across octaves."""
+    CLOSE = "close"  # All notes within one octave, stacked from the bass
+    DROP2 = "drop2"  # Second-highest note of the close voicing dropped an octave
+    OPEN = "open"    # Second-lowest note of the close voicing raised an octave
+
+
+class VoicingMode(str, Enum):
+    """How a progression's chords are voiced relative to each other."""
+    ROOT_POSITION = "root_position"  # Every chord in close root position at octave 4
+    VOICE_LED = "voice_led"          # Inversions and octaves chosen for minimum voice movement
+
+
+class RangePolicy(str, Enum):
+    """What happens to a transposed note that leaves the MIDI range."""
+    ERROR = "error"  # Reject the transposition
+    FOLD = "fold"    # Move the note by octaves back into range
+    CLAMP = "clamp"  # Pin the note to the nearest end of the range
+
+
+class GenerationEngine(str, Enum):
+    """How a NoteSequenceGenerator runs its generation stages."""
+    STANDARD = "standard"      # Note by note, on Note models
+    VECTORIZED = "vectorized"  # Whole-sequence array operations (needs numpy)
+
+
+class ExecutorKind(str, Enum):
+    """Where CPU-bound generation runs."""
+    INLINE = "inline"    # On the event loop
+    THREAD = "thread"    # In a thread pool
+    PROCESS = "process"  # In a process pool, across cores
+
+
 class TimeSignatureType(str, Enum):
     """Types of time signatures."""
     SIMPLE = "simple"
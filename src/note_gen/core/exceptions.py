@@ -14,4 +14,9 @@ class DatabaseError(HTTPException):
 class ValidationError(HTTPException):
     """Raised when validation fails."""
     def __init__(self, detail: str = "Validation failed"):
-        super().__init__(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
\ No newline at end of file
+        super().__init__(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
+
+class GenerationBusyError(HTTPException):
+    """Raised when the generation executor's queue is full."""
+    def __init__(self, detail: str = "Generation queue is full, try again later"):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
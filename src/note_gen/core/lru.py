@@ -0,0 +1,108 @@
+"""
+Bounded LRU store with hit, miss and eviction counters.
+
+The generation and validation caches are both LRU maps of a size set in the
+application settings, reporting the same counters for monitoring. They keep
+their entries in an :class:`LRUCache` and add their own rules on top: what a
+key is, what is copied in and out, and (for generations) expiry and
+invalidation.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+@dataclass
+class CacheStats:
+    """Counters for a cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """Entries evicted least recently used first once a size limit is passed."""
+
+    def __init__(self, max_entries: int, on_evict: Optional[Callable[[K, V], None]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is
+                evicted (0 disables caching)
+            on_evict: Called with each evicted key and value
+
+        Raises:
+            ValueError: If the limit is negative
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries cannot be negative")
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._on_evict = on_evict
+        self._entries: 'OrderedDict[K, V]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def peek(self, key: K) -> Optional[V]:
+        """Get the value under a key without counting a lookup or refreshing it."""
+        return self._entries.get(key)
+
+    def get(self, key: K) -> Optional[V]:
+        """Get the value under a key, counting a hit or miss and marking it recently used."""
+        value = self._entries.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value as the most recently used, evicting past the size limit."""
+        if self.max_entries == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(evicted_key, evicted)
+
+    def pop(self, key: K) -> V:
+        """Remove and return the value under a key, without counting an eviction."""
+        return self._entries.pop(key)
+
+    def clear(self) -> None:
+        """Drop every entry (the stats are kept)."""
+        self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Size, limit and counters, for monitoring."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate": self.stats.hit_rate,
+            "evictions": self.stats.evictions
+        }
+
+
+__all__ = ['CacheStats', 'LRUCache']
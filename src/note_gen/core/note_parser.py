@@ -0,0 +1,99 @@
+"""Table-driven parsing of note and pitch names.
+
+Every legal spelling, with and without a single-digit octave, is precomputed
+into one lookup table at import time, so parsing a name is a strip plus a
+dictionary lookup instead of a regex match.
+"""
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from note_gen.core.constants import NOTE_TO_SEMITONE
+
+# Octaves accepted in note names such as 'C4' (single digit, as in FULL_NOTE_REGEX)
+NAME_OCTAVES = range(0, 10)
+
+ParsedNote = Tuple[str, Optional[int]]
+
+
+def _spelling_variants(pitch: str) -> List[str]:
+    """Get the accepted case variants of a canonical pitch spelling."""
+    return [pitch, pitch[0].lower() + pitch[1:]]
+
+
+def _build_note_table() -> Dict[str, ParsedNote]:
+    """Map every accepted spelling (optionally with octave) to (pitch, octave)."""
+    table: Dict[str, ParsedNote] = {}
+    for pitch in NOTE_TO_SEMITONE:
+        for variant in _spelling_variants(pitch):
+            table[variant] = (pitch, None)
+            for octave in NAME_OCTAVES:
+                table[f"{variant}{octave}"] = (pitch, octave)
+    return table
+
+
+NOTE_NAME_TABLE: Mapping[str, ParsedNote] = MappingProxyType(_build_note_table())
+
+# Canonical spellings, e.g. 'C#', 'Bb'
+PITCH_NAMES: FrozenSet[str] = frozenset(NOTE_TO_SEMITONE)
+
+# Canonical spellings with octave, e.g. 'C#4', 'Bb3'
+FULL_NOTE_NAMES: FrozenSet[str] = frozenset(
+    f"{pitch}{octave}" for pitch in NOTE_TO_SEMITONE for octave in NAME_OCTAVES
+)
+
+
+def parse_note_name(name: str) -> ParsedNote:
+    """
+    Parse a note name into its canonical pitch and optional octave.
+
+    Args:
+        name: Note name such as 'C#4', 'Bb', 'e' or ' F# '
+
+    Returns:
+        Tuple of (canonical pitch, octave or None)
+
+    Raises:
+        ValueError: If the name is not a legal note name
+    """
+    parsed = NOTE_NAME_TABLE.get(name.strip())
+    if parsed is None:
+        raise ValueError(f"Invalid note name: {name.strip()}")
+    return parsed
+
+
+def parse_pitch(name: str) -> str:
+    """
+    Parse a pitch name without octave into its canonical spelling.
+
+    Raises:
+        ValueError: If the name is not a legal pitch name
+    """
+    parsed = NOTE_NAME_TABLE.get(name.strip())
+    if parsed is None or parsed[1] is not None:
+        raise ValueError(f"Invalid pitch format: {name.strip()}")
+    return parsed[0]
+
+
+def parse_many(names: Iterable[str], strict: bool = True) -> List[Optional[ParsedNote]]:
+    """
+    Parse many note names in one pass.
+
+    Args:
+        names: Note names to parse
+        strict: If True, raise on the first illegal name; otherwise yield
+            None in its place
+
+    Returns:
+        List of (canonical pitch, octave or None) tuples, in input order
+
+    Raises:
+        ValueError: If strict and a name is not a legal note name
+    """
+    table = NOTE_NAME_TABLE
+    result: List[Optional[ParsedNote]] = []
+    for name in names:
+        parsed = table.get(name.strip())
+        if parsed is None and strict:
+            raise ValueError(f"Invalid note name: {name.strip()}")
+        result.append(parsed)
+    return result
@@ -0,0 +1,80 @@
+"""Interned, immutable pitch values.
+
+A :class:`Pitch` carries only spelling, octave and MIDI number; timing
+attributes (duration, velocity, position) belong to the note event. Because
+pitches are immutable they are pooled: every (spelling, octave) pair and every
+MIDI number maps to exactly one shared instance, built once at import time.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+from note_gen.core.constants import MIDI_MIN, MIDI_MAX, NOTE_TO_SEMITONE, SEMITONE_TO_NOTE
+
+# Octave range accepted by the Note model
+MIN_OCTAVE = -1
+MAX_OCTAVE = 9
+
+
+@dataclass(frozen=True, slots=True)
+class Pitch:
+    """An immutable pitch (spelling + octave).
+
+    Do not instantiate directly; use :meth:`Pitch.of` or :meth:`Pitch.from_midi`
+    so that identical pitches share one pooled object.
+    """
+    name: str
+    octave: int
+    midi: int
+
+    @property
+    def pitch_class(self) -> int:
+        """Get the pitch class (0-11, C = 0)."""
+        return self.midi % 12
+
+    @property
+    def note_name(self) -> str:
+        """Get the full note name including octave (e.g. 'C#4')."""
+        return f"{self.name}{self.octave}"
+
+    @classmethod
+    def of(cls, name: str, octave: int) -> 'Pitch':
+        """Get the pooled pitch for a spelling and octave."""
+        try:
+            return _PITCH_POOL[(name, octave)]
+        except KeyError:
+            raise ValueError(f"Invalid pitch: {name}{octave}") from None
+
+    @classmethod
+    def from_midi(cls, midi_number: int) -> 'Pitch':
+        """Get the pooled pitch for a MIDI number (spelled with sharps)."""
+        if not MIDI_MIN <= midi_number <= MIDI_MAX:
+            raise ValueError(f"MIDI number must be between {MIDI_MIN} and {MIDI_MAX}, got {midi_number}")
+        return _MIDI_POOL[midi_number]
+
+    def transpose(self, semitones: int) -> 'Pitch':
+        """Get the pooled pitch the given number of semitones away."""
+        return Pitch.from_midi(self.midi + semitones)
+
+    def __str__(self) -> str:
+        return self.note_name
+
+
+def _build_pitch_pool() -> Dict[Tuple[str, int], Pitch]:
+    """Build one Pitch per (spelling, octave) pair."""
+    pool: Dict[Tuple[str, int], Pitch] = {}
+    for octave in range(MIN_OCTAVE, MAX_OCTAVE + 1):
+        for name, semitone in NOTE_TO_SEMITONE.items():
+            pool[(name, octave)] = Pitch(name=name, octave=octave, midi=(octave + 1) * 12 + semitone)
+    return pool
+
+
+_PITCH_POOL: Mapping[Tuple[str, int], Pitch] = MappingProxyType(_build_pitch_pool())
+
+# MIDI number -> pooled pitch, spelled with sharps to match Note.from_midi_number
+_MIDI_POOL: Tuple[Pitch, ...] = tuple(
+    _PITCH_POOL[(SEMITONE_TO_NOTE[midi % 12], midi // 12 - 1)]
+    for midi in range(MIDI_MIN, MIDI_MAX + 1)
+)
+
+__all__ = ['Pitch', 'MIN_OCTAVE', 'MAX_OCTAVE']
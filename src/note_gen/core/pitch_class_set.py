@@ -0,0 +1,112 @@
+"""Pitch-class sets backed by a 12-bit integer.
+
+Bit ``n`` of :attr:`PitchClassSet.mask` is set when pitch class ``n`` (C = 0)
+is in the set, so membership, union, intersection and subset tests are single
+integer operations and transposition is a bit rotation.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Union
+
+from note_gen.core.constants import NOTE_TO_SEMITONE
+
+# All twelve pitch classes
+FULL_MASK = 0xFFF
+
+PitchClassLike = Union[int, str]
+
+
+def _pitch_class(value: PitchClassLike) -> int:
+    """Get the pitch class of a pitch-class number or pitch name."""
+    if isinstance(value, str):
+        try:
+            return NOTE_TO_SEMITONE[value]
+        except KeyError:
+            raise ValueError(f"Invalid pitch name: {value}") from None
+    return value % 12
+
+
+@dataclass(frozen=True, slots=True)
+class PitchClassSet:
+    """An immutable set of pitch classes (0-11, C = 0)."""
+    mask: int = 0
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.mask <= FULL_MASK:
+            raise ValueError(f"Pitch-class mask must be between 0 and {FULL_MASK}, got {self.mask}")
+
+    @classmethod
+    def of(cls, values: Iterable[PitchClassLike]) -> 'PitchClassSet':
+        """
+        Build a set from pitch classes, MIDI numbers or pitch names.
+
+        Raises:
+            ValueError: If a pitch name is invalid
+        """
+        mask = 0
+        for value in values:
+            mask |= 1 << _pitch_class(value)
+        return cls(mask)
+
+    @classmethod
+    def from_intervals(cls, root: PitchClassLike, intervals: Iterable[int]) -> 'PitchClassSet':
+        """Build the set of a root plus intervals, e.g. a scale or chord."""
+        return cls.of(intervals).transpose(_pitch_class(root))
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a pitch class, MIDI number or pitch name is in the set."""
+        if isinstance(value, str):
+            pitch_class = NOTE_TO_SEMITONE.get(value)
+            return pitch_class is not None and bool(self.mask >> pitch_class & 1)
+        if isinstance(value, int):
+            return bool(self.mask >> (value % 12) & 1)
+        return False
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over pitch classes in ascending order."""
+        return (pc for pc in range(12) if self.mask >> pc & 1)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __or__(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        return PitchClassSet(self.mask | other.mask)
+
+    def __and__(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        return PitchClassSet(self.mask & other.mask)
+
+    def __sub__(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        return PitchClassSet(self.mask & ~other.mask)
+
+    def __le__(self, other: 'PitchClassSet') -> bool:
+        return self.issubset(other)
+
+    def __ge__(self, other: 'PitchClassSet') -> bool:
+        return other.issubset(self)
+
+    def union(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        """Get the pitch classes in either set."""
+        return self | other
+
+    def intersection(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        """Get the pitch classes in both sets."""
+        return self & other
+
+    def issubset(self, other: 'PitchClassSet') -> bool:
+        """Check whether every pitch class in this set is in the other."""
+        return self.mask & ~other.mask == 0
+
+    def complement(self) -> 'PitchClassSet':
+        """Get the pitch classes not in this set."""
+        return PitchClassSet(FULL_MASK & ~self.mask)
+
+    def transpose(self, semitones: int) -> 'PitchClassSet':
+        """Transpose every pitch class by rotating the mask."""
+        shift = semitones % 12
+        mask = (self.mask << shift | self.mask >> (12 - shift)) & FULL_MASK
+        return PitchClassSet(mask)
+
+    def __repr__(self) -> str:
+        return f"PitchClassSet({list(self)})"
+
+
+__all__ = ['PitchClassSet', 'FULL_MASK']
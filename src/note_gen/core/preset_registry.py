@@ -0,0 +1,266 @@
+"""
+Registry of compiled generation presets.
+
+The preset tables in :mod:`note_gen.core.constants` are interpreted and
+validated once, at application startup (or on first use), into frozen,
+key-independent objects:
+
+- note patterns are semitone offsets from each chord's root: the intervals
+  of ``NOTE_PATTERNS`` (in the order listed, which already encodes their
+  direction), or the notes of ``PATTERN_PRESETS`` measured from C4;
+- rhythm patterns are per-step position, duration and velocity columns:
+  the notes of ``RHYTHM_PATTERNS``, or the durations of ``PATTERN_PRESETS``
+  laid end to end, checked with :class:`PatternValidator`;
+- progressions are chord-root offsets from the tonic (``PROGRESSION_PRESETS``
+  are written in C).
+
+A request then only realizes the presets in its key, and realizations are
+cached per (presets, key, scale type), so a repeated request is a cache
+lookup plus building the NoteSequence.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Union
+
+from note_gen.core.constants import (
+    NOTE_PATTERNS, NOTE_TO_SEMITONE, PATTERN_PRESETS, PROGRESSION_PRESETS, RHYTHM_PATTERNS
+)
+from note_gen.core.enums import ScaleType
+from note_gen.core.note_parser import parse_note_name
+from note_gen.core.pitch import Pitch
+from note_gen.core.spelling import get_spelling
+from note_gen.models.rhythm import RhythmNote, RhythmPattern
+from note_gen.validation.pattern_validation import PatternValidator
+
+# (pitch, octave, duration, velocity, position, MIDI number) of one realized note
+NoteRow = Tuple[str, int, float, int, float, int]
+
+# Octave the tonic is realized in
+PRESET_OCTAVE = 4
+
+# PATTERN_PRESETS notes are written relative to this pitch
+_PRESET_REFERENCE = Pitch.of('C', PRESET_OCTAVE)
+
+
+@dataclass(frozen=True, slots=True)
+class PresetNotePattern:
+    """A compiled note pattern preset.
+
+    Attributes:
+        name: Preset name
+        intervals: Semitone offsets from the chord root, in playing order
+        description: Preset description
+    """
+    name: str
+    intervals: Tuple[int, ...]
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class PresetRhythm:
+    """A compiled, validated rhythm pattern preset.
+
+    Attributes:
+        name: Preset name
+        positions: Position of each step within the pattern
+        durations: Duration of each step
+        velocities: Velocity of each step
+        total_duration: Length of one pass of the pattern
+        time_signature: Time signature of the pattern
+        description: Preset description
+    """
+    name: str
+    positions: Tuple[float, ...]
+    durations: Tuple[float, ...]
+    velocities: Tuple[int, ...]
+    total_duration: float
+    time_signature: Tuple[int, int]
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class PresetProgression:
+    """A compiled chord progression preset.
+
+    Attributes:
+        name: Preset name
+        roots: Semitone offset of each chord's root from the tonic
+        description: Preset description
+    """
+    name: str
+    roots: Tuple[int, ...]
+    description: str = ""
+
+
+def _compile_rhythm(name: str, rhythm_pattern: RhythmPattern, description: str) -> PresetRhythm:
+    """Validate a rhythm pattern and freeze it into columns."""
+    result = PatternValidator.validate(rhythm_pattern)
+    if not result.is_valid:
+        raise ValueError(f"Invalid rhythm preset {name}: {result.violations}")
+    return PresetRhythm(
+        name=name,
+        positions=tuple(note.position for note in rhythm_pattern.pattern),
+        durations=tuple(note.duration for note in rhythm_pattern.pattern),
+        velocities=tuple(note.velocity for note in rhythm_pattern.pattern),
+        total_duration=rhythm_pattern.total_duration,
+        time_signature=rhythm_pattern.time_signature,
+        description=description
+    )
+
+
+def _rhythm_from_notes(name: str, preset: Mapping[str, Any]) -> PresetRhythm:
+    """Compile a RHYTHM_PATTERNS entry."""
+    total_duration = float(preset['total_duration'])
+    rhythm_pattern = RhythmPattern(
+        name=name,
+        pattern=[RhythmNote(**note) for note in preset['notes']],
+        time_signature=tuple(preset.get('time_signature', (int(total_duration), 4))),
+        total_duration=total_duration
+    )
+    return _compile_rhythm(name, rhythm_pattern, preset.get('description', ''))
+
+
+def _rhythm_from_durations(name: str, preset: Mapping[str, Any]) -> PresetRhythm:
+    """Compile the durations of a PATTERN_PRESETS entry, laid end to end."""
+    notes = []
+    position = 0.0
+    for duration in preset['durations']:
+        notes.append(RhythmNote(position=position, duration=duration))
+        position += duration
+    rhythm_pattern = RhythmPattern(name=name, pattern=notes, total_duration=position)
+    return _compile_rhythm(name, rhythm_pattern, preset.get('description', ''))
+
+
+def _note_pattern_from_notes(name: str, preset: Mapping[str, Any]) -> PresetNotePattern:
+    """Compile the notes of a PATTERN_PRESETS entry as offsets from C4."""
+    intervals = []
+    for note_name in preset['notes']:
+        pitch_name, octave = parse_note_name(note_name)
+        intervals.append(Pitch.of(pitch_name, octave).midi - _PRESET_REFERENCE.midi)
+    return PresetNotePattern(name=name, intervals=tuple(intervals), description=preset.get('description', ''))
+
+
+def _note_pattern_from_intervals(name: str, preset: Mapping[str, Any]) -> PresetNotePattern:
+    """Compile a NOTE_PATTERNS entry."""
+    if not preset['intervals']:
+        raise ValueError(f"Invalid note pattern preset {name}: no intervals")
+    return PresetNotePattern(
+        name=name, intervals=tuple(preset['intervals']), description=preset.get('description', '')
+    )
+
+
+def _progression(name: str, preset: Mapping[str, Any]) -> PresetProgression:
+    """Compile a PROGRESSION_PRESETS entry (written in C)."""
+    from note_gen.models.chord import Chord
+
+    roots = tuple(NOTE_TO_SEMITONE[Chord.from_symbol(symbol).root] for symbol in preset['chords'])
+    return PresetProgression(name=name, roots=roots, description=preset.get('description', ''))
+
+
+@dataclass(frozen=True)
+class PresetRegistry:
+    """Compiled presets, by name.
+
+    Attributes:
+        note_patterns: Note pattern presets
+        rhythm_patterns: Rhythm pattern presets
+        progressions: Chord progression presets
+    """
+    note_patterns: Mapping[str, PresetNotePattern]
+    rhythm_patterns: Mapping[str, PresetRhythm]
+    progressions: Mapping[str, PresetProgression]
+
+    @classmethod
+    def compile(cls) -> 'PresetRegistry':
+        """
+        Compile and validate every preset table.
+
+        Raises:
+            ValueError: If a preset is invalid
+        """
+        note_patterns: Dict[str, PresetNotePattern] = {}
+        rhythm_patterns: Dict[str, PresetRhythm] = {}
+        for name, preset in PATTERN_PRESETS.items():
+            note_patterns[name] = _note_pattern_from_notes(name, preset)
+            rhythm_patterns[name] = _rhythm_from_durations(name, preset)
+        for name, preset in NOTE_PATTERNS.items():
+            note_patterns[name] = _note_pattern_from_intervals(name, preset)
+        for name, preset in RHYTHM_PATTERNS.items():
+            rhythm_patterns[name] = _rhythm_from_notes(name, preset)
+        progressions = {name: _progression(name, preset) for name, preset in PROGRESSION_PRESETS.items()}
+        return cls(
+            note_patterns=MappingProxyType(note_patterns),
+            rhythm_patterns=MappingProxyType(rhythm_patterns),
+            progressions=MappingProxyType(progressions)
+        )
+
+    def realize(
+        self,
+        note_pattern_name: str,
+        rhythm_pattern_name: str,
+        progression_name: str,
+        key: str,
+        scale_type: Union[ScaleType, str] = ScaleType.MAJOR
+    ) -> Tuple[Tuple[NoteRow, ...], float]:
+        """
+        Realize presets in a key (cached).
+
+        For each chord the rhythm pattern is played once, its steps taking
+        the note pattern's intervals in turn above the chord's root. Notes
+        are spelled as in the key.
+
+        Returns:
+            (note rows, total duration)
+
+        Raises:
+            ValueError: If a preset name or the key is unknown
+        """
+        if note_pattern_name not in self.note_patterns:
+            raise ValueError(f"Invalid note pattern name: {note_pattern_name}")
+        if rhythm_pattern_name not in self.rhythm_patterns:
+            raise ValueError(f"Invalid rhythm pattern name: {rhythm_pattern_name}")
+        if progression_name not in self.progressions:
+            raise ValueError(f"Invalid progression name: {progression_name}")
+        return _realize(
+            self.note_patterns[note_pattern_name],
+            self.rhythm_patterns[rhythm_pattern_name],
+            self.progressions[progression_name],
+            key,
+            ScaleType(scale_type)
+        )
+
+
+@lru_cache(maxsize=1024)
+def _realize(
+    note_pattern: PresetNotePattern,
+    rhythm: PresetRhythm,
+    progression: PresetProgression,
+    key: str,
+    scale_type: ScaleType
+) -> Tuple[Tuple[NoteRow, ...], float]:
+    names = get_spelling(key, scale_type)
+    tonic = Pitch.of(key, PRESET_OCTAVE).midi
+    intervals = note_pattern.intervals
+    rows = []
+    chord_start = 0.0
+    for root in progression.roots:
+        for step, (position, duration, velocity) in enumerate(
+            zip(rhythm.positions, rhythm.durations, rhythm.velocities)
+        ):
+            midi = Pitch.from_midi(tonic + root + intervals[step % len(intervals)]).midi
+            rows.append((names[midi % 12], midi // 12 - 1, duration, velocity, chord_start + position, midi))
+        chord_start += rhythm.total_duration
+    return tuple(rows), chord_start
+
+
+@lru_cache(maxsize=1)
+def get_preset_registry() -> PresetRegistry:
+    """Get the compiled presets (compiled on first call)."""
+    return PresetRegistry.compile()
+
+
+__all__ = [
+    'PresetRegistry', 'PresetNotePattern', 'PresetRhythm', 'PresetProgression',
+    'PRESET_OCTAVE', 'get_preset_registry'
+]
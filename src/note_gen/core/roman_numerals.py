@@ -0,0 +1,246 @@
+"""Compiled Roman-numeral engine.
+
+Numerals follow ``[b|#]<numeral>[quality][figure][/<numeral>...]``, e.g.
+'I', 'ii', 'bVII', 'vii°7', 'V65', 'ivø', 'IVmaj7', 'V7/V'. Case gives the
+default quality (upper = major, lower = minor); the quality markers and
+figured-bass figures refine it:
+
+* quality: 'maj'/'M', 'dim'/'°'/'o', 'ø', 'aug'/'+', 'sus2', 'sus4'/'sus'
+* figures: '7', '9', '11' (root position), '6'/'64' (triad inversions),
+  '65'/'43'/'42'/'2' (seventh-chord inversions)
+
+A plain lowercase numeral on a degree whose diatonic triad is diminished
+(vii in major, ii in minor) resolves to a diminished triad, or to a
+half-diminished seventh with a seventh figure. A secondary numeral (V/V) is
+resolved in the key of its target, major or minor by the target's quality.
+
+Parsing and resolution are both memoized; resolution is keyed by
+(numeral, key, scale_type), so expanding a progression in every key is a
+series of cache hits.
+"""
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from note_gen.core.constants import NOTE_TO_SEMITONE
+from note_gen.core.enums import ChordQuality, ScaleType
+from note_gen.core.scale_catalog import get_scale_table
+from note_gen.core.spelling import FLAT_NAMES, SHARP_NAMES, get_spelling
+
+NUMERAL_DEGREES = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5, 'VI': 6, 'VII': 7}
+
+ACCIDENTAL_OFFSETS = {'': 0, 'b': -1, '#': 1}
+
+_NUMERAL_REGEX = re.compile(
+    r'^(?P<accidental>[b#]?)'
+    r'(?P<numeral>VII|VI|V|IV|III|II|I|vii|vi|v|iv|iii|ii|i)'
+    r'(?P<quality>maj|M|dim|°|o|ø|aug|\+|sus2|sus4|sus)?'
+    r'(?P<figure>65|64|43|42|11|9|7|6|2)?$'
+)
+
+# Figure -> (inversion, chord size: 3 triad, 4 seventh, 5 ninth, 6 eleventh)
+_FIGURES = {
+    '': (0, 3), '6': (1, 3), '64': (2, 3),
+    '7': (0, 4), '65': (1, 4), '43': (2, 4), '42': (3, 4), '2': (3, 4),
+    '9': (0, 5), '11': (0, 6)
+}
+
+# (quality marker, upper case, chord size) -> quality; None marker = no marker
+_QUALITIES = {
+    (None, True, 3): ChordQuality.MAJOR,
+    (None, True, 4): ChordQuality.DOMINANT_SEVENTH,
+    (None, True, 6): ChordQuality.DOMINANT_ELEVENTH,
+    (None, False, 3): ChordQuality.MINOR,
+    (None, False, 4): ChordQuality.MINOR_SEVENTH,
+    (None, False, 5): ChordQuality.MINOR_NINTH,
+    (None, False, 6): ChordQuality.MINOR_ELEVENTH,
+    ('maj', True, 3): ChordQuality.MAJOR,
+    ('maj', True, 4): ChordQuality.MAJOR_SEVENTH,
+    ('maj', True, 5): ChordQuality.MAJOR_NINTH,
+    ('maj', True, 6): ChordQuality.MAJOR_ELEVENTH,
+    ('dim', False, 3): ChordQuality.DIMINISHED,
+    ('dim', False, 4): ChordQuality.DIMINISHED_SEVENTH,
+    ('ø', False, 3): ChordQuality.HALF_DIMINISHED_SEVENTH,
+    ('ø', False, 4): ChordQuality.HALF_DIMINISHED_SEVENTH,
+    ('aug', True, 3): ChordQuality.AUGMENTED,
+    ('sus2', True, 3): ChordQuality.SUSPENDED_SECOND,
+    ('sus4', True, 3): ChordQuality.SUSPENDED_FOURTH,
+}
+
+_MARKER_ALIASES = {
+    'M': 'maj', '°': 'dim', 'o': 'dim', '+': 'aug', 'sus': 'sus4'
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedNumeral:
+    """A compiled Roman numeral.
+
+    Attributes:
+        numeral: The numeral as written, e.g. 'vii'
+        degree: Scale degree (1-7)
+        accidental: Semitone offset of the root (-1, 0 or 1)
+        quality: Chord quality
+        inversion: Inversion given by the figure (0 = root position)
+        implied: Whether the quality comes from the numeral's case alone, and
+            so may become diminished on a diminished scale degree
+        secondary: Numeral whose key this one is resolved in (V/V), if any
+    """
+    numeral: str
+    degree: int
+    accidental: int
+    quality: ChordQuality
+    inversion: int = 0
+    implied: bool = False
+    secondary: Optional['ParsedNumeral'] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedChord:
+    """A Roman numeral resolved in a key."""
+    root: str
+    quality: ChordQuality
+    inversion: int = 0
+
+
+def _parse_single(text: str) -> ParsedNumeral:
+    """Parse one numeral without secondary targets."""
+    match = _NUMERAL_REGEX.match(text)
+    if not match:
+        raise ValueError(f"Invalid Roman numeral format: {text}")
+    numeral = match['numeral']
+    upper = numeral.isupper()
+    marker = match['quality']
+    marker = _MARKER_ALIASES.get(marker, marker) if marker else None
+    inversion, size = _FIGURES[match['figure'] or '']
+    # Case does not matter once an explicit diminished/augmented/sus marker is given
+    case = upper if marker in (None, 'maj') else marker in ('aug', 'sus2', 'sus4')
+    quality = _QUALITIES.get((marker, case, size))
+    if quality is None:
+        raise ValueError(f"Invalid Roman numeral format: {text}")
+    return ParsedNumeral(
+        numeral=numeral,
+        degree=NUMERAL_DEGREES[numeral.upper()],
+        accidental=ACCIDENTAL_OFFSETS[match['accidental']],
+        quality=quality,
+        inversion=inversion,
+        implied=marker is None and size in (3, 4) and not upper
+    )
+
+
+@lru_cache(maxsize=1024)
+def parse_numeral(numeral: str) -> ParsedNumeral:
+    """
+    Parse a Roman numeral, including secondary functions such as 'V7/V'.
+
+    Raises:
+        ValueError: If the numeral is invalid
+    """
+    parts = numeral.strip().split('/')
+    parsed: Optional[ParsedNumeral] = None
+    # Build from the innermost target outwards: 'V/V/V' = V of (V of V)
+    for part in reversed(parts):
+        single = _parse_single(part)
+        parsed = single if parsed is None else replace(single, secondary=parsed)
+    assert parsed is not None
+    return parsed
+
+
+def _is_diminished_degree(intervals: Tuple[int, ...], degree: int) -> bool:
+    """Check whether the diatonic triad on a degree of a 7-note scale is diminished."""
+    if len(intervals) != 7:
+        return False
+    root = intervals[degree - 1]
+    third = (intervals[(degree + 1) % 7] - root) % 12
+    fifth = (intervals[(degree + 3) % 7] - root) % 12
+    return third == 3 and fifth == 6
+
+
+def _resolve_pitch_class(parsed: ParsedNumeral, tonic: int, scale_type: ScaleType) -> Tuple[int, ChordQuality]:
+    """Resolve a numeral to (root pitch class, quality) in a key."""
+    if parsed.secondary is not None:
+        target, target_quality = _resolve_pitch_class(parsed.secondary, tonic, scale_type)
+        tonic = target
+        scale_type = ScaleType.MINOR if target_quality in (
+            ChordQuality.MINOR, ChordQuality.MINOR_SEVENTH,
+            ChordQuality.MINOR_NINTH, ChordQuality.MINOR_ELEVENTH
+        ) else ScaleType.MAJOR
+    intervals = get_scale_table('C', scale_type).intervals
+    root = (tonic + intervals[parsed.degree - 1] + parsed.accidental) % 12
+    quality = parsed.quality
+    if parsed.implied and parsed.accidental == 0 and _is_diminished_degree(intervals, parsed.degree):
+        quality = (ChordQuality.DIMINISHED if quality == ChordQuality.MINOR
+                   else ChordQuality.HALF_DIMINISHED_SEVENTH)
+    return root, quality
+
+
+def _spell_root(parsed: ParsedNumeral, root: int, key: str, scale_type: ScaleType) -> str:
+    """Spell a resolved root: in the key, or from the numeral's own accidental."""
+    spelling = get_spelling(key, scale_type)
+    if parsed.accidental == 0:
+        return spelling[root]
+    if parsed.secondary is None:
+        # Keep the letter of the scale degree the accidental alters: bVII in C is Bb, not A#
+        letter = spelling[(root - parsed.accidental) % 12][0]
+        for name in (letter, letter + 'b', letter + '#'):
+            if NOTE_TO_SEMITONE.get(name) == root:
+                return name
+    return (FLAT_NAMES if parsed.accidental < 0 else SHARP_NAMES)[root]
+
+
+@lru_cache(maxsize=4096)
+def _resolve(parsed: ParsedNumeral, key: str, scale_type: ScaleType) -> ResolvedChord:
+    root, quality = _resolve_pitch_class(parsed, NOTE_TO_SEMITONE[key], scale_type)
+    return ResolvedChord(root=_spell_root(parsed, root, key, scale_type), quality=quality,
+                         inversion=parsed.inversion)
+
+
+def resolve_parsed(parsed: ParsedNumeral, key: str, scale_type: ScaleType) -> ResolvedChord:
+    """
+    Resolve a compiled numeral in a key (cached).
+
+    Raises:
+        ValueError: If the key is invalid
+    """
+    if key not in NOTE_TO_SEMITONE:
+        raise ValueError(f"Invalid key: {key}")
+    return _resolve(parsed, key, ScaleType(scale_type))
+
+
+def resolve_numeral(numeral: str, key: str, scale_type: ScaleType = ScaleType.MAJOR) -> ResolvedChord:
+    """
+    Resolve a Roman numeral in a key.
+
+    Args:
+        numeral: Roman numeral, e.g. 'V7/V'
+        key: Key root, e.g. 'C', 'Bb'
+        scale_type: Scale type of the key
+
+    Returns:
+        The chord root (spelled as in the key), quality and inversion
+
+    Raises:
+        ValueError: If the numeral or key is invalid
+    """
+    return resolve_parsed(parse_numeral(numeral), key, scale_type)
+
+
+def resolve_progression(
+    numerals: Iterable[str],
+    key: str,
+    scale_type: ScaleType = ScaleType.MAJOR
+) -> List[ResolvedChord]:
+    """
+    Resolve a whole progression of Roman numerals in a key.
+
+    Raises:
+        ValueError: If any numeral or the key is invalid
+    """
+    return [resolve_numeral(numeral, key, scale_type) for numeral in numerals]
+
+
+__all__ = [
+    'ParsedNumeral', 'ResolvedChord', 'NUMERAL_DEGREES', 'parse_numeral',
+    'resolve_parsed', 'resolve_numeral', 'resolve_progression'
+]
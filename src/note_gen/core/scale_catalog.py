@@ -0,0 +1,149 @@
+"""Precomputed scale tables.
+
+Every key spelling × ScaleType × octave is computed once at import time into
+an immutable :class:`ScaleTable`, so scale lookups inside generator loops are
+a dictionary lookup instead of rebuilding notes from ``SCALE_INTERVALS``.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
+
+from note_gen.core.constants import MIDI_MIN, MIDI_MAX, NOTE_TO_SEMITONE
+from note_gen.core.enums import ScaleType
+from note_gen.core.pitch import MIN_OCTAVE, MAX_OCTAVE, Pitch
+from note_gen.core.pitch_class_set import PitchClassSet
+from note_gen.core.spelling import ENHARMONIC_NAMES, get_spelling
+
+CatalogKey = Tuple[str, ScaleType, int]
+
+
+@dataclass(frozen=True, slots=True)
+class ScaleTable:
+    """Immutable lookup tables for one key, scale type and octave.
+
+    Attributes:
+        key: Root spelling, e.g. 'F#'
+        scale_type: The scale type
+        octave: Octave the tables were built for
+        intervals: Semitone offsets of each degree from the root
+        pitches: Degree -> pitch, all in ``octave`` and spelled as in the key
+            (the layout returned by ``ScaleInfo.get_scale_notes``)
+        ascending: Degree -> pitch ascending from the root, dropping pitches
+            outside the MIDI range (the layout built by ``Scale.generate_notes``)
+        pitch_degrees: Pitch name -> 1-based degree, under either enharmonic
+            spelling
+        spelling: Pitch class -> name in this key (see :mod:`note_gen.core.spelling`)
+        pitch_classes: Pitch classes in the scale, as a bitmask set
+    """
+    key: str
+    scale_type: ScaleType
+    octave: int
+    intervals: Tuple[int, ...]
+    pitches: Tuple[Pitch, ...]
+    ascending: Tuple[Pitch, ...]
+    pitch_degrees: Mapping[str, int]
+    pitch_classes: PitchClassSet
+    spelling: Tuple[str, ...]
+
+    @property
+    def root_midi(self) -> int:
+        """Get the MIDI number of the root in this octave."""
+        return (self.octave + 1) * 12 + NOTE_TO_SEMITONE[self.key]
+
+    def pitch_at(self, degree: int) -> Pitch:
+        """
+        Get the pitch at a 1-based scale degree.
+
+        Raises:
+            ValueError: If the degree is out of range
+        """
+        if not 1 <= degree <= len(self.pitches):
+            raise ValueError(f"Invalid scale degree {degree} for {self.key} {self.scale_type.value}")
+        return self.pitches[degree - 1]
+
+    def degree_of(self, pitch: str) -> int:
+        """
+        Get the 1-based scale degree of a pitch name.
+
+        Raises:
+            ValueError: If the pitch is not in the scale
+        """
+        try:
+            return self.pitch_degrees[pitch]
+        except KeyError:
+            raise ValueError(f"Pitch {pitch} is not in the scale {self.key} {self.scale_type.value}") from None
+
+    def __contains__(self, pitch: object) -> bool:
+        return pitch in self.pitch_degrees
+
+
+def _build_table(key: str, scale_type: ScaleType, octave: int) -> ScaleTable:
+    """Build the tables for one key, scale type and octave."""
+    intervals = tuple(int(i) for i in scale_type.intervals)
+    root_semitone = NOTE_TO_SEMITONE[key]
+    root_midi = (octave + 1) * 12 + root_semitone
+
+    spelling = get_spelling(key, scale_type)
+    names = [spelling[(root_semitone + interval) % 12] for interval in intervals]
+    pitches = tuple(Pitch.of(name, octave) for name in names)
+    ascending = tuple(
+        Pitch.of(spelling[midi % 12], midi // 12 - 1)
+        for midi in (root_midi + interval for interval in intervals)
+        if MIDI_MIN <= midi <= MIDI_MAX
+    )
+
+    pitch_degrees: Dict[str, int] = {}
+    for degree, name in enumerate(names, 1):
+        pitch_degrees.setdefault(name, degree)
+        if name in ENHARMONIC_NAMES:
+            pitch_degrees.setdefault(ENHARMONIC_NAMES[name], degree)
+
+    return ScaleTable(
+        key=key,
+        scale_type=scale_type,
+        octave=octave,
+        intervals=intervals,
+        pitches=pitches,
+        ascending=ascending,
+        pitch_degrees=MappingProxyType(pitch_degrees),
+        pitch_classes=PitchClassSet.from_intervals(root_semitone, intervals),
+        spelling=spelling
+    )
+
+
+def _build_catalog() -> Dict[CatalogKey, ScaleTable]:
+    """Build a table for every key spelling, scale type and octave."""
+    return {
+        (key, scale_type, octave): _build_table(key, scale_type, octave)
+        for key in NOTE_TO_SEMITONE
+        for scale_type in ScaleType
+        for octave in range(MIN_OCTAVE, MAX_OCTAVE + 1)
+    }
+
+
+SCALE_CATALOG: Mapping[CatalogKey, ScaleTable] = MappingProxyType(_build_catalog())
+
+
+def get_scale_table(key: str, scale_type: Union[ScaleType, str], octave: int = 4) -> ScaleTable:
+    """
+    Look up the precomputed tables for a scale.
+
+    Args:
+        key: Root spelling, e.g. 'C', 'F#', 'Bb'
+        scale_type: Scale type (enum member or its value)
+        octave: Octave of the root (-1 to 9)
+
+    Returns:
+        The shared, immutable ScaleTable
+
+    Raises:
+        ValueError: If the key, scale type or octave is unknown
+    """
+    # ScaleType is a str enum, so its members and values hash alike
+    table = SCALE_CATALOG.get((key, scale_type, octave))  # type: ignore[arg-type]
+    if table is None:
+        raise ValueError(f"Unknown scale: {key} {getattr(scale_type, 'value', scale_type)} in octave {octave}")
+    return table
+
+
+__all__ = ['ScaleTable', 'SCALE_CATALOG', 'get_scale_table']
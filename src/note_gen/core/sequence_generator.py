@@ -5,7 +5,7 @@ from note_gen.models.rhythm import RhythmPattern, RhythmNote
 from note_gen.models.scale_info import ScaleInfo
 from note_gen.models.note_sequence import NoteSequence
 from note_gen.validation.pattern_validation import PatternValidator
-from note_gen.core.constants import PATTERN_PRESETS, PROGRESSION_PRESETS
+from note_gen.core.preset_registry import get_preset_registry
 
 async def generate_sequence_from_presets(
     note_pattern_name: str,
@@ -16,6 +16,11 @@ async def generate_sequence_from_presets(
     """
     Generate a note sequence from preset patterns.
 
+    The presets are compiled and validated once (see
+    :mod:`note_gen.core.preset_registry`); each chord plays the rhythm
+    pattern once, its steps taking the note pattern's intervals above the
+    chord's root in the requested key.
+
     Args:
         note_pattern_name: Name of the note pattern preset
         rhythm_pattern_name: Name of the rhythm pattern preset
@@ -28,61 +33,28 @@ async def generate_sequence_from_presets(
     Raises:
         ValueError: If any preset names are invalid or if generation fails
     """
-    # Validate preset names
-    if note_pattern_name not in PATTERN_PRESETS.get("note_patterns", {}):
-        raise ValueError(f"Invalid note pattern name: {note_pattern_name}")
-    if rhythm_pattern_name not in PATTERN_PRESETS.get("rhythm_patterns", {}):
-        raise ValueError(f"Invalid rhythm pattern name: {rhythm_pattern_name}")
-    if progression_name not in PROGRESSION_PRESETS:
-        raise ValueError(f"Invalid progression name: {progression_name}")
-
-    # Create scale info object
     scale = ScaleInfo(**scale_info)
 
-    # Get preset configurations
-    note_pattern_config = PATTERN_PRESETS["note_patterns"][note_pattern_name]
-    rhythm_pattern_config = PATTERN_PRESETS["rhythm_patterns"][rhythm_pattern_name]
-    progression = PROGRESSION_PRESETS[progression_name]
-
-    # Initialize pattern generator
-    generator = PatternGenerator()
-
-    # Generate patterns
-    # We don't use the note_pattern directly, but it's generated for consistency
-    _ = generator.generate_pattern(
-        pattern_type=PatternType.MELODIC,
-        config={
-            "root_note": scale.key,
-            "scale_type": scale.scale_type,
-            **(note_pattern_config if isinstance(note_pattern_config, dict) else {})
-        }
-    )
-
-    rhythm_pattern = generator.generate_pattern(
-        pattern_type=PatternType.RHYTHMIC,
-        config=rhythm_pattern_config if isinstance(rhythm_pattern_config, dict) else {}
+    # Presets are compiled once; only the realization in this key is done here
+    rows, duration = get_preset_registry().realize(
+        note_pattern_name, rhythm_pattern_name, progression_name, scale.key, scale.scale_type
     )
+    notes = [
+        {
+            'pitch': pitch,
+            'octave': octave,
+            'duration': note_duration,
+            'velocity': velocity,
+            'position': position,
+            'stored_midi_number': midi
+        }
+        for pitch, octave, note_duration, velocity, position, midi in rows
+    ]
 
-    # Combine patterns into a sequence
-    notes = []
-    current_position = 0.0
-
-    # We don't use the chord directly, but iterate through the progression
-    for _ in progression:
-        for rhythm_note in rhythm_pattern.pattern:
-            if rhythm_note.note:
-                note = rhythm_note.note.clone()
-                note.position = current_position + rhythm_note.position
-                note.duration = rhythm_note.duration
-                notes.append(note)
-
-        current_position += rhythm_pattern.total_duration
-
-    # Create and return the sequence
     return NoteSequence(
         notes=notes,
-        duration=current_position,
-        scale_info=scale,
+        duration=duration,
+        scale_info=scale.model_dump(),
         progression_name=progression_name,
         note_pattern_name=note_pattern_name,
         rhythm_pattern_name=rhythm_pattern_name
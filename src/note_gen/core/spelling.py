@@ -0,0 +1,164 @@
+"""Key-aware enharmonic spelling.
+
+For every key spelling × ScaleType a table of 12 pitch names (one per pitch
+class) is precomputed at import time:
+
+* scale tones of 7-note scales take consecutive letters from the key's
+  letter (Bb major -> Bb C D Eb F G A), choosing among the 17 spellings the
+  repo supports; a tone whose letter would need a spelling outside them
+  (E#, Cb, double accidentals) falls back to the key's accidental preference
+* all other pitch classes use the key's preference: flats when the scale is
+  spelled with more flats than sharps (or the key itself is flat), sharps
+  otherwise
+
+Respelling a note is then a tuple lookup by pitch class.
+"""
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from note_gen.core.constants import NOTE_TO_SEMITONE
+from note_gen.core.enums import ScaleType
+
+if TYPE_CHECKING:
+    from note_gen.models.note import Note
+
+SpellingTable = Tuple[str, ...]
+
+# Pitch-class spellings with sharps and with flats
+SHARP_NAMES: SpellingTable = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+FLAT_NAMES: SpellingTable = ('C', 'Db', 'D', 'Eb', 'E', 'F', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B')
+
+# Each accidental spelling -> its enharmonic equivalent, e.g. 'C#' <-> 'Db'
+ENHARMONIC_NAMES: Mapping[str, str] = MappingProxyType({
+    **{sharp: flat for sharp, flat in zip(SHARP_NAMES, FLAT_NAMES) if sharp != flat},
+    **{flat: sharp for sharp, flat in zip(SHARP_NAMES, FLAT_NAMES) if sharp != flat}
+})
+
+_LETTERS = 'CDEFGAB'
+
+# Pitch class -> available spellings
+_SPELLINGS_BY_CLASS: Dict[int, List[str]] = {}
+for _name, _semitone in NOTE_TO_SEMITONE.items():
+    _SPELLINGS_BY_CLASS.setdefault(_semitone, []).append(_name)
+
+
+def _build_spelling(key: str, scale_type: ScaleType) -> SpellingTable:
+    """Build the pitch-class spelling table for one key and scale type."""
+    tonic = NOTE_TO_SEMITONE[key]
+    intervals = scale_type.intervals
+    scale_names: Dict[int, str] = {}
+    if len(intervals) == 7:
+        first_letter = _LETTERS.index(key[0])
+        for degree, interval in enumerate(intervals):
+            pitch_class = (tonic + interval) % 12
+            letter = _LETTERS[(first_letter + degree) % 7]
+            for name in _SPELLINGS_BY_CLASS[pitch_class]:
+                if name[0] == letter:
+                    scale_names[pitch_class] = name
+
+    flats = sum(name.endswith('b') for name in scale_names.values())
+    sharps = sum(name.endswith('#') for name in scale_names.values())
+    prefer_flats = flats > sharps or (flats == sharps and key.endswith('b'))
+    fallback = FLAT_NAMES if prefer_flats else SHARP_NAMES
+    return tuple(scale_names.get(pitch_class, fallback[pitch_class]) for pitch_class in range(12))
+
+
+SPELLING_TABLES: Mapping[Tuple[str, ScaleType], SpellingTable] = MappingProxyType({
+    (key, scale_type): _build_spelling(key, scale_type)
+    for key in NOTE_TO_SEMITONE
+    for scale_type in ScaleType
+})
+
+
+def get_spelling(key: str, scale_type: Union[ScaleType, str] = ScaleType.MAJOR) -> SpellingTable:
+    """
+    Get the 12-entry pitch-class spelling table of a key.
+
+    Raises:
+        ValueError: If the key or scale type is unknown
+    """
+    # ScaleType is a str enum, so its members and values hash alike
+    table = SPELLING_TABLES.get((key, scale_type))  # type: ignore[arg-type]
+    if table is None:
+        raise ValueError(f"Unknown key: {key} {getattr(scale_type, 'value', scale_type)}")
+    return table
+
+
+def spell(pitch: Union[int, str], key: str, scale_type: Union[ScaleType, str] = ScaleType.MAJOR) -> str:
+    """
+    Spell a pitch class, MIDI number or pitch name in a key.
+
+    Raises:
+        ValueError: If the pitch name, key or scale type is invalid
+    """
+    if isinstance(pitch, str):
+        if pitch not in NOTE_TO_SEMITONE:
+            raise ValueError(f"Invalid pitch: {pitch}")
+        pitch = NOTE_TO_SEMITONE[pitch]
+    return get_spelling(key, scale_type)[pitch % 12]
+
+
+def _spelling_cost(key: str, scale_type: ScaleType) -> Tuple[int, int]:
+    """(Scale tones off their consecutive letter, scale tones with an accidental) of a key."""
+    table = SPELLING_TABLES[(key, scale_type)]
+    tonic = NOTE_TO_SEMITONE[key]
+    names = [table[(tonic + interval) % 12] for interval in scale_type.intervals]
+    first_letter = _LETTERS.index(key[0])
+    misspelled = len(names) == 7 and sum(
+        name[0] != _LETTERS[(first_letter + degree) % 7] for degree, name in enumerate(names)
+    )
+    return int(misspelled), sum(len(name) > 1 for name in names)
+
+
+def transpose_key(key: str, semitones: int, scale_type: Union[ScaleType, str] = ScaleType.MAJOR) -> str:
+    """
+    Name the key a transposition lands in.
+
+    Of the tonic's enharmonic spellings, the one whose scale can be spelled
+    on consecutive letters with the fewest accidentals wins (C major up 1 ->
+    Db, A minor up 4 -> C#); ties go to flats.
+
+    Raises:
+        ValueError: If the key or scale type is unknown
+    """
+    scale_type = ScaleType(scale_type)
+    if key not in NOTE_TO_SEMITONE:
+        raise ValueError(f"Unknown key: {key} {scale_type.value}")
+    candidates = _SPELLINGS_BY_CLASS[(NOTE_TO_SEMITONE[key] + semitones) % 12]
+    return min(candidates, key=lambda name: (_spelling_cost(name, scale_type), name.endswith('#')))
+
+
+def respell_notes(
+    notes: Sequence['Note'],
+    key: str,
+    scale_type: Union[ScaleType, str] = ScaleType.MAJOR,
+    table: Optional[SpellingTable] = None
+) -> List['Note']:
+    """
+    Respell notes for a key in one pass.
+
+    Notes already spelled correctly are returned as-is; others are copied
+    with the new spelling (enharmonic respelling never changes the octave
+    for the 17 supported spellings).
+
+    Args:
+        notes: Notes to respell
+        key: Key root
+        scale_type: Scale type of the key
+        table: Precomputed spelling table, overriding key and scale_type
+
+    Returns:
+        Respelled notes, in input order
+    """
+    names = table if table is not None else get_spelling(key, scale_type)
+    result: List['Note'] = []
+    for note in notes:
+        name = names[NOTE_TO_SEMITONE[note.pitch]]
+        result.append(note if name == note.pitch else note.model_copy(update={'pitch': name}))
+    return result
+
+
+__all__ = [
+    'SpellingTable', 'SHARP_NAMES', 'FLAT_NAMES', 'ENHARMONIC_NAMES', 'SPELLING_TABLES',
+    'get_spelling', 'spell', 'transpose_key', 'respell_notes'
+]
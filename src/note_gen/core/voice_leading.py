@@ -0,0 +1,152 @@
+"""Minimum-movement voice leading.
+
+Each chord of a progression can be voiced in any inversion, in any of a few
+octaves around octave 4 (its *candidates*). :func:`lead_voices` picks one
+candidate per chord so that the total voice movement along the progression
+is minimal, with a Viterbi pass: for every chord it keeps, per candidate, the
+cheapest path ending there and a back-pointer, then walks the back-pointers
+from the cheapest final candidate. That is O(n * k^2) for n chords and k
+candidates per chord, i.e. linear in the progression's length.
+
+The movement between two voicings is the total number of semitones their
+voices move, pairing voices from the bass up when the chords have the same
+size, otherwise taking each voice of the larger chord to the nearest note of
+the smaller. A small register penalty (distance of a voicing's mean pitch
+from the chord's root position at octave 4) keeps the line from drifting and
+breaks ties. Transition costs depend only on the two chords, so each matrix
+is computed once and shared from a bounded LRU cache.
+"""
+from functools import lru_cache
+from operator import add
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from note_gen.core.chord_voicing import Voicing, get_voicing
+from note_gen.core.constants import CHORD_INTERVALS
+from note_gen.core.enums import ChordQuality
+from note_gen.core.note_parser import parse_pitch
+
+# Octaves a chord's root may be placed in before inversion
+VOICE_LEADING_OCTAVES: Tuple[int, ...] = (3, 4, 5)
+
+# Cost of each semitone a voicing's mean pitch lies from the default register
+REGISTER_WEIGHT = 0.25
+
+# Maximum number of distinct chord-to-chord cost matrices kept in the cache
+TRANSITION_CACHE_SIZE = 4096
+
+ChordKey = Tuple[str, ChordQuality]
+CostMatrix = Tuple[Tuple[float, ...], ...]
+
+
+def _mean(voicing: Voicing) -> float:
+    return sum(pitch.midi for pitch in voicing) / len(voicing)
+
+
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def _candidates(chord: ChordKey, octaves: Tuple[int, ...]) -> Tuple[Tuple[Voicing, ...], Tuple[float, ...]]:
+    """A chord's candidate voicings, cheapest register first, and their register costs."""
+    root, quality = chord
+    anchor = _mean(get_voicing(root, quality, octave=4))
+    candidates = []
+    for octave in octaves:
+        for inversion in range(len(CHORD_INTERVALS[quality])):
+            try:
+                voicing = get_voicing(root, quality, octave=octave, inversion=inversion)
+            except ValueError:
+                continue  # Outside the MIDI range
+            candidates.append((REGISTER_WEIGHT * abs(_mean(voicing) - anchor), voicing))
+    if not candidates:
+        raise ValueError(f"No voicing of {root} {quality.value} fits the MIDI range")
+    candidates.sort(key=lambda candidate: candidate[0])
+    return tuple(voicing for _, voicing in candidates), tuple(cost for cost, _ in candidates)
+
+
+def movement(current: Voicing, following: Voicing) -> int:
+    """
+    Total semitones the voices move from one voicing to the next.
+
+    Args:
+        current: Ascending voicing
+        following: Ascending voicing
+
+    Returns:
+        Sum of each voice's movement
+    """
+    if len(current) == len(following):
+        return sum(abs(a.midi - b.midi) for a, b in zip(current, following))
+    larger, smaller = (current, following) if len(current) > len(following) else (following, current)
+    return sum(min(abs(a.midi - b.midi) for b in smaller) for a in larger)
+
+
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def _transition_costs(current: ChordKey, following: ChordKey, octaves: Tuple[int, ...]) -> CostMatrix:
+    """Movement plus register cost to each candidate of the next chord (rows) from each of this one's."""
+    sources, _ = _candidates(current, octaves)
+    targets, register = _candidates(following, octaves)
+    return tuple(
+        tuple(movement(source, target) + cost for source in sources)
+        for target, cost in zip(targets, register)
+    )
+
+
+def _chord_key(chord: Tuple[str, Union[ChordQuality, str]]) -> ChordKey:
+    root, quality = chord
+    quality = ChordQuality(quality)
+    if quality not in CHORD_INTERVALS:
+        raise ValueError(f"Invalid chord quality: {quality}")
+    return parse_pitch(root), quality
+
+
+def lead_voices(
+    chords: Iterable[Tuple[str, Union[ChordQuality, str]]],
+    octaves: Sequence[int] = VOICE_LEADING_OCTAVES
+) -> List[Voicing]:
+    """
+    Voice a progression with minimum total voice movement.
+
+    Args:
+        chords: (root, quality) of each chord, in order
+        octaves: Octaves a chord's root may be placed in before inversion
+
+    Returns:
+        One ascending voicing per chord
+
+    Raises:
+        ValueError: If a chord is invalid or cannot be voiced in range
+    """
+    keys = [_chord_key(chord) for chord in chords]
+    if not keys:
+        return []
+    octaves = tuple(octaves)
+
+    # Cheapest path cost ending at each candidate, and the back-pointers per chord
+    _, costs = _candidates(keys[0], octaves)
+    back_pointers: List[Tuple[int, ...]] = []
+    for current, following in zip(keys, keys[1:]):
+        # (cost, source) of the cheapest path into each candidate; ties go to the lower register cost
+        paths = [
+            min(zip(map(add, costs, column), range(len(costs))))
+            for column in _transition_costs(current, following, octaves)
+        ]
+        costs = [cost for cost, _ in paths]
+        back_pointers.append(tuple(source for _, source in paths))
+
+    choice = min(range(len(costs)), key=costs.__getitem__)
+    choices = [choice]
+    for pointers in reversed(back_pointers):
+        choice = pointers[choice]
+        choices.append(choice)
+    choices.reverse()
+    return [_candidates(key, octaves)[0][choice] for key, choice in zip(keys, choices)]
+
+
+def clear_voice_leading_cache() -> None:
+    """Drop all cached candidates and transition matrices."""
+    _candidates.cache_clear()
+    _transition_costs.cache_clear()
+
+
+__all__ = [
+    'VOICE_LEADING_OCTAVES', 'REGISTER_WEIGHT', 'TRANSITION_CACHE_SIZE',
+    'movement', 'lead_voices', 'clear_voice_leading_cache'
+]
@@ -109,12 +109,46 @@ class BaseRepository(Generic[T]):
             # Update document with generated ID
             doc_dict["id"] = str(typed_result.inserted_id)
 
+            # A new document can shadow one of the same name in cached generations
+            self._invalidate_generations(name=doc_dict.get("name"))
+
             # Return updated model
-            return self.model_type(**doc_dict)
+            created = self.model_type(**doc_dict)
+            self._cache_validation(created)
+            return created
         except Exception as e:
             print(f"Error in create: {e}")
             raise
 
+    async def upsert(self, document: T) -> T:
+        """Insert a document under its own id, or replace the one already stored there."""
+        try:
+            # Convert model to dict; its id becomes the document key
+            doc_dict = document.model_dump()
+            id = doc_dict.pop("id", None)
+            if id is None:
+                raise ValueError("Cannot upsert a document without an id")
+
+            # Replace document - handle both AsyncMock and real collection
+            if hasattr(self.collection.replace_one, "__await__"):
+                await self.collection.replace_one({"_id": id}, doc_dict, upsert=True)
+            else:
+                # For AsyncMock in tests
+                result = self.collection.replace_one({"_id": id}, doc_dict, upsert=True)
+                if hasattr(result, "__await__"):
+                    await result
+
+            self._invalidate_generations(id, doc_dict.get("name"))
+
+            # Return updated model
+            doc_dict["id"] = id
+            upserted = self.model_type(**doc_dict)
+            self._cache_validation(upserted)
+            return upserted
+        except Exception as e:
+            print(f"Error in upsert: {e}")
+            raise
+
     async def update(self, id: str, document: T) -> Optional[T]:
         """Update an existing document."""
         try:
@@ -141,6 +175,7 @@ class BaseRepository(Generic[T]):
 
             # Cast to UpdateResult to satisfy type checker
             typed_result = cast(UpdateResult, result)
+            self._invalidate_generations(id, doc_dict.get("name"))
 
             if typed_result.modified_count > 0:
                 # Get updated document - handle both AsyncMock and real collection
@@ -155,7 +190,9 @@ class BaseRepository(Generic[T]):
                 if updated_doc:
                     # Cast to Dict to satisfy type checker
                     doc_dict = cast(Dict[str, Any], updated_doc)
-                    return self._convert_to_model(doc_dict)
+                    updated = self._convert_to_model(doc_dict)
+                    self._cache_validation(updated)
+                    return updated
             return None
         except Exception as e:
             print(f"Error in update: {e}")
@@ -175,11 +212,30 @@ class BaseRepository(Generic[T]):
 
             # Cast to DeleteResult to satisfy type checker
             typed_result = cast(DeleteResult, result)
+            self._invalidate_generations(id)
             return typed_result.deleted_count > 0
         except Exception as e:
             print(f"Error in delete: {e}")
             return False
 
+    def _invalidate_generations(self, id: Optional[str] = None, name: Optional[str] = None) -> None:
+        """Drop cached generated sequences built from a changed document."""
+        from note_gen.generators.generation_cache import get_generation_cache
+
+        get_generation_cache().invalidate(self.collection.name, id, name)
+
+    def _cache_validation(self, document: BaseModel) -> None:
+        """Validate a written document into the validation cache, so validating it later is a lookup."""
+        from note_gen.validation.validation_manager import ValidationManager
+
+        if not ValidationManager.can_validate_content(type(document)):
+            return
+        try:
+            ValidationManager.validate_content(document)
+        except Exception as e:
+            # The write succeeded; the document is validated on first use instead
+            print(f"Error validating written document: {e}")
+
     def _convert_to_model(self, data: Dict[str, Any]) -> T:
         """Convert dictionary data to model instance."""
         try:
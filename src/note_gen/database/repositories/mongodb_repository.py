@@ -85,14 +85,52 @@ class MongoDBRepository(BaseRepository[T]):
             # Set ID on the model
             document_dict = document.model_dump()
             document_dict["id"] = str(result.inserted_id)
+            self._invalidate_generations(name=document_dict.get("name"))
             
             # Return updated model
-            return self.model_class.model_validate(document_dict)
+            created = self.model_class.model_validate(document_dict)
+            self._cache_validation(created)
+            return created
         except Exception as e:
             # Log the error
             print(f"Error creating document: {e}")
             raise
 
+    async def upsert(self, document: T) -> T:
+        """
+        Insert a document under its own id, or replace the one stored there.
+
+        Writing the same document twice leaves one copy, so a retried write
+        is safe.
+
+        Args:
+            document: Model instance with an id
+
+        Returns:
+            Stored model instance
+
+        Raises:
+            ValueError: If the document has no id
+        """
+        try:
+            document_dict = document.model_dump()
+            id = document_dict.pop("id", None)
+            if id is None:
+                raise ValueError("Cannot upsert a document without an id")
+
+            # The model's id is the document key
+            await self.collection.replace_one({"_id": id}, document_dict, upsert=True)
+            self._invalidate_generations(id, document_dict.get("name"))
+
+            document_dict["id"] = id
+            upserted = self.model_class.model_validate(document_dict)
+            self._cache_validation(upserted)
+            return upserted
+        except Exception as e:
+            # Log the error
+            print(f"Error upserting document: {e}")
+            raise
+
     async def update(self, id: str, document: T) -> Optional[T]:
         """
         Update an existing document.
@@ -119,11 +157,16 @@ class MongoDBRepository(BaseRepository[T]):
                 {"_id": ObjectId(id)},
                 {"$set": doc_dict}
             )
+            self._invalidate_generations(id, getattr(document, "name", None))
             
             # Return updated document if found
             if result.matched_count > 0:
                 updated_doc = await self.collection.find_one({"_id": ObjectId(id)})
-                return self._convert_to_model(updated_doc) if updated_doc else None
+                if not updated_doc:
+                    return None
+                updated = self._convert_to_model(updated_doc)
+                self._cache_validation(updated)
+                return updated
             return None
         except Exception as e:
             # Log the error
@@ -142,6 +185,7 @@ class MongoDBRepository(BaseRepository[T]):
         """
         try:
             result = await self.collection.delete_one({"_id": ObjectId(id)})
+            self._invalidate_generations(id)
             return result.deleted_count > 0
         except Exception as e:
             # Log the error
@@ -1,5 +1,5 @@
 """Factory for creating note sequences with different strategies."""
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from uuid import uuid4
 
 from ..models.note_sequence import NoteSequence
@@ -8,7 +8,7 @@ from ..models.rhythm import RhythmPattern
 from ..models.chord_progression import ChordProgression
 from ..models.scale_info import ScaleInfo
 from ..core.enums import ScaleType, ValidationLevel
-from ..generators.note_sequence_generator import NoteSequenceGenerator
+from ..generators.note_sequence_generator import GenerationRequest, NoteSequenceGenerator
 from ..validation.validation_manager import ValidationManager
 
 class NoteSequenceFactory:
@@ -37,6 +37,15 @@ class NoteSequenceFactory:
         sequence.progression_name = chord_progression.name
         return sequence
 
+    @classmethod
+    async def create_many_from_patterns(cls, requests: Sequence[GenerationRequest]) -> List[NoteSequence]:
+        """Create many note sequences, sharing work between requests with the same inputs."""
+        sequences = await NoteSequenceGenerator.generate_many(requests)
+        for request, sequence in zip(requests, sequences):
+            sequence.chord_progression = request.chord_progression.model_dump()
+            sequence.progression_name = request.chord_progression.name
+        return sequences  # type: ignore[return-value]
+
     @classmethod
     async def create_from_preset(
         cls,
@@ -3,13 +3,15 @@ Chord progression generator with enhanced validation and pattern support.
 """
 from typing import List, Optional, Union, Dict, Any, Tuple
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from note_gen.core.enums import ChordQuality, ScaleType, ValidationLevel, VoiceLeadingRule
+from note_gen.core.enums import ChordQuality, ScaleType, ValidationLevel, VoiceLeadingRule, VoicingMode
 from note_gen.models.note import Note
 from note_gen.models.chord import Chord
 from note_gen.models.scale_info import ScaleInfo
 from note_gen.models.chord_progression import ChordProgression
 from note_gen.models.chord_progression_item import ChordProgressionItem
-from note_gen.core.constants import COMMON_PROGRESSIONS
+from note_gen.core.constants import COMMON_PROGRESSIONS, GENRE_PATTERNS
+from note_gen.core.voice_leading import lead_voices
+from note_gen.generators.markov_progression import Seed, get_markov_model
 from note_gen.validation.validation_manager import ValidationManager
 from note_gen.validation.base_validation import ValidationResult
 
@@ -27,6 +29,7 @@ class ChordProgressionGenerator(BaseModel):
     scale_info: Dict[str, Any] = Field(default_factory=dict)
     validation_level: ValidationLevel = ValidationLevel.NORMAL
     voice_leading_rules: List[str] = Field(default_factory=list)
+    voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -82,6 +85,7 @@ class ChordProgressionGenerator(BaseModel):
             items.append(item)
             position += 1.0
 
+        self._voice_chords(chords)
         progression = ChordProgression(
             name=f"Generated {self.name}",
             key=self.key,
@@ -131,32 +135,7 @@ class ChordProgressionGenerator(BaseModel):
     @property
     def genre_patterns(self) -> Dict[str, List[Tuple[int, ChordQuality]]]:
         """Predefined chord patterns for different genres."""
-        return {
-            "pop": [
-                (1, ChordQuality.MAJOR),
-                (4, ChordQuality.MAJOR),
-                (5, ChordQuality.MAJOR),
-                (1, ChordQuality.MAJOR)
-            ],
-            "jazz": [
-                (2, ChordQuality.MINOR),
-                (5, ChordQuality.DOMINANT_SEVENTH),
-                (1, ChordQuality.MAJOR_SEVENTH),
-                (4, ChordQuality.MAJOR_SEVENTH)
-            ],
-            "blues": [
-                (1, ChordQuality.DOMINANT_SEVENTH),
-                (4, ChordQuality.DOMINANT_SEVENTH),
-                (5, ChordQuality.DOMINANT_SEVENTH),
-                (1, ChordQuality.DOMINANT_SEVENTH)
-            ],
-            "classical": [
-                (1, ChordQuality.MAJOR),
-                (5, ChordQuality.MAJOR),
-                (4, ChordQuality.MAJOR),
-                (1, ChordQuality.MAJOR)
-            ]
-        }
+        return {genre: list(pattern) for genre, pattern in GENRE_PATTERNS.items()}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert generator settings to dictionary."""
@@ -166,7 +145,8 @@ class ChordProgressionGenerator(BaseModel):
             "scale_type": self.scale_type.value,
             "complexity": self.complexity,
             "validation_level": self.validation_level.value,
-            "voice_leading_rules": self.voice_leading_rules
+            "voice_leading_rules": self.voice_leading_rules,
+            "voicing_mode": self.voicing_mode.value
         }
 
     def generate_from_template(
@@ -210,7 +190,8 @@ class ChordProgressionGenerator(BaseModel):
         length: int,
         key: str = "C",
         complexity: float = 0.5,
-        validation_level: ValidationLevel = ValidationLevel.NORMAL
+        validation_level: ValidationLevel = ValidationLevel.NORMAL,
+        seed: Seed = None
     ) -> ChordProgression:
         """
         Generate a custom chord progression.
@@ -220,15 +201,18 @@ class ChordProgressionGenerator(BaseModel):
             key: Key to generate in
             complexity: Desired complexity (0-1)
             validation_level: Level of validation to apply
+            seed: Seed or Random instance, for reproducible output
 
         Returns:
             ChordProgression: Generated progression
         """
         # Generate progression logic here
+        chords = self._generate_chord_sequence(length, complexity, seed)
+        self._voice_chords(chords)
         progression = ChordProgression(
             name="Custom Progression",
             key=key,
-            chords=self._generate_chord_sequence(length, complexity),
+            chords=chords,
             tags=["custom"]
         )
 
@@ -237,55 +221,45 @@ class ChordProgressionGenerator(BaseModel):
             self.validate_progression(progression)
         return progression
 
-    def _generate_chord_sequence(self, length: int, complexity: float) -> List[Chord]:
+    def _generate_chord_sequence(self, length: int, complexity: float, seed: Seed = None) -> List[Chord]:
         """
         Generate a sequence of chords based on length and complexity.
 
+        Chords are sampled from the pop Markov model; higher complexity
+        smooths its transitions towards chords from every genre.
+
         Args:
             length: Number of chords to generate
             complexity: Value between 0-1 determining progression complexity
+            seed: Seed or Random instance, for reproducible output
 
         Returns:
             List of Chord objects
         """
-        chords = []
-        scale_degrees = [1, 4, 5, 6]  # Basic scale degrees
-
-        # Add more complex degrees based on complexity
-        if complexity > 0.5:
-            scale_degrees.extend([2, 3, 7])
-
-        # Create a ScaleInfo object
-        scale_info_obj = ScaleInfo(key=self.key, scale_type=self.scale_type)
-        scale_notes = scale_info_obj.get_scale_notes()
+        model = get_markov_model("pop", smoothing=self._complexity_smoothing(complexity))
+        table = ScaleInfo(key=self.key, scale_type=self.scale_type).get_table()
+        return [
+            Chord(root=table.pitch_at(degree).name, quality=quality, duration=1.0)
+            for degree, quality in model.sample(length, seed)
+        ]
+
+    def _voice_chords(self, chords: List[Chord]) -> None:
+        """
+        Set each chord's notes per the voicing mode.
 
-        position = 0.0
-        for _ in range(length):
-            # Select degree based on complexity
-            degree_idx = int(len(scale_degrees) * complexity) % len(scale_degrees)
-            degree = scale_degrees[degree_idx]
-
-            # Determine chord quality based on scale degree and complexity
-            if complexity > 0.7 and degree in [2, 3, 6]:
-                quality = ChordQuality.MINOR
-            elif complexity > 0.8 and degree in [5, 7]:
-                quality = ChordQuality.DOMINANT_SEVENTH
-            else:
-                quality = ChordQuality.MAJOR
-
-            # Get the root note for this scale degree
-            root_note = scale_notes[degree - 1].pitch
-
-            # Create a Chord object
-            chord = Chord(
-                root=root_note,
-                quality=quality,
-                duration=1.0  # Default duration
-            )
-            chords.append(chord)
-            position += 1.0
+        Root-position chords keep their default notes; voice-led chords get
+        the inversion and octave of the minimum-movement path through the
+        whole progression (see :func:`~note_gen.core.voice_leading.lead_voices`).
+        """
+        if self.voicing_mode != VoicingMode.VOICE_LED:
+            return
+        for chord, voicing in zip(chords, lead_voices((chord.root, chord.quality) for chord in chords)):
+            chord.notes = [Note.from_pitch(pitch) for pitch in voicing]
 
-        return chords
+    @staticmethod
+    def _complexity_smoothing(complexity: float) -> float:
+        """Map complexity (0.1-1.0) to Markov smoothing, in steps of 0.1 so models are shared."""
+        return round(max(complexity - 0.1, 0.0), 1)
 
     def validate_model_fields(self) -> bool:
         """Validate model fields."""
@@ -299,10 +273,25 @@ class ChordProgressionGenerator(BaseModel):
         """Validate voice leading rules."""
         return ValidationResult(is_valid=True, violations=[])
 
-    async def generate_random(self, length: int = 4) -> ChordProgression:
-        """Generate random progression."""
-        pattern = [(1, ChordQuality.MAJOR)] * length
-        return await self.generate_from_pattern(pattern)
+    async def generate_random(
+        self,
+        length: int = 4,
+        genre: Optional[str] = None,
+        seed: Seed = None
+    ) -> ChordProgression:
+        """
+        Generate a random progression from the genre's Markov model.
+
+        Args:
+            length: Number of chords
+            genre: Genre whose transitions to follow (defaults to pop)
+            seed: Seed or Random instance, for reproducible output
+
+        Raises:
+            ValueError: If the genre is unsupported or length is not positive
+        """
+        model = get_markov_model(genre or "pop", smoothing=self._complexity_smoothing(self.complexity))
+        return await self.generate_from_pattern(model.sample(length, seed))
 
     def analyze_cadence(self, progression: ChordProgression) -> str:
         """Analyze cadence type."""
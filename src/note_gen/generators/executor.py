@@ -0,0 +1,259 @@
+"""
+Executors for CPU-bound sequence generation.
+
+Generation is pure computation, so running it on the event loop stalls every
+other request on the worker. A :class:`GenerationExecutor` runs it inline, in
+a thread pool or in a process pool, as configured by the
+``generation_executor``, ``generation_max_workers`` and
+``generation_max_queue`` settings.
+
+Work sent to a process pool crosses the boundary in compact form: a batch is
+one JSON document in which each distinct progression, pattern and scale
+appears once (so the worker still shares work between requests using the
+same inputs), and each sequence comes back as its metadata plus one
+``(pitch, octave, duration, velocity, position, midi)`` row per note.
+"""
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from note_gen.core.config import get_settings
+from note_gen.core.enums import ExecutorKind
+from note_gen.core.exceptions import GenerationBusyError
+from note_gen.generators.note_sequence_generator import GenerationRequest, NoteSequenceGenerator
+from note_gen.models.chord_progression import ChordProgression
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.patterns import NotePattern
+from note_gen.models.rhythm import RhythmPattern
+from note_gen.models.scale_info import ScaleInfo
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+NoteRow = Tuple[str, Optional[int], float, int, float, Optional[int]]
+EncodedSequence = Tuple[Dict[str, Any], List[NoteRow]]
+
+# Request fields shared between requests, by model type
+_SHARED_INPUTS: Dict[str, Any] = {
+    'chord_progression': ChordProgression,
+    'note_pattern': NotePattern,
+    'rhythm_pattern': RhythmPattern,
+    'scale_info': ScaleInfo
+}
+
+
+def encode_requests(requests: Sequence[GenerationRequest]) -> str:
+    """Serialize requests, writing each distinct input object once."""
+    inputs: Dict[str, List[Any]] = {field: [] for field in _SHARED_INPUTS}
+    indices: Dict[Tuple[str, int], int] = {}
+    rows = []
+    for request in requests:
+        row: Dict[str, Any] = {
+            'transpose': request.transpose,
+            'note_pattern_name': request.note_pattern_name,
+            'rhythm_pattern_name': request.rhythm_pattern_name,
+            'voicing_mode': request.voicing_mode.value
+        }
+        for field in _SHARED_INPUTS:
+            value = getattr(request, field)
+            if value is None:
+                row[field] = None
+                continue
+            key = (field, id(value))
+            if key not in indices:
+                indices[key] = len(inputs[field])
+                inputs[field].append(value.model_dump(mode='json'))
+            row[field] = indices[key]
+        rows.append(row)
+    return json.dumps({'inputs': inputs, 'requests': rows}, separators=(',', ':'))
+
+
+def decode_requests(payload: str) -> List[GenerationRequest]:
+    """Rebuild requests from :func:`encode_requests`, sharing their input objects again."""
+    data = json.loads(payload)
+    inputs = {
+        field: [model.model_validate(value) for value in data['inputs'][field]]
+        for field, model in _SHARED_INPUTS.items()
+    }
+    requests = []
+    for row in data['requests']:
+        fields = {
+            field: None if row[field] is None else inputs[field][row[field]]
+            for field in _SHARED_INPUTS
+        }
+        requests.append(GenerationRequest(
+            **fields,
+            transpose=row['transpose'],
+            note_pattern_name=row['note_pattern_name'],
+            rhythm_pattern_name=row['rhythm_pattern_name'],
+            voicing_mode=row['voicing_mode']
+        ))
+    return requests
+
+
+def encode_sequence(sequence: NoteSequence) -> EncodedSequence:
+    """Split a sequence into its metadata and one compact row per note."""
+    rows = [
+        (note.pitch, note.octave, note.duration, note.velocity, note.position, note.stored_midi_number)
+        for note in sequence.notes
+    ]
+    return sequence.model_dump(exclude={'notes'}), rows
+
+
+def decode_sequence(encoded: EncodedSequence) -> NoteSequence:
+    """Rebuild a sequence from :func:`encode_sequence`."""
+    metadata, rows = encoded
+    notes = [
+        Note(pitch=pitch, octave=octave, duration=duration, velocity=velocity,
+             position=position, stored_midi_number=midi)
+        for pitch, octave, duration, velocity, position, midi in rows
+    ]
+    return NoteSequence(**metadata, notes=notes)
+
+
+def _generate_encoded(payload: str) -> List[Union[EncodedSequence, ValueError]]:
+    """Process-pool entry point: generate a serialized batch."""
+    results = NoteSequenceGenerator.generate_many_sync(decode_requests(payload), return_exceptions=True)
+    return [
+        result if isinstance(result, ValueError) else encode_sequence(result)  # type: ignore[arg-type]
+        for result in results
+    ]
+
+
+class GenerationExecutor:
+    """Runs CPU-bound generation inline, in a thread pool or in a process pool."""
+
+    def __init__(
+        self,
+        kind: Union[ExecutorKind, str] = ExecutorKind.INLINE,
+        max_workers: Optional[int] = None,
+        max_queue: int = 64
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            kind: Where generation runs
+            max_workers: Pool size (None lets the pool pick one per core)
+            max_queue: Jobs allowed in flight (running or waiting) at once;
+                further jobs are rejected with GenerationBusyError
+
+        Raises:
+            ValueError: If the kind or limits are invalid
+        """
+        if max_queue < 1:
+            raise ValueError("max_queue must be positive")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self.kind = ExecutorKind(kind)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool: Optional[Executor] = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs running or waiting in the pool."""
+        return self._in_flight
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == ExecutorKind.PROCESS:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="note-gen-generation"
+                )
+        return self._pool
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a function on the executor.
+
+        For process pools the function and its arguments must be picklable.
+
+        Raises:
+            GenerationBusyError: If max_queue jobs are already in flight
+        """
+        if self.kind == ExecutorKind.INLINE:
+            return func(*args)
+        if self._in_flight >= self.max_queue:
+            logger.warning(f"Generation queue full ({self._in_flight} jobs in flight)")
+            raise GenerationBusyError()
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), partial(func, *args))
+        finally:
+            self._in_flight -= 1
+
+    async def generate_many(
+        self,
+        requests: Sequence[GenerationRequest],
+        return_exceptions: bool = False
+    ) -> List[Union[NoteSequence, Exception]]:
+        """
+        Generate a batch of sequences on the executor.
+
+        See NoteSequenceGenerator.generate_many.
+
+        Raises:
+            ValueError: If a request fails and return_exceptions is False
+            GenerationBusyError: If the queue is full
+        """
+        if self.kind == ExecutorKind.INLINE:
+            return await NoteSequenceGenerator.generate_many(requests, return_exceptions)
+        if self.kind == ExecutorKind.THREAD:
+            results: List[Any] = await self.run(
+                NoteSequenceGenerator.generate_many_sync, list(requests), True
+            )
+        else:
+            encoded = await self.run(_generate_encoded, encode_requests(requests))
+            results = [
+                result if isinstance(result, ValueError) else decode_sequence(result)
+                for result in encoded
+            ]
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    async def generate(self, request: GenerationRequest) -> NoteSequence:
+        """
+        Generate one sequence on the executor.
+
+        Raises:
+            ValueError: If generation fails
+            GenerationBusyError: If the queue is full
+        """
+        results = await self.generate_many([request])
+        return results[0]  # type: ignore[return-value]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the pool down; it is recreated on next use."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+
+@lru_cache(maxsize=1)
+def get_generation_executor() -> GenerationExecutor:
+    """Get the shared executor configured by the application settings."""
+    settings = get_settings()
+    return GenerationExecutor(
+        kind=settings.generation_executor,
+        max_workers=settings.generation_max_workers,
+        max_queue=settings.generation_max_queue
+    )
+
+
+__all__ = [
+    'GenerationExecutor', 'get_generation_executor', 'encode_requests', 'decode_requests',
+    'encode_sequence', 'decode_sequence'
+]
@@ -0,0 +1,264 @@
+"""
+Content-addressed cache for generated sequences.
+
+Generation is a pure function of its resolved inputs, so a sequence is cached
+under a SHA-256 hash of the canonical JSON of the chord progression, note
+pattern and rhythm pattern (database ids excluded), the key, scale type,
+transpose and voicing mode. The names a caller asked for are aliased to that
+hash, so a repeated request can be answered without loading the inputs at all.
+
+Entries are bounded by an LRU size limit and a TTL. Each entry records the
+documents it was built from, and the repositories call :meth:`invalidate`
+when a document is created, updated or deleted, which drops every entry
+built from it. Invalidation only reaches the cache in the current process;
+the TTL bounds how stale other workers can be.
+"""
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from note_gen.core.config import get_settings
+from note_gen.core.enums import VoicingMode
+from note_gen.core.lru import CacheStats, LRUCache
+from note_gen.models.note_sequence import NoteSequence
+
+Dependency = Tuple[str, str]
+
+# Repository collection of each generation input
+PROGRESSION_COLLECTION = "chord_progressions"
+NOTE_PATTERN_COLLECTION = "note_patterns"
+RHYTHM_PATTERN_COLLECTION = "rhythm_patterns"
+
+
+def _canonical(model: Optional[BaseModel]) -> Any:
+    if model is None:
+        return None
+    return model.model_dump(mode='json', exclude={'id'})
+
+
+def model_key(model: Optional[BaseModel]) -> str:
+    """Stable content hash of one generation input, database id excluded."""
+    payload = json.dumps(_canonical(model), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def content_key(
+    chord_progression: BaseModel,
+    note_pattern: Optional[BaseModel],
+    rhythm_pattern: Optional[BaseModel],
+    key: str,
+    scale_type: Any,
+    transpose: Optional[int] = None,
+    voicing_mode: Any = VoicingMode.ROOT_POSITION
+) -> str:
+    """
+    Stable content hash of a generation's resolved inputs.
+
+    Equal inputs give equal keys across processes and restarts.
+    """
+    document = [
+        _canonical(chord_progression),
+        _canonical(note_pattern),
+        _canonical(rhythm_pattern),
+        key,
+        getattr(scale_type, 'value', scale_type),
+        transpose,
+        getattr(voicing_mode, 'value', voicing_mode)
+    ]
+    payload = json.dumps(document, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def input_dependencies(collection: str, model: Optional[BaseModel]) -> Set[Dependency]:
+    """The (collection, id) and (collection, name) a cached input depends on."""
+    if model is None:
+        return set()
+    dependencies = {(collection, f"name:{getattr(model, 'name', '')}")}
+    model_id = getattr(model, 'id', None)
+    if model_id:
+        dependencies.add((collection, f"id:{model_id}"))
+    return dependencies
+
+
+@dataclass
+class _Entry:
+    sequence: NoteSequence
+    expires_at: float
+    dependencies: Set[Dependency]
+    aliases: Set[Hashable] = field(default_factory=set)
+
+
+class GenerationCache:
+    """LRU + TTL cache of generated sequences, keyed by content hash."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is
+                evicted (0 disables caching)
+            ttl_seconds: Seconds an entry stays valid
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If a limit is negative or the TTL is not positive
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._entries: LRUCache[str, _Entry] = LRUCache(max_entries, on_evict=self._forget)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = self._entries.stats
+        self._clock = clock
+        self._aliases: Dict[Hashable, str] = {}
+        self._dependents: Dict[Dependency, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _live_entry(self, key: Optional[str]) -> Optional[_Entry]:
+        entry = self._entries.peek(key) if key is not None else None
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)  # type: ignore[arg-type]
+            self.stats.expirations += 1
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[NoteSequence]:
+        """Get a copy of the sequence cached under a content key, counting a hit or miss."""
+        self._live_entry(key)  # Drops the entry if it has expired, making this a miss
+        entry = self._entries.get(key)
+        return None if entry is None else entry.sequence.model_copy(deep=True)
+
+    def get_alias(self, alias: Hashable) -> Optional[NoteSequence]:
+        """
+        Get a copy of the sequence an alias points at, without counting a miss.
+
+        Callers fall back to resolving the inputs and calling :meth:`get`.
+        """
+        key = self._aliases.get(alias)
+        if self._live_entry(key) is None:
+            return None
+        return self.get(key)  # type: ignore[arg-type]
+
+    def put(
+        self,
+        key: str,
+        sequence: NoteSequence,
+        dependencies: Iterable[Dependency] = (),
+        alias: Optional[Hashable] = None
+    ) -> None:
+        """
+        Cache a copy of a sequence under a content key.
+
+        Args:
+            key: Content key from :func:`content_key`
+            sequence: The generated sequence
+            dependencies: Documents the sequence was built from
+            alias: Optional request key (e.g. the input names) for :meth:`get_alias`
+        """
+        if self.max_entries == 0:
+            return
+        entry = self._entries.peek(key)
+        if entry is None:
+            entry = _Entry(sequence=sequence.model_copy(deep=True), expires_at=0.0, dependencies=set())
+        else:
+            entry.sequence = sequence.model_copy(deep=True)
+        entry.expires_at = self._clock() + self.ttl_seconds
+        for dependency in dependencies:
+            entry.dependencies.add(dependency)
+            self._dependents.setdefault(dependency, set()).add(key)
+        if alias is not None:
+            previous = self._aliases.get(alias)
+            previous_entry = self._entries.peek(previous) if previous is not None and previous != key else None
+            if previous_entry is not None:
+                previous_entry.aliases.discard(alias)
+            self._aliases[alias] = key
+            entry.aliases.add(alias)
+        self._entries.put(key, entry)
+
+    def invalidate(self, collection: str, document_id: Optional[str] = None,
+                   name: Optional[str] = None) -> int:
+        """
+        Drop every entry built from a document.
+
+        Args:
+            collection: Repository collection name
+            document_id: The document's id
+            name: The document's name
+
+        Returns:
+            Number of entries dropped
+        """
+        dependencies = []
+        if document_id:
+            dependencies.append((collection, f"id:{document_id}"))
+        if name is not None:
+            dependencies.append((collection, f"name:{name}"))
+        keys = set()
+        for dependency in dependencies:
+            keys.update(self._dependents.get(dependency, ()))
+        for key in keys:
+            self._remove(key)
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry (the stats are kept)."""
+        self._entries.clear()
+        self._aliases.clear()
+        self._dependents.clear()
+
+    def _remove(self, key: str) -> None:
+        self._forget(key, self._entries.pop(key))
+
+    def _forget(self, key: str, entry: _Entry) -> None:
+        """Drop the aliases and dependencies of an entry leaving the cache."""
+        for alias in entry.aliases:
+            if self._aliases.get(alias) == key:
+                del self._aliases[alias]
+        for dependency in entry.dependencies:
+            dependents = self._dependents.get(dependency)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[dependency]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Size, limits and counters, for monitoring."""
+        return {
+            **self._entries.metrics(),
+            "ttl_seconds": self.ttl_seconds,
+            "expirations": self.stats.expirations,
+            "invalidations": self.stats.invalidations
+        }
+
+
+@lru_cache(maxsize=1)
+def get_generation_cache() -> GenerationCache:
+    """Get the shared cache configured by the application settings."""
+    settings = get_settings()
+    return GenerationCache(
+        max_entries=settings.generation_cache_size,
+        ttl_seconds=settings.generation_cache_ttl
+    )
+
+
+__all__ = [
+    'GenerationCache', 'CacheStats', 'content_key', 'model_key', 'input_dependencies', 'get_generation_cache',
+    'PROGRESSION_COLLECTION', 'NOTE_PATTERN_COLLECTION', 'RHYTHM_PATTERN_COLLECTION'
+]
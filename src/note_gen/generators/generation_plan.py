@@ -0,0 +1,272 @@
+"""
+Compiled generation plans.
+
+:meth:`NoteSequenceGenerator.compile_plan` interprets a (chord progression,
+note pattern, rhythm pattern) triple once, producing a :class:`GenerationPlan`:
+the chord tone of every note (as indices into its distinct tones), the tiled duration and position columns
+and the accent mask. None of it depends on the scale, so one plan serves every
+:class:`ScaleInfo` and transposition; :meth:`GenerationPlan.execute` only
+picks each note's spelling, adds the transposition and materializes the
+notes in a single validation pass. Plans are immutable and picklable, so they
+can be cached or sent to worker processes.
+
+Chord roots are absolute in a ChordProgression, so the plan keeps pitches
+rather than scale degrees: the scale decides how notes are spelled, exactly
+as in :meth:`NoteSequenceGenerator.generate`, whose output
+:meth:`GenerationPlan.execute` matches note for note.
+
+:meth:`GenerationPlan.fan_out` produces many transpositions of one plan. The
+timing columns are shared and each key only remaps the plan's distinct tones,
+so all 12 keys cost little more than one.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
+
+from note_gen.core.constants import MIDI_MAX, MIDI_MIN, NOTE_TO_SEMITONE
+from note_gen.core.enums import RangePolicy
+from note_gen.core.pitch import Pitch
+from note_gen.core.spelling import get_spelling, transpose_key
+from note_gen.generators.vectorized_engine import ACCENT_VELOCITY, BASE_VELOCITY, MAX_VELOCITY
+from note_gen.models.note_array import NoteArray, _require_numpy, np
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.scale_info import ScaleInfo
+from note_gen.validation.validation_manager import ValidationManager
+
+# Velocities of unaccented and accented notes
+_VELOCITIES = (BASE_VELOCITY, min(BASE_VELOCITY + ACCENT_VELOCITY, MAX_VELOCITY))
+
+# (name, octave, MIDI number) of a spelled tone
+SpelledTone = Tuple[str, int, int]
+
+
+def _fit_range(midi: int, policy: RangePolicy) -> int:
+    """Bring a MIDI number into range according to the policy."""
+    if MIDI_MIN <= midi <= MIDI_MAX:
+        return midi
+    if policy == RangePolicy.FOLD:
+        if midi < MIDI_MIN:
+            return midi + 12 * -((midi - MIDI_MIN) // 12)
+        return midi - 12 * -((MIDI_MAX - midi) // 12)
+    if policy == RangePolicy.CLAMP:
+        return min(max(midi, MIDI_MIN), MIDI_MAX)
+    raise ValueError(f"MIDI number must be between {MIDI_MIN} and {MIDI_MAX}")
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """A key-independent, compiled form of a generator's inputs.
+
+    Attributes:
+        tones: The distinct chord tones, as generated (before spelling)
+        tone_indices: Index into tones of every note
+        durations: Duration of every note
+        positions: Position of every note
+        accents: Whether each note is accented
+        respell: Whether notes are spelled in the key (the note pattern is non-empty)
+        progression_name: Name of the compiled chord progression
+        note_pattern_name: Name of the compiled note pattern
+        rhythm_pattern_name: Name of the compiled rhythm pattern
+        time_signature: Time signature of the rhythm pattern
+        voice_leading_rules: Rules each execution is validated against
+    """
+    tones: Tuple[Pitch, ...]
+    tone_indices: Tuple[int, ...]
+    durations: Tuple[float, ...]
+    positions: Tuple[float, ...]
+    accents: Tuple[bool, ...]
+    respell: bool
+    progression_name: str
+    note_pattern_name: str
+    rhythm_pattern_name: str
+    time_signature: Tuple[int, int]
+    voice_leading_rules: Tuple[Any, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.tone_indices)
+
+    @classmethod
+    def from_pitches(cls, pitches: Sequence[Pitch], **fields: Any) -> 'GenerationPlan':
+        """Create a plan from every note's chord tone, indexing the distinct ones."""
+        index: Dict[Pitch, int] = {}
+        tone_indices = tuple(index.setdefault(pitch, len(index)) for pitch in pitches)
+        return cls(tones=tuple(index), tone_indices=tone_indices, **fields)
+
+    @property
+    def total_duration(self) -> float:
+        """Sum of note durations."""
+        return sum(self.durations)
+
+    def execute(self, scale_info: ScaleInfo, transpose: Optional[int] = None) -> NoteSequence:
+        """
+        Generate the sequence for a scale and transposition.
+
+        Args:
+            scale_info: Scale whose spelling the notes take
+            transpose: Semitones to transpose by (transposed notes are spelled
+                with sharps, as by Note.transpose)
+
+        Returns:
+            The sequence NoteSequenceGenerator.generate would return
+
+        Raises:
+            ValueError: If a note leaves the MIDI range or the sequence fails validation
+        """
+        # (name, octave, MIDI number) of each distinct chord tone
+        if transpose:
+            if not all(MIDI_MIN <= tone.midi + transpose <= MIDI_MAX for tone in self.tones):
+                raise ValueError(f"MIDI number must be between {MIDI_MIN} and {MIDI_MAX}")
+            targets = [Pitch.from_midi(tone.midi + transpose) for tone in self.tones]
+            spelled = [(target.name, target.octave, target.midi) for target in targets]
+        elif self.respell:
+            names = scale_info.get_table().spelling
+            spelled = [(names[NOTE_TO_SEMITONE[tone.name]], tone.octave, tone.midi) for tone in self.tones]
+        else:
+            spelled = [(tone.name, tone.octave, tone.midi) for tone in self.tones]
+
+        sequence = self._materialize(spelled, self._timing(), scale_info)
+        self._check(sequence)
+        return sequence
+
+    def fan_out(
+        self,
+        scale_info: ScaleInfo,
+        transpositions: Iterable[int] = range(12),
+        range_policy: Union[RangePolicy, str] = RangePolicy.FOLD
+    ) -> Dict[int, NoteSequence]:
+        """
+        Generate the sequence in many keys from one plan.
+
+        Every transposition shares the plan's duration, position and velocity
+        columns; only the distinct tones are moved, fitted to the MIDI range
+        and spelled in the transposed key (see
+        :func:`~note_gen.core.spelling.transpose_key`), including the
+        untransposed sequence. Sequences are validated once, or once per key
+        when the plan has voice-leading rules.
+
+        Args:
+            scale_info: Scale of the untransposed sequence
+            transpositions: Semitone offsets to generate
+            range_policy: What happens to notes that leave the MIDI range
+
+        Returns:
+            Each requested offset's sequence, whose scale_info is the transposed key
+
+        Raises:
+            ValueError: If a note leaves the MIDI range under RangePolicy.ERROR,
+                or a sequence fails validation
+        """
+        range_policy = RangePolicy(range_policy)
+        timing = self._timing()
+        scale_type = scale_info.scale_type
+        sequences: Dict[int, NoteSequence] = {}
+        for offset in dict.fromkeys(transpositions):
+            key = transpose_key(scale_info.key, offset, scale_type)
+            names = get_spelling(key, scale_type)
+            spelled = []
+            for tone in self.tones:
+                midi = _fit_range(tone.midi + offset, range_policy)
+                spelled.append((names[midi % 12], midi // 12 - 1, midi))
+            sequence = self._materialize(spelled, timing, ScaleInfo(key=key, scale_type=scale_type))
+            if not sequences or self.voice_leading_rules:
+                self._check(sequence)
+            sequences[offset] = sequence
+        return sequences
+
+    def fan_out_arrays(
+        self,
+        scale_info: ScaleInfo,
+        transpositions: Iterable[int] = range(12),
+        range_policy: Union[RangePolicy, str] = RangePolicy.FOLD
+    ) -> Dict[int, NoteArray]:
+        """
+        Columnar :meth:`fan_out`, for bulk export of many keys.
+
+        The arrays share one set of read-only duration, velocity, position
+        and channel columns; each key only adds its MIDI and spelling columns,
+        gathered from the plan's distinct tones. Voice-leading rules are not
+        applied; :meth:`fan_out` returns validated sequences.
+
+        Args:
+            scale_info: Scale of the untransposed sequence
+            transpositions: Semitone offsets to generate
+            range_policy: What happens to notes that leave the MIDI range
+
+        Returns:
+            Each requested offset's notes
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If a note leaves the MIDI range under RangePolicy.ERROR
+        """
+        _require_numpy()
+        range_policy = RangePolicy(range_policy)
+        size = len(self)
+        shared = []
+        for column in (
+            np.asarray(self.durations, dtype=np.float64),
+            np.asarray([_VELOCITIES[accent] for accent in self.accents], dtype=np.int16),
+            np.asarray(self.positions, dtype=np.float64),
+            np.zeros(size, dtype=np.int8)
+        ):
+            column.flags.writeable = False
+            shared.append(column)
+        duration, velocity, position, channel = shared
+        tone_indices = np.asarray(self.tone_indices, dtype=np.intp)
+        tone_midi = [tone.midi for tone in self.tones]
+
+        arrays: Dict[int, NoteArray] = {}
+        for offset in dict.fromkeys(transpositions):
+            key = transpose_key(scale_info.key, offset, scale_info.scale_type)
+            flats = np.array([name.endswith('b') for name in get_spelling(key, scale_info.scale_type)])
+            midi = np.array([_fit_range(m + offset, range_policy) for m in tone_midi], dtype=np.int16)[tone_indices]
+            arrays[offset] = NoteArray._from_columns(midi, duration, velocity, position, channel, flats[midi % 12])
+        return arrays
+
+    def _timing(self) -> List[Tuple[float, int, float]]:
+        """(duration, velocity, position) of every note, shared by every key."""
+        return [
+            (duration, _VELOCITIES[accent], position)
+            for duration, position, accent in zip(self.durations, self.positions, self.accents)
+        ]
+
+    def _materialize(
+        self,
+        spelled: Sequence[SpelledTone],
+        timing: Sequence[Tuple[float, int, float]],
+        scale_info: ScaleInfo
+    ) -> NoteSequence:
+        """Build the sequence from each distinct tone's spelling and the timing columns."""
+        rows: List[Dict[str, Any]] = []
+        for tone, (duration, velocity, position) in zip(self.tone_indices, timing):
+            name, octave, midi = spelled[tone]
+            rows.append({
+                'pitch': name,
+                'octave': octave,
+                'duration': duration,
+                'velocity': velocity,
+                'position': position,
+                'stored_midi_number': midi
+            })
+
+        return NoteSequence(
+            id=str(uuid4())[:8],
+            name=f"Generated Sequence {self.note_pattern_name}",
+            notes=rows,
+            duration=self.total_duration,
+            tempo=120,  # Default tempo
+            time_signature=self.time_signature,
+            scale_info=scale_info.model_dump(),
+            progression_name=self.progression_name,
+            note_pattern_name=self.note_pattern_name,
+            rhythm_pattern_name=self.rhythm_pattern_name
+        )
+
+    def _check(self, sequence: NoteSequence) -> None:
+        """Raise if a sequence fails validation."""
+        result = ValidationManager.validate_sequence(sequence.notes, list(self.voice_leading_rules))
+        if not result.is_valid:
+            raise ValueError(f"Generated sequence validation failed: {result.violations}")
+
+
+__all__ = ['GenerationPlan']
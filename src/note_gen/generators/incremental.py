@@ -0,0 +1,253 @@
+"""
+Incremental re-generation of note sequences.
+
+A sequence is generated chord by chord: each progression item contributes one
+segment (its root and voicing, spelled and transposed), and the rhythm
+pattern is then laid over the notes in order. :class:`IncrementalSequence`
+keeps each segment's boundaries and its untimed notes, so editing one chord
+regenerates only that segment and splices it in. Notes after the edit point
+keep their pitches and are reused as they are when the edit leaves them in
+place; otherwise they are moved to their new positions, and their durations
+and accents change too when the edit shifts the rhythm pattern's phase (a
+note count change that is not a multiple of the pattern length).
+
+Only the window of notes whose pitch, duration or velocity changed is
+revalidated, together with one neighbour on each side (as with
+:meth:`NoteSequenceGenerator.iter_chunks`). An edit that fails validation
+leaves the sequence unchanged.
+
+Every edit returns a new NoteSequence equal to a full regeneration of the
+edited inputs; notes before the edit point are shared with the previous one.
+
+Segments must be independent of each other, so voice-led generation (where
+one edited chord can change the voicing of every other) is not supported.
+"""
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from note_gen.core.enums import VoicingMode
+from note_gen.core.spelling import respell_notes
+from note_gen.generators.vectorized_engine import ACCENT_VELOCITY, MAX_VELOCITY
+from note_gen.models.chord_progression_item import ChordProgressionItem
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.rhythm import RhythmNote
+from note_gen.models.scale_info import ScaleInfo
+
+if TYPE_CHECKING:
+    from note_gen.generators.note_sequence_generator import NoteSequenceGenerator
+
+
+class IncrementalSequence:
+    """A generated sequence that can be edited chord by chord."""
+
+    def __init__(
+        self,
+        generator: 'NoteSequenceGenerator',
+        scale_info: Optional[ScaleInfo] = None,
+        transpose: Optional[int] = None
+    ):
+        """
+        Generate the initial sequence.
+
+        Args:
+            generator: Generator holding the progression and patterns
+            scale_info: Scale to generate in (defaults to the progression's)
+            transpose: Semitones to transpose by
+
+        Raises:
+            ValueError: If the inputs are invalid, the generator is voice-led or
+                the sequence fails validation
+        """
+        if generator.voicing_mode == VoicingMode.VOICE_LED:
+            raise ValueError("Incremental generation requires root-position voicing")
+        if scale_info is None:
+            scale_info = generator.chord_progression.scale_info
+        if scale_info is None:
+            raise ValueError("scale_info must be provided either in constructor or generate method")
+        if not generator.chord_progression.items:
+            raise ValueError("Chord progression cannot be empty")
+
+        self.generator = generator
+        self.scale_info = scale_info
+        self.transpose = transpose
+        self._spelling = scale_info.get_table().spelling if generator.note_pattern.pattern else None
+
+        # Untimed notes, and the index of each segment's first note (plus the end)
+        self._pitched: List[Note] = []
+        self._starts: List[int] = [0]
+        for item in generator.chord_progression.items:
+            self._pitched.extend(self._segment(item))
+            self._starts.append(len(self._pitched))
+
+        # Timed notes, and the running position before each note (plus the end)
+        self._notes, self._onsets = self._retime(self._pitched, [], [0.0], 0)
+        generator._check_sequence(self._notes)
+        self.sequence = generator._create_note_sequence(self._notes, scale_info)
+
+    @property
+    def segments(self) -> List[Tuple[int, int]]:
+        """The (start, end) note indices of each progression item's segment."""
+        return list(zip(self._starts, self._starts[1:]))
+
+    def replace_chord(self, index: int, item: ChordProgressionItem) -> NoteSequence:
+        """
+        Replace one progression item and regenerate its segment.
+
+        Raises:
+            IndexError: If there is no item at index
+            ValueError: If the edited sequence fails validation
+        """
+        items = list(self.generator.chord_progression.items)
+        items[index] = item
+        return self._splice(index % len(self._starts[1:]), 1, item, items)
+
+    def insert_chord(self, index: int, item: ChordProgressionItem) -> NoteSequence:
+        """
+        Insert a progression item before index and generate its segment.
+
+        Raises:
+            ValueError: If the edited sequence fails validation
+        """
+        items = list(self.generator.chord_progression.items)
+        index = max(0, min(index, len(items)))
+        items.insert(index, item)
+        return self._splice(index, 0, item, items)
+
+    def remove_chord(self, index: int) -> NoteSequence:
+        """
+        Remove a progression item and its segment.
+
+        Raises:
+            IndexError: If there is no item at index
+            ValueError: If it is the only item, or the edited sequence fails validation
+        """
+        items = list(self.generator.chord_progression.items)
+        if len(items) == 1:
+            raise ValueError("Chord progression cannot be empty")
+        del items[index]
+        return self._splice(index % (len(items) + 1), 1, None, items)
+
+    def replace_rhythm_note(self, index: int, rhythm_note: RhythmNote) -> NoteSequence:
+        """
+        Replace one rhythm pattern element and re-time the notes it governs.
+
+        Pitches are kept; notes from the first one using the element onward
+        are re-timed and revalidated.
+
+        Raises:
+            IndexError: If there is no rhythm element at index
+            ValueError: If the edited sequence fails validation
+        """
+        rhythm_pattern = self.generator.rhythm_pattern
+        pattern = list(rhythm_pattern.pattern)
+        pattern[index] = rhythm_note
+        first = index % len(pattern)
+        generator = self.generator.model_copy(update={
+            'rhythm_pattern': rhythm_pattern.model_validate({**dict(rhythm_pattern), 'pattern': pattern})
+        })
+        start = min(first, len(self._pitched))
+        notes, onsets = self._retime(
+            self._pitched, self._notes[:start], self._onsets[:start + 1], start, generator
+        )
+        self._check_window(notes, start, len(notes))
+        self.generator = generator
+        return self._commit(self._pitched, self._starts, notes, onsets)
+
+    def _splice(
+        self,
+        index: int,
+        removed: int,
+        item: Optional[ChordProgressionItem],
+        items: List[ChordProgressionItem]
+    ) -> NoteSequence:
+        """Replace `removed` segments at index with the segment for item (if any)."""
+        start, end = self._starts[index], self._starts[index + removed]
+        segment = self._segment(item) if item is not None else []
+        pitched = self._pitched[:start] + segment + self._pitched[end:]
+        delta = len(segment) - (end - start)
+        starts = (
+            self._starts[:index + 1]
+            + ([start + len(segment)] if item is not None else [])
+            + [boundary + delta for boundary in self._starts[index + removed + 1:]]
+        )
+
+        stop = start + len(segment)
+        notes, onsets = self._retime(
+            pitched, self._notes[:start], self._onsets[:start + 1], start, stop=stop
+        )
+
+        # Later notes keep their rhythm steps unless the pattern's phase moved,
+        # and are reused as they are if they also keep their positions
+        rhythm_length = len(self.generator.rhythm_pattern.pattern)
+        in_phase = not rhythm_length or delta % rhythm_length == 0
+        if in_phase and onsets[-1] == self._onsets[end]:
+            notes.extend(self._notes[end:])
+            onsets.extend(self._onsets[end + 1:])
+        else:
+            self._retime(pitched, notes, onsets, stop)
+        self._check_window(notes, start, stop if in_phase else len(notes))
+
+        self.generator = self.generator.model_copy(update={
+            'chord_progression': self.generator.chord_progression.model_copy(update={'items': items})
+        })
+        return self._commit(pitched, starts, notes, onsets)
+
+    def _segment(self, item: ChordProgressionItem) -> List[Note]:
+        """Generate one item's untimed notes, spelled and transposed."""
+        notes = list(self.generator._iter_item_notes(item))
+        if self._spelling is not None:
+            notes = respell_notes(notes, self.scale_info.key, table=self._spelling)
+        if self.transpose:
+            notes = self.generator._transpose_sequence(notes, self.transpose)
+        return notes
+
+    def _retime(
+        self,
+        pitched: List[Note],
+        notes: List[Note],
+        onsets: List[float],
+        start: int,
+        generator: Optional['NoteSequenceGenerator'] = None,
+        stop: Optional[int] = None
+    ) -> Tuple[List[Note], List[float]]:
+        """Lay the rhythm pattern over pitched[start:stop], appending to notes and onsets."""
+        rhythm = (generator or self.generator).rhythm_pattern.pattern
+        running = onsets[-1]
+        for i in range(start, len(pitched) if stop is None else stop):
+            note = pitched[i]
+            if rhythm:
+                step = rhythm[i % len(rhythm)]
+                velocity = note.velocity
+                if step.accent:
+                    velocity = min(velocity + ACCENT_VELOCITY, MAX_VELOCITY)
+                note = note.model_copy(update={
+                    'duration': step.duration,
+                    'position': running + step.position,
+                    'velocity': velocity
+                })
+            notes.append(note)
+            running += note.duration
+            onsets.append(running)
+        return notes, onsets
+
+    def _check_window(self, notes: List[Note], start: int, end: int) -> None:
+        """Validate notes[start:end] with one neighbour on each side."""
+        self.generator._check_sequence(notes[max(start - 1, 0):end + 1])
+
+    def _commit(
+        self,
+        pitched: List[Note],
+        starts: List[int],
+        notes: List[Note],
+        onsets: List[float]
+    ) -> NoteSequence:
+        self._pitched, self._starts, self._notes, self._onsets = pitched, starts, notes, onsets
+        self.sequence = self.sequence.model_copy(update={
+            'notes': notes,
+            'duration': sum(note.duration for note in notes),
+            'time_signature': self.generator.rhythm_pattern.time_signature
+        })
+        return self.sequence
+
+
+__all__ = ['IncrementalSequence']
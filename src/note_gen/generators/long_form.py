@@ -0,0 +1,335 @@
+"""
+Long-form generation in bounded memory.
+
+A long piece is generated in chunks of a fixed number of bars, a bar being one
+progression item. Each chunk becomes its own NoteSequence and is handed to a
+sink (typically a repository's ``upsert``) as soon as it is complete. Only one
+chunk is held at a time, so memory stays flat however long the piece is, and
+no single document grows with the piece (MongoDB caps documents at 16 MB).
+
+Chords come from the generator's progression, repeated bar by bar, or, when a
+genre is given, from that genre's Markov model, whose chain continues across
+chunk boundaries. Notes are timed and validated as if the piece were one
+sequence: each chunk continues the previous chunk's rhythm phase and running
+position, and is validated together with the previous chunk's last note.
+Voice-led generators lead voices within each chunk.
+
+After each chunk is persisted, a :class:`LongFormCheckpoint` is saved. It
+records where the next chunk starts, the last note, and the RNG and Markov
+state, so a crashed job resumes after the last completed chunk and produces
+the same piece. A crash between persisting a chunk and saving its checkpoint
+regenerates that chunk on resume. Chunk sequences have deterministic ids
+(``"<job id>-<chunk index>"``), so a sink can upsert them.
+"""
+import asyncio
+import os
+import random
+import tempfile
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from note_gen.core.config import get_settings
+from note_gen.core.enums import ChordQuality
+from note_gen.core.spelling import respell_notes
+from note_gen.generators.markov_progression import Seed, get_markov_model
+from note_gen.generators.note_sequence_generator import NoteSequenceGenerator
+from note_gen.models.chord import Chord
+from note_gen.models.chord_progression_item import ChordProgressionItem
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.scale_info import ScaleInfo
+
+# Bars generated and persisted together
+DEFAULT_CHUNK_BARS = 64
+
+ChunkSink = Callable[[NoteSequence], Awaitable[Any]]
+
+
+class LongFormCheckpoint(BaseModel):
+    """Where a long-form job stands after its last completed chunk."""
+    job_id: str
+    total_bars: int = Field(gt=0)
+    chunk_bars: int = Field(gt=0)
+    chunk: int = 0  # Index of the next chunk
+    bar: int = 0  # First bar of the next chunk
+    note_index: int = 0  # Notes generated so far (the rhythm pattern's phase)
+    position: float = 0.0  # Running position after the notes generated so far
+    last_note: Optional[Note] = None  # Validated together with the next chunk
+    rng_state: Optional[List[Any]] = None  # random.Random state, when chords are sampled
+    last_state: Optional[Tuple[int, ChordQuality]] = None  # Markov state the next chunk continues from
+
+    @property
+    def complete(self) -> bool:
+        """Whether every bar has been generated."""
+        return self.bar >= self.total_bars
+
+
+class CheckpointStore(Protocol):
+    """Somewhere long-form checkpoints are kept between runs."""
+
+    async def load(self, job_id: str) -> Optional[LongFormCheckpoint]:
+        """Get a job's last checkpoint, if any."""
+        ...
+
+    async def save(self, checkpoint: LongFormCheckpoint) -> None:
+        """Replace a job's checkpoint."""
+        ...
+
+
+class MemoryCheckpointStore:
+    """Checkpoints kept in this process only."""
+
+    def __init__(self) -> None:
+        self._checkpoints: Dict[str, str] = {}
+
+    async def load(self, job_id: str) -> Optional[LongFormCheckpoint]:
+        """Get a job's last checkpoint, if any."""
+        data = self._checkpoints.get(job_id)
+        return None if data is None else LongFormCheckpoint.model_validate_json(data)
+
+    async def save(self, checkpoint: LongFormCheckpoint) -> None:
+        """Replace a job's checkpoint."""
+        self._checkpoints[checkpoint.job_id] = checkpoint.model_dump_json()
+
+
+class FileCheckpointStore:
+    """Checkpoints kept as one JSON file per job, replaced atomically."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def _path(self, job_id: str) -> str:
+        if not job_id or os.sep in job_id or job_id.startswith('.'):
+            raise ValueError(f"Invalid job id: {job_id!r}")
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    async def load(self, job_id: str) -> Optional[LongFormCheckpoint]:
+        """Get a job's last checkpoint, if any."""
+        try:
+            with open(self._path(job_id), encoding='utf-8') as file:
+                return LongFormCheckpoint.model_validate_json(file.read())
+        except FileNotFoundError:
+            return None
+
+    async def save(self, checkpoint: LongFormCheckpoint) -> None:
+        """Replace a job's checkpoint, so a crash never leaves a partial file."""
+        path = self._path(checkpoint.job_id)
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+                file.write(checkpoint.model_dump_json())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+def _dump_rng(rng: random.Random) -> List[Any]:
+    version, internal, gauss = rng.getstate()
+    return [version, list(internal), gauss]
+
+
+def _load_rng(state: List[Any]) -> random.Random:
+    rng = random.Random()
+    version, internal, gauss = state
+    rng.setstate((version, tuple(internal), gauss))
+    return rng
+
+
+class LongFormGenerator:
+    """Generates a piece of any length chunk by chunk, with resumable checkpoints."""
+
+    def __init__(
+        self,
+        generator: NoteSequenceGenerator,
+        total_bars: int,
+        scale_info: Optional[ScaleInfo] = None,
+        chunk_bars: int = DEFAULT_CHUNK_BARS,
+        transpose: Optional[int] = None,
+        genre: Optional[str] = None,
+        seed: Seed = None,
+        job_id: Optional[str] = None
+    ):
+        """
+        Set up a long-form job.
+
+        Args:
+            generator: Generator holding the progression (repeated unless a
+                genre is given), patterns and voicing mode
+            total_bars: Length of the piece in bars (progression items)
+            scale_info: Scale to generate in (defaults to the progression's)
+            chunk_bars: Bars per chunk
+            transpose: Semitones to transpose by
+            genre: Sample chords from this genre's Markov model instead of
+                repeating the progression
+            seed: Seed for the Markov chords, for reproducible output
+            job_id: Id the checkpoint is kept under (defaults to a new one)
+
+        Raises:
+            ValueError: If the inputs are invalid
+        """
+        if scale_info is None:
+            scale_info = generator.chord_progression.scale_info
+        if scale_info is None:
+            raise ValueError("scale_info must be provided either in constructor or generate method")
+        if total_bars < 1 or chunk_bars < 1:
+            raise ValueError("Bar counts must be positive")
+        if genre is None and not generator.chord_progression.items:
+            raise ValueError("Chord progression cannot be empty")
+
+        self.generator = generator
+        self.total_bars = total_bars
+        self.scale_info = scale_info
+        self.chunk_bars = chunk_bars
+        self.transpose = transpose
+        self.genre = genre
+        self.seed = seed
+        self.job_id = job_id or str(uuid4())
+        self._model = get_markov_model(genre) if genre is not None else None
+        self._spelling = scale_info.get_table().spelling if generator.note_pattern.pattern else None
+
+    def start(self) -> LongFormCheckpoint:
+        """The checkpoint of a job that has not generated anything yet."""
+        rng = self.seed if isinstance(self.seed, random.Random) else random.Random(self.seed)
+        return LongFormCheckpoint(
+            job_id=self.job_id,
+            total_bars=self.total_bars,
+            chunk_bars=self.chunk_bars,
+            rng_state=_dump_rng(rng) if self._model is not None else None
+        )
+
+    def iter_chunks(
+        self,
+        checkpoint: Optional[LongFormCheckpoint] = None
+    ) -> Iterator[Tuple[NoteSequence, LongFormCheckpoint]]:
+        """
+        Generate the remaining chunks lazily, each with the checkpoint after it.
+
+        Args:
+            checkpoint: Where to resume (defaults to the start of the piece)
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different job or a
+                chunk fails validation
+        """
+        if checkpoint is None:
+            checkpoint = self.start()
+        elif (checkpoint.job_id, checkpoint.total_bars, checkpoint.chunk_bars) != (
+            self.job_id, self.total_bars, self.chunk_bars
+        ):
+            raise ValueError(f"Checkpoint does not match long-form job {self.job_id}")
+
+        while not checkpoint.complete:
+            sequence, checkpoint = self._generate_chunk(checkpoint)
+            yield sequence, checkpoint
+
+    async def run(
+        self,
+        sink: ChunkSink,
+        store: Optional[CheckpointStore] = None
+    ) -> LongFormCheckpoint:
+        """
+        Generate and persist the piece, resuming from the store's checkpoint.
+
+        Each chunk is passed to sink, then its checkpoint is saved.
+
+        Args:
+            sink: Persists one chunk, e.g. a repository's upsert
+            store: Where checkpoints are kept (defaults to the shared store)
+
+        Returns:
+            The final checkpoint
+
+        Raises:
+            ValueError: If a chunk fails validation
+        """
+        if store is None:
+            store = get_checkpoint_store()
+        checkpoint = await store.load(self.job_id) or self.start()
+        for sequence, following in self.iter_chunks(checkpoint):
+            await sink(sequence)
+            await store.save(following)
+            checkpoint = following
+            # Let other tasks run between chunks of a long piece
+            await asyncio.sleep(0)
+        return checkpoint
+
+    def _chunk_items(
+        self,
+        checkpoint: LongFormCheckpoint,
+        bars: int
+    ) -> Tuple[List[ChordProgressionItem], Dict[str, Any]]:
+        """The chunk's progression items, and the chord-source fields of the next checkpoint."""
+        if self._model is None:
+            items = self.generator.chord_progression.items
+            return [items[bar % len(items)] for bar in range(checkpoint.bar, checkpoint.bar + bars)], {}
+
+        rng = _load_rng(checkpoint.rng_state) if checkpoint.rng_state is not None else random.Random(self.seed)
+        states = self._model.sample(bars, rng, after=checkpoint.last_state)
+        table = self.scale_info.get_table()
+        items = []
+        for offset, (degree, quality) in enumerate(states):
+            chord = Chord(root=table.pitch_at(degree).name, quality=quality)
+            items.append(ChordProgressionItem(
+                chord_symbol=chord.to_symbol(), chord=chord, position=float(checkpoint.bar + offset)
+            ))
+        return items, {'rng_state': _dump_rng(rng), 'last_state': states[-1]}
+
+    def _generate_chunk(self, checkpoint: LongFormCheckpoint) -> Tuple[NoteSequence, LongFormCheckpoint]:
+        """Generate the chunk a checkpoint points at, and the checkpoint after it."""
+        bars = min(self.chunk_bars, self.total_bars - checkpoint.bar)
+        items, chord_source = self._chunk_items(checkpoint, bars)
+        generator = self.generator.model_copy(update={
+            'chord_progression': self.generator.chord_progression.model_copy(update={'items': items})
+        })
+
+        notes = list(generator._iter_rhythm(
+            generator._iter_chord_notes(), checkpoint.note_index, checkpoint.position
+        ))
+        if self._spelling is not None:
+            notes = respell_notes(notes, self.scale_info.key, table=self._spelling)
+        if self.transpose:
+            notes = generator._transpose_sequence(notes, self.transpose)
+        generator._check_sequence(notes if checkpoint.last_note is None else [checkpoint.last_note] + notes)
+
+        # Continue the running position exactly as one long sequence would
+        position = checkpoint.position
+        for note in notes:
+            position += note.duration
+
+        first_bar, end_bar = checkpoint.bar, checkpoint.bar + bars
+        sequence = generator._create_note_sequence(notes, self.scale_info)
+        sequence.id = f"{self.job_id}-{checkpoint.chunk}"
+        sequence.name = f"{sequence.name} (bars {first_bar + 1}-{end_bar})"
+        sequence.metadata = {
+            'long_form': {
+                'job_id': self.job_id, 'chunk': checkpoint.chunk, 'first_bar': first_bar,
+                'bars': bars, 'total_bars': self.total_bars, 'start_position': checkpoint.position
+            }
+        }
+
+        following = checkpoint.model_copy(update={
+            'chunk': checkpoint.chunk + 1,
+            'bar': end_bar,
+            'note_index': checkpoint.note_index + len(notes),
+            'position': position,
+            'last_note': notes[-1] if notes else checkpoint.last_note,
+            **chord_source
+        })
+        return sequence, following
+
+
+@lru_cache(maxsize=1)
+def get_checkpoint_store() -> CheckpointStore:
+    """Get the shared store configured by the application settings."""
+    return FileCheckpointStore(get_settings().generation_checkpoint_dir)
+
+
+__all__ = [
+    'DEFAULT_CHUNK_BARS', 'LongFormCheckpoint', 'CheckpointStore', 'MemoryCheckpointStore',
+    'FileCheckpointStore', 'LongFormGenerator', 'get_checkpoint_store'
+]
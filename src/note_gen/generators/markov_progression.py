@@ -0,0 +1,253 @@
+"""
+Markov-chain chord progression model.
+
+States are (scale degree, ChordQuality) pairs. Each genre's transition
+matrix is counted from its pattern in ``GENRE_PATTERNS`` (weighted higher)
+plus every progression in ``COMMON_PROGRESSIONS``, with each progression read
+cyclically so every state has a successor. Optional smoothing adds a
+pseudo-count towards every state seen in any corpus, so higher values wander
+further from the genre's idiom.
+
+Every row of the matrix (and the start distribution) is compiled into a Vose
+alias table, so drawing the next chord is O(1): one uniform column and one
+biased coin. :meth:`MarkovProgressionModel.sample_many` draws whole batches
+as array operations when numpy is installed.
+
+Sampling is reproducible for a given seed; ``sample`` (Python's ``random``)
+and ``sample_many`` (numpy's generator) use different random streams.
+"""
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from note_gen.core.constants import COMMON_PROGRESSIONS, GENRE_PATTERNS
+from note_gen.core.enums import ChordQuality, ScaleType
+from note_gen.core.scale_catalog import get_scale_table
+from note_gen.models.note_array import HAS_NUMPY, np
+
+State = Tuple[int, ChordQuality]
+Seed = Union[int, random.Random, None]
+
+# Count weight of a genre's own pattern relative to the common progressions
+GENRE_WEIGHT = 3.0
+
+
+@dataclass(frozen=True, slots=True)
+class AliasTable:
+    """Vose alias table for O(1) sampling from a discrete distribution.
+
+    Attributes:
+        probability: Chance of keeping each column when it is drawn
+        alias: Outcome used instead when the column is not kept
+    """
+    probability: Tuple[float, ...]
+    alias: Tuple[int, ...]
+
+    @classmethod
+    def from_weights(cls, weights: Sequence[float]) -> 'AliasTable':
+        """
+        Build a table from non-negative weights.
+
+        Raises:
+            ValueError: If the weights are empty, negative or all zero
+        """
+        total = float(sum(weights))
+        if not weights or total <= 0 or min(weights) < 0:
+            raise ValueError("Weights must be non-negative with a positive sum")
+        size = len(weights)
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        return cls(probability=tuple(probability), alias=tuple(alias))
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw one outcome index."""
+        column = int(rng.random() * len(self.probability))
+        return column if rng.random() < self.probability[column] else self.alias[column]
+
+
+@dataclass(frozen=True, eq=False)
+class MarkovProgressionModel:
+    """Precomputed sampling tables for one genre and smoothing level.
+
+    Attributes:
+        genre: Genre the model was built for
+        smoothing: Pseudo-count added towards every known state
+        states: The (degree, quality) states, indexed by the tables
+        start: Distribution of first chords
+        transitions: One alias table per state, over the next state
+        probabilities: Row-normalized transition matrix
+    """
+    genre: str
+    smoothing: float
+    states: Tuple[State, ...]
+    start: AliasTable
+    transitions: Tuple[AliasTable, ...]
+    probabilities: Tuple[Tuple[float, ...], ...]
+
+    def _rng(self, seed: Seed) -> random.Random:
+        return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+    def sample(self, length: int, seed: Seed = None, after: Optional[State] = None) -> List[State]:
+        """
+        Sample one progression.
+
+        Args:
+            length: Number of chords
+            seed: Seed or Random instance, for reproducible output
+            after: Chord the progression continues from; its first chord is
+                drawn from this state's transitions instead of the start
+                distribution
+
+        Raises:
+            ValueError: If length is not positive or after is not a known state
+        """
+        if length < 1:
+            raise ValueError("Progression length must be positive")
+        rng = self._rng(seed)
+        if after is None:
+            state = self.start.sample(rng)
+        else:
+            if after not in self.states:
+                raise ValueError(f"Unknown progression state: {after}")
+            state = self.transitions[self.states.index(after)].sample(rng)
+        indices = [state]
+        for _ in range(length - 1):
+            state = self.transitions[state].sample(rng)
+            indices.append(state)
+        return [self.states[index] for index in indices]
+
+    def sample_many(self, count: int, length: int, seed: Optional[int] = None) -> List[List[State]]:
+        """
+        Sample many progressions at once.
+
+        With numpy every step is drawn for the whole batch in one array
+        operation; otherwise progressions are drawn one by one.
+
+        Args:
+            count: Number of progressions
+            length: Chords per progression
+            seed: Seed for reproducible output
+
+        Raises:
+            ValueError: If count is negative or length is not positive
+        """
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+        if length < 1:
+            raise ValueError("Progression length must be positive")
+        if not HAS_NUMPY:
+            rng = random.Random(seed)
+            return [self.sample(length, rng) for _ in range(count)]
+        indices = self.sample_indices(count, length, seed)
+        states = self.states
+        return [[states[index] for index in row] for row in indices.tolist()]
+
+    def sample_indices(self, count: int, length: int, seed: Optional[int] = None) -> Any:
+        """Sample a (count, length) numpy array of state indices."""
+        probability, alias, start_probability, start_alias = _alias_arrays(self)
+        rng = np.random.default_rng(seed)
+        size = len(self.states)
+        result = np.empty((count, length), dtype=np.int16)
+
+        column = rng.integers(size, size=count)
+        state = np.where(rng.random(count) < start_probability[column], column, start_alias[column])
+        result[:, 0] = state
+        for step in range(1, length):
+            column = rng.integers(size, size=count)
+            state = np.where(
+                rng.random(count) < probability[state, column], column, alias[state, column]
+            )
+            result[:, step] = state
+        return result
+
+
+@lru_cache(maxsize=None)
+def _alias_arrays(model: MarkovProgressionModel) -> Tuple[Any, Any, Any, Any]:
+    """Stack a model's alias tables into numpy arrays (built once per model)."""
+    return (
+        np.array([table.probability for table in model.transitions]),
+        np.array([table.alias for table in model.transitions]),
+        np.array(model.start.probability),
+        np.array(model.start.alias)
+    )
+
+
+@lru_cache(maxsize=1)
+def _common_corpus() -> Tuple[Tuple[State, ...], ...]:
+    """COMMON_PROGRESSIONS as (degree, quality) sequences; they are written in C major."""
+    table = get_scale_table('C', ScaleType.MAJOR)
+    return tuple(
+        tuple(
+            (table.degree_of(chord['root']), ChordQuality(chord['quality']))
+            for chord in progression['chords']
+        )
+        for progression in COMMON_PROGRESSIONS.values()
+    )
+
+
+def _corpus(genre: str) -> List[Tuple[Tuple[State, ...], float]]:
+    """Weighted training sequences for a genre."""
+    return [(GENRE_PATTERNS[genre], GENRE_WEIGHT)] + [(seq, 1.0) for seq in _common_corpus()]
+
+
+@lru_cache(maxsize=None)
+def get_markov_model(genre: str = "pop", smoothing: float = 0.0) -> MarkovProgressionModel:
+    """
+    Get the (cached) Markov model for a genre.
+
+    Args:
+        genre: A key of GENRE_PATTERNS
+        smoothing: Pseudo-count added from every state towards every state
+            seen in any genre's corpus (0 = genre corpus only)
+
+    Raises:
+        ValueError: If the genre is unknown or smoothing is negative
+    """
+    if genre not in GENRE_PATTERNS:
+        raise ValueError(f"Unsupported genre: {genre}")
+    if smoothing < 0:
+        raise ValueError("Smoothing cannot be negative")
+
+    counts: Dict[State, Dict[State, float]] = {}
+    starts: Dict[State, float] = {}
+    for sequence, weight in _corpus(genre):
+        starts[sequence[0]] = starts.get(sequence[0], 0.0) + weight
+        for current, following in zip(sequence, sequence[1:] + sequence[:1]):
+            row = counts.setdefault(current, {})
+            row[following] = row.get(following, 0.0) + weight
+
+    states = list(counts)
+    if smoothing:
+        vocabulary = {state for g in GENRE_PATTERNS for seq, _ in _corpus(g) for state in seq}
+        states.extend(sorted(vocabulary - set(states), key=lambda s: (s[0], s[1].value)))
+    index = {state: i for i, state in enumerate(states)}
+
+    matrix = []
+    for state in states:
+        row = [smoothing] * len(states)
+        for following, count in counts.get(state, {}).items():
+            row[index[following]] += count
+        total = sum(row)
+        matrix.append(tuple(weight / total for weight in row))
+
+    return MarkovProgressionModel(
+        genre=genre,
+        smoothing=smoothing,
+        states=tuple(states),
+        start=AliasTable.from_weights([starts.get(state, 0.0) for state in states]),
+        transitions=tuple(AliasTable.from_weights(row) for row in matrix),
+        probabilities=tuple(matrix)
+    )
+
+
+__all__ = ['AliasTable', 'MarkovProgressionModel', 'GENRE_WEIGHT', 'get_markov_model']
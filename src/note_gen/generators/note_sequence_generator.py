@@ -1,24 +1,61 @@
 """
 Note sequence generator with enhanced validation and pattern support.
 """
-from typing import List, Optional, Dict, Any
+import asyncio
+from itertools import islice
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+)
 from pydantic import BaseModel, ConfigDict, Field
 from uuid import uuid4
 from note_gen.models.note import Note
 from note_gen.models.chord import Chord
 from note_gen.models.chord_progression import ChordProgression
+from note_gen.models.chord_progression_item import ChordProgressionItem
 from note_gen.models.scale_info import ScaleInfo
 from note_gen.models.patterns import NotePattern
 from note_gen.models.rhythm import RhythmPattern, RhythmNote
 from note_gen.models.note_sequence import NoteSequence
-from note_gen.core.enums import ValidationLevel, VoiceLeadingRule, ChordQuality
+from note_gen.core.enums import (
+    ValidationLevel, VoiceLeadingRule, ChordQuality, GenerationEngine, RangePolicy, VoicingMode
+)
+from note_gen.core.chord_voicing import get_voicing
+from note_gen.core.pitch import Pitch
+from note_gen.core.spelling import respell_notes
+from note_gen.core.voice_leading import lead_voices
+from note_gen.generators import vectorized_engine
+from note_gen.generators.generation_cache import model_key
 from note_gen.validation.validation_manager import ValidationManager
 from note_gen.validation.base_validation import ValidationResult
 
 import logging
 
+if TYPE_CHECKING:
+    from note_gen.generators.generation_plan import GenerationPlan
+    from note_gen.generators.incremental import IncrementalSequence
+
 logger = logging.getLogger(__name__)
 
+# Notes per chunk when streaming a sequence
+DEFAULT_STREAM_CHUNK_SIZE = 256
+
+class GenerationRequest(BaseModel):
+    """One sequence to generate in a :meth:`NoteSequenceGenerator.generate_many` batch."""
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        from_attributes=True
+    )
+
+    chord_progression: ChordProgression
+    note_pattern: NotePattern
+    rhythm_pattern: RhythmPattern
+    scale_info: Optional[ScaleInfo] = None
+    transpose: Optional[int] = None
+    note_pattern_name: Optional[str] = None
+    rhythm_pattern_name: Optional[str] = None
+    voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION
+
+
 class NoteSequenceGenerator(BaseModel):
     """Generator for creating note sequences from chord progressions and patterns."""
     model_config = ConfigDict(
@@ -33,6 +70,8 @@ class NoteSequenceGenerator(BaseModel):
     voice_leading_rules: List[str] = Field(default_factory=list)
     note_pattern_name: Optional[str] = None
     rhythm_pattern_name: Optional[str] = None
+    engine: GenerationEngine = GenerationEngine.STANDARD
+    voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION
 
     async def generate(
         self,
@@ -53,42 +92,45 @@ class NoteSequenceGenerator(BaseModel):
         transpose: Optional[int] = None
     ) -> NoteSequence:
         """Generate note sequence asynchronously with validation."""
+        return self.generate_sequence(scale_info, transpose)
+
+    def generate_sequence(
+        self,
+        scale_info: ScaleInfo,
+        transpose: Optional[int] = None
+    ) -> NoteSequence:
+        """Generate note sequence with validation (synchronously, for executors)."""
         try:
             # Validate inputs
             if not self.chord_progression.items:
                 raise ValueError("Chord progression cannot be empty")
 
-            # Generate basic sequence
-            sequence = self._generate_basic_sequence()
-
-            # Apply rhythm pattern
-            sequence = self._apply_rhythm_pattern(sequence)
-
-            # Apply note pattern
-            sequence = self._apply_note_pattern(sequence, scale_info)
-
-            # Create NoteSequence instance
-            note_sequence = NoteSequence(
-                id=str(uuid4())[:8],
-                name=f"Generated Sequence {self.note_pattern.name}",
-                notes=sequence,
-                duration=sum(note.duration for note in sequence),
-                tempo=120,  # Default tempo
-                time_signature=self.rhythm_pattern.time_signature,
-                scale_info=scale_info.model_dump() if scale_info else None,
-                progression_name=self.chord_progression.name,
-                note_pattern_name=self.note_pattern.name,
-                rhythm_pattern_name=self.rhythm_pattern.name
-            )
+            if self.engine == GenerationEngine.VECTORIZED and vectorized_engine.HAS_NUMPY:
+                # Run all stages, transposition included, as array operations, materializing notes once
+                array = vectorized_engine.generate_array(
+                    self.chord_progression, self.note_pattern, self.rhythm_pattern, scale_info, self.voicing_mode
+                )
+                if transpose:
+                    array = array.transpose(transpose)
+                note_sequence = self._create_note_sequence(array.to_notes(), scale_info)
+            else:
+                # Generate basic sequence
+                sequence = self._generate_basic_sequence()
 
-            # Transpose if needed
-            if transpose:
-                note_sequence = note_sequence.transpose(transpose)
+                # Apply rhythm pattern
+                sequence = self._apply_rhythm_pattern(sequence)
+
+                # Apply note pattern
+                sequence = self._apply_note_pattern(sequence, scale_info)
+
+                note_sequence = self._create_note_sequence(sequence, scale_info)
+
+                # Transpose if needed
+                if transpose:
+                    note_sequence = note_sequence.transpose(transpose)
 
             # Validate the sequence before returning
-            validation_result = self._validate_sequence(note_sequence.notes)
-            if not validation_result.is_valid:
-                raise ValueError(f"Generated sequence validation failed: {validation_result.violations}")
+            self._check_sequence(note_sequence.notes)
 
             return note_sequence
 
@@ -96,51 +138,216 @@ class NoteSequenceGenerator(BaseModel):
             logger.error(f"Failed to generate sequence: {str(e)}")
             raise ValueError(f"Failed to generate sequence: {str(e)}")
 
+    @classmethod
+    async def generate_many(
+        cls,
+        requests: Sequence[GenerationRequest],
+        return_exceptions: bool = False
+    ) -> List[Union[NoteSequence, Exception]]:
+        """
+        Generate many sequences, computing shared work once.
+
+        Requests with equal chord progressions, rhythm patterns and scales
+        (compared by content) share their chord tones, rhythm layout and key
+        spelling; only transposition and note materialization run per
+        request. Each result equals what :meth:`generate` returns for the
+        same request.
+
+        Args:
+            requests: Sequences to generate
+            return_exceptions: If True, a failed request yields its ValueError
+                in place of a sequence instead of aborting the batch
+
+        Returns:
+            One sequence (or exception) per request, in input order
+
+        Raises:
+            ValueError: If a request fails and return_exceptions is False
+        """
+        shared = cls._batch_stages()
+        results: List[Union[NoteSequence, Exception]] = []
+        for request in requests:
+            results.append(cls._generate_batch_item(request, shared, return_exceptions))
+            # Let other tasks run between requests of a long batch
+            await asyncio.sleep(0)
+        return results
+
+    @classmethod
+    def generate_many_sync(
+        cls,
+        requests: Sequence[GenerationRequest],
+        return_exceptions: bool = False
+    ) -> List[Union[NoteSequence, Exception]]:
+        """Synchronous :meth:`generate_many`, for running a batch in an executor."""
+        shared = cls._batch_stages()
+        return [cls._generate_batch_item(request, shared, return_exceptions) for request in requests]
+
+    @staticmethod
+    def _batch_stages() -> Callable[[Tuple[Any, ...], Callable[[], Any]], Any]:
+        """Create a memo of generation stages shared across one batch."""
+        stages: Dict[Tuple[Any, ...], Any] = {}
+
+        def shared(key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+            if key not in stages:
+                stages[key] = build()
+            return stages[key]
+        return shared
+
+    @classmethod
+    def _generate_batch_item(
+        cls,
+        request: GenerationRequest,
+        shared: Callable[[Tuple[Any, ...], Callable[[], Any]], Any],
+        return_exceptions: bool
+    ) -> Union[NoteSequence, Exception]:
+        """Generate one batch request, returning or raising its error."""
+        generator = cls(
+            chord_progression=request.chord_progression,
+            note_pattern=request.note_pattern,
+            rhythm_pattern=request.rhythm_pattern,
+            note_pattern_name=request.note_pattern_name,
+            rhythm_pattern_name=request.rhythm_pattern_name,
+            voicing_mode=request.voicing_mode
+        )
+        try:
+            if not vectorized_engine.HAS_NUMPY:
+                scale_info = request.scale_info or generator.chord_progression.scale_info
+                if scale_info is None:
+                    raise ValueError("scale_info must be provided either in constructor or generate method")
+                return generator.generate_sequence(scale_info, request.transpose)
+            return generator._generate_shared(request, shared)
+        except ValueError as e:
+            if not return_exceptions:
+                raise
+            return e
+
+    def _generate_shared(
+        self,
+        request: GenerationRequest,
+        shared: Callable[[Tuple[Any, ...], Callable[[], Any]], Any]
+    ) -> NoteSequence:
+        """Generate one batch request, reusing stages already computed for the batch."""
+        scale_info = request.scale_info or self.chord_progression.scale_info
+        if scale_info is None:
+            raise ValueError("scale_info must be provided either in constructor or generate method")
+        try:
+            if not self.chord_progression.items:
+                raise ValueError("Chord progression cannot be empty")
+            # Keyed by content, so equal inputs loaded as separate objects share their stages
+            progression = (model_key(self.chord_progression), self.voicing_mode)
+            rhythm = model_key(self.rhythm_pattern)
+            tones = shared(('tones', progression), lambda: vectorized_engine.chord_tone_array(
+                self.chord_progression, self.voicing_mode))
+            rhythmic = shared(('rhythm', progression, rhythm), lambda: vectorized_engine.apply_rhythm(
+                tones, self.rhythm_pattern))
+            spelled = shared(
+                ('spelling', progression, rhythm, bool(self.note_pattern.pattern),
+                 scale_info.key, scale_info.scale_type),
+                lambda: vectorized_engine.apply_note_pattern(rhythmic, self.note_pattern, scale_info)
+            )
+
+            if request.transpose:
+                spelled = spelled.transpose(request.transpose)
+            note_sequence = self._create_note_sequence(spelled.to_notes(), scale_info)
+            self._check_sequence(note_sequence.notes)
+            return note_sequence
+
+        except Exception as e:
+            logger.error(f"Failed to generate sequence: {str(e)}")
+            raise ValueError(f"Failed to generate sequence: {str(e)}")
+
+    def _create_note_sequence(self, notes: List[Note], scale_info: ScaleInfo) -> NoteSequence:
+        """Wrap generated notes in a NoteSequence."""
+        return NoteSequence(
+            id=str(uuid4())[:8],
+            name=f"Generated Sequence {self.note_pattern.name}",
+            notes=notes,
+            duration=sum(note.duration for note in notes),
+            tempo=120,  # Default tempo
+            time_signature=self.rhythm_pattern.time_signature,
+            scale_info=scale_info.model_dump() if scale_info else None,
+            progression_name=self.chord_progression.name,
+            note_pattern_name=self.note_pattern.name,
+            rhythm_pattern_name=self.rhythm_pattern.name
+        )
+
+    def _check_sequence(self, notes: List[Note]) -> None:
+        """Raise if the generated notes fail validation."""
+        validation_result = self._validate_sequence(notes)
+        if not validation_result.is_valid:
+            raise ValueError(f"Generated sequence validation failed: {validation_result.violations}")
+
     def _generate_basic_sequence(self) -> List[Note]:
         """Generate basic sequence from chord progression."""
-        sequence = []
+        return list(self._iter_chord_notes())
+
+    def _iter_chord_notes(self) -> Iterator[Note]:
+        """Yield each chord's root note followed by its voicing, chord by chord."""
+        for pitches in self._progression_pitches():
+            for pitch in pitches:
+                yield Note.from_pitch(pitch)
+
+    def _progression_pitches(self) -> Iterator[Tuple[Pitch, ...]]:
+        """Each progression item's root pitch and voicing, voiced per the voicing mode."""
+        if self.voicing_mode != VoicingMode.VOICE_LED:
+            for chord_item in self.chord_progression.items:
+                yield self._item_pitches(chord_item)
+            return
+
+        # Inversions and octaves chosen over the whole progression at once
+        chords = [item.chord for item in self.chord_progression.items if item.chord is not None]
+        voicings = iter(lead_voices((chord.root, chord.quality) for chord in chords))
         for chord_item in self.chord_progression.items:
-            # Skip if chord is None
             if chord_item.chord is None:
-                continue
-
-            # Create root note
-            root_note = Note(
-                pitch=chord_item.chord.root,
-                octave=4,
-                duration=1.0,
-                velocity=64,
-                position=0.0
-            )
-            chord_notes = [root_note]
-
-            # Add chord notes based on intervals
-            root_midi = root_note.to_midi_number()
-            for interval in ChordQuality.get_intervals(chord_item.chord.quality):
-                new_midi = root_midi + interval
-                new_note = Note.from_midi_number(
-                    midi_number=new_midi,
-                    duration=1.0,
-                    velocity=64
-                )
-                chord_notes.append(new_note)
-
-            sequence.extend(chord_notes)
-        return sequence
+                yield ()
+            else:
+                yield (Pitch.of(chord_item.chord.root, 4),) + next(voicings)
+
+    def _iter_item_notes(self, chord_item: ChordProgressionItem) -> Iterator[Note]:
+        """Yield one progression item's root note followed by its voicing."""
+        for pitch in self._item_pitches(chord_item):
+            yield Note.from_pitch(pitch)
+
+    @staticmethod
+    def _item_pitches(chord_item: ChordProgressionItem) -> Tuple[Pitch, ...]:
+        """One progression item's root pitch followed by its voicing (none if it has no chord)."""
+        # Skip if chord is None
+        if chord_item.chord is None:
+            return ()
+
+        # Root note, then chord notes from the cached voicing
+        root = Pitch.of(chord_item.chord.root, 4)
+        return (root,) + get_voicing(chord_item.chord.root, chord_item.chord.quality, octave=4)
 
     def _apply_rhythm_pattern(self, sequence: List[Note]) -> List[Note]:
         """Apply rhythm pattern to the sequence."""
         if not self.rhythm_pattern.pattern:  # Changed from notes to pattern
             return sequence
+        return list(self._iter_rhythm(sequence))
+
+    def _iter_rhythm(
+        self,
+        notes: Iterable[Note],
+        start_index: int = 0,
+        start_position: float = 0.0
+    ) -> Iterator[Note]:
+        """
+        Apply the rhythm pattern to notes as they stream past, keeping the running position.
+
+        start_index and start_position continue a sequence whose first
+        start_index notes end at start_position.
+        """
+        if not self.rhythm_pattern.pattern:
+            yield from notes
+            return
 
-        rhythmic_sequence = []
         pattern_durations = [note.duration for note in self.rhythm_pattern.pattern]
         pattern_positions = [note.position for note in self.rhythm_pattern.pattern]
         pattern_accents = [note.accent for note in self.rhythm_pattern.pattern]
         pattern_length = len(pattern_durations)
 
-        current_position = 0.0
-        for i, note in enumerate(sequence):
+        current_position = start_position
+        for i, note in enumerate(notes, start_index):
             pattern_idx = i % pattern_length
             duration = pattern_durations[pattern_idx]
             position = pattern_positions[pattern_idx]
@@ -152,53 +359,191 @@ class NoteSequenceGenerator(BaseModel):
             if accent:
                 note.velocity = min(note.velocity + 16, 127)  # Increase velocity for accented notes
 
-            rhythmic_sequence.append(note)
+            yield note
             current_position += duration
 
-        return rhythmic_sequence
+    def iter_chunks(
+        self,
+        scale_info: Optional[ScaleInfo] = None,
+        transpose: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> Iterator[List[Note]]:
+        """
+        Generate the sequence lazily, in chunks of at most chunk_size notes.
+
+        Yields the same notes as :meth:`generate`, but only one chunk is held
+        at a time. Each chunk is validated as it is produced, together with
+        the last note of the previous chunk so voice-leading rules still see
+        every pair of consecutive notes.
+
+        Args:
+            scale_info: Scale to generate in (defaults to the progression's)
+            transpose: Semitones to transpose by
+            chunk_size: Maximum notes per chunk
+
+        Raises:
+            ValueError: If the inputs are invalid or a chunk fails validation
+        """
+        if scale_info is None:
+            scale_info = self.chord_progression.scale_info
+        if scale_info is None:
+            raise ValueError("scale_info must be provided either in constructor or generate method")
+        if not self.chord_progression.items:
+            raise ValueError("Chord progression cannot be empty")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+
+        spelling = scale_info.get_table().spelling if self.note_pattern.pattern else None
+        notes = self._iter_rhythm(self._iter_chord_notes())
+        previous: Optional[Note] = None
+        while True:
+            chunk = list(islice(notes, chunk_size))
+            if not chunk:
+                return
+            if spelling is not None:
+                chunk = respell_notes(chunk, scale_info.key, table=spelling)
+            if transpose:
+                chunk = self._transpose_sequence(chunk, transpose)
+
+            self._check_sequence(chunk if previous is None else [previous] + chunk)
+
+            previous = chunk[-1]
+            yield chunk
+
+    def iter_notes(
+        self,
+        scale_info: Optional[ScaleInfo] = None,
+        transpose: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> Iterator[Note]:
+        """Generate the sequence lazily, one note at a time (see :meth:`iter_chunks`)."""
+        for chunk in self.iter_chunks(scale_info, transpose, chunk_size):
+            yield from chunk
+
+    async def aiter_chunks(
+        self,
+        scale_info: Optional[ScaleInfo] = None,
+        transpose: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[List[Note]]:
+        """Async version of :meth:`iter_chunks`, yielding to the event loop between chunks."""
+        for chunk in self.iter_chunks(scale_info, transpose, chunk_size):
+            yield chunk
+            await asyncio.sleep(0)
+
+    async def aiter_notes(
+        self,
+        scale_info: Optional[ScaleInfo] = None,
+        transpose: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[Note]:
+        """Async version of :meth:`iter_notes`, yielding to the event loop between chunks."""
+        async for chunk in self.aiter_chunks(scale_info, transpose, chunk_size):
+            for note in chunk:
+                yield note
+
+    def generate_incremental(
+        self,
+        scale_info: Optional[ScaleInfo] = None,
+        transpose: Optional[int] = None
+    ) -> 'IncrementalSequence':
+        """
+        Generate a sequence that can then be edited chord by chord.
+
+        Edits regenerate only the segments they touch (see
+        :class:`~note_gen.generators.incremental.IncrementalSequence`).
+
+        Raises:
+            ValueError: If the inputs are invalid, the generator is voice-led or
+                the sequence fails validation
+        """
+        from note_gen.generators.incremental import IncrementalSequence
+
+        return IncrementalSequence(self, scale_info, transpose)
+
+    def compile_plan(self) -> 'GenerationPlan':
+        """
+        Compile the progression and patterns into a reusable, key-independent plan.
+
+        Executing the plan for a scale and transposition returns the same
+        sequence as :meth:`generate`, without re-interpreting the inputs
+        (see :class:`~note_gen.generators.generation_plan.GenerationPlan`).
+
+        Raises:
+            ValueError: If the chord progression is empty
+        """
+        from note_gen.generators.generation_plan import GenerationPlan
+
+        if not self.chord_progression.items:
+            raise ValueError("Chord progression cannot be empty")
+        pitches = tuple(pitch for item_pitches in self._progression_pitches() for pitch in item_pitches)
+        rhythm = self.rhythm_pattern.pattern
+        durations: List[float] = []
+        positions: List[float] = []
+        accents: List[bool] = []
+        current_position = 0.0
+        for i in range(len(pitches)):
+            if rhythm:
+                step = rhythm[i % len(rhythm)]
+                duration, position, accent = step.duration, current_position + step.position, step.accent
+            else:
+                duration, position, accent = 1.0, 0.0, False
+            durations.append(duration)
+            positions.append(position)
+            accents.append(accent)
+            current_position += duration
+
+        return GenerationPlan.from_pitches(
+            pitches,
+            durations=tuple(durations),
+            positions=tuple(positions),
+            accents=tuple(accents),
+            respell=bool(self.note_pattern.pattern),
+            progression_name=self.chord_progression.name,
+            note_pattern_name=self.note_pattern.name,
+            rhythm_pattern_name=self.rhythm_pattern.name,
+            time_signature=self.rhythm_pattern.time_signature,
+            voice_leading_rules=tuple(self.voice_leading_rules)
+        )
+
+    def generate_transpositions(
+        self,
+        scale_info: Optional[ScaleInfo] = None,
+        transpositions: Iterable[int] = range(12),
+        range_policy: Union[RangePolicy, str] = RangePolicy.FOLD
+    ) -> Dict[int, NoteSequence]:
+        """
+        Generate the sequence once and derive it in many keys.
+
+        Each transposition is spelled in its own key, and notes leaving the
+        MIDI range are folded or clamped per range_policy (see
+        :meth:`~note_gen.generators.generation_plan.GenerationPlan.fan_out`).
+
+        Args:
+            scale_info: Scale of the untransposed sequence (defaults to the progression's)
+            transpositions: Semitone offsets to generate
+            range_policy: What happens to notes that leave the MIDI range
+
+        Returns:
+            Each requested offset's sequence
+
+        Raises:
+            ValueError: If the inputs are invalid or a sequence fails validation
+        """
+        if scale_info is None:
+            scale_info = self.chord_progression.scale_info
+        if scale_info is None:
+            raise ValueError("scale_info must be provided either in constructor or generate method")
+        return self.compile_plan().fan_out(scale_info, transpositions, range_policy)
 
     def _apply_note_pattern(self, sequence: List[Note], scale_info: ScaleInfo) -> List[Note]:
         """Apply note pattern to the sequence."""
         if not self.note_pattern.pattern:
             return sequence
 
-        # Create scale notes as Note objects from the scale note strings
-        scale_notes = []
-        scale_note_strings = scale_info.get_scale_notes()  # Assuming this returns List[Note]
-        for scale_note in scale_note_strings:
-            scale_notes.append(Note(
-                pitch=scale_note.pitch,  # Use the pitch string from the Note object
-                octave=4,
-                duration=1.0,
-                velocity=64,
-                position=0.0
-            ))
-
-        pattern_sequence = []
-        pattern_length = len(self.note_pattern.pattern)
-
-        for i, note in enumerate(sequence):
-            pattern_idx = i % pattern_length
-            pattern_note = self.note_pattern.pattern[pattern_idx]
-
-            # Find the index of the current note in the scale using the pitch string
-            scale_idx = next(i for i, n in enumerate(scale_notes) if n.pitch == note.pitch)
-
-            # Skip interval calculation for now
-            # Just use the same scale note
-            scale_note = scale_notes[scale_idx]
-
-            # Use the pitch string from the scale note
-            new_note = Note(
-                pitch=scale_note.pitch,
-                octave=note.octave,
-                duration=note.duration,
-                velocity=note.velocity,
-                position=note.position
-            )
-            pattern_sequence.append(new_note)
-
-        return pattern_sequence
+        # Spell every note as in the key: scale tones take the scale's
+        # spelling, chromatic tones the key's sharp/flat preference
+        return respell_notes(sequence, scale_info.key, table=scale_info.get_table().spelling)
 
     def _transpose_sequence(self, sequence: List[Note], semitones: int) -> List[Note]:
         """Transpose the sequence by given number of semitones."""
@@ -221,5 +566,7 @@ class NoteSequenceGenerator(BaseModel):
             "validation_level": self.validation_level.value,
             "voice_leading_rules": self.voice_leading_rules,
             "note_pattern_name": self.note_pattern_name,
-            "rhythm_pattern_name": self.rhythm_pattern_name
+            "rhythm_pattern_name": self.rhythm_pattern_name,
+            "engine": self.engine.value,
+            "voicing_mode": self.voicing_mode.value
         }
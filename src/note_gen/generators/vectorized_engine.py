@@ -0,0 +1,121 @@
+"""
+Vectorized execution engine for NoteSequenceGenerator.
+
+Runs the generation stages on a :class:`~note_gen.models.note_array.NoteArray`
+instead of on Note models: chord tones are concatenated from cached per-chord
+tuples, the rhythm is tiled across the sequence, positions come from a
+cumulative sum of durations, accents are a masked velocity bump and the note
+pattern stage is a spelling-table lookup. Notes are only materialized once,
+at the end.
+
+The result is note-for-note identical to the standard engine (``np.cumsum``
+adds sequentially, like the standard engine's running position).
+"""
+from functools import lru_cache
+from typing import List, Tuple
+
+from note_gen.core.chord_voicing import get_voicing
+from note_gen.core.enums import ChordQuality, VoicingMode
+from note_gen.core.pitch import Pitch
+from note_gen.core.voice_leading import lead_voices
+from note_gen.models.chord_progression import ChordProgression
+from note_gen.models.note_array import HAS_NUMPY, NoteArray, np
+from note_gen.models.patterns import NotePattern
+from note_gen.models.rhythm import RhythmPattern
+from note_gen.models.scale_info import ScaleInfo
+
+# Velocity of generated notes and the bump applied to accented ones
+BASE_VELOCITY = 64
+ACCENT_VELOCITY = 16
+MAX_VELOCITY = 127
+
+# Octave the chord tones are generated in
+CHORD_OCTAVE = 4
+
+
+@lru_cache(maxsize=1024)
+def _chord_tones(root: str, quality: ChordQuality) -> Tuple[Tuple[int, ...], Tuple[bool, ...]]:
+    """Get (MIDI numbers, flat spellings) for a chord's root note plus its voicing."""
+    pitches = (Pitch.of(root, CHORD_OCTAVE),) + get_voicing(root, quality, octave=CHORD_OCTAVE)
+    return (
+        tuple(pitch.midi for pitch in pitches),
+        tuple(pitch.name.endswith('b') for pitch in pitches)
+    )
+
+
+def chord_tone_array(
+    chord_progression: ChordProgression,
+    voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION
+) -> NoteArray:
+    """Build the basic sequence: each chord's root followed by its voicing."""
+    midi: List[int] = []
+    flat: List[bool] = []
+    chords = [item.chord for item in chord_progression.items if item.chord is not None]
+    if voicing_mode == VoicingMode.VOICE_LED:
+        voicings = lead_voices((chord.root, chord.quality) for chord in chords)
+        for chord, voicing in zip(chords, voicings):
+            pitches = (Pitch.of(chord.root, CHORD_OCTAVE),) + voicing
+            midi.extend(pitch.midi for pitch in pitches)
+            flat.extend(pitch.name.endswith('b') for pitch in pitches)
+    else:
+        for chord in chords:
+            tones, flats = _chord_tones(chord.root, chord.quality)
+            midi.extend(tones)
+            flat.extend(flats)
+    size = len(midi)
+    return NoteArray(
+        midi=midi,
+        duration=np.ones(size),
+        velocity=np.full(size, BASE_VELOCITY),
+        position=np.zeros(size),
+        flat=flat
+    )
+
+
+def apply_rhythm(array: NoteArray, rhythm_pattern: RhythmPattern) -> NoteArray:
+    """Tile the rhythm pattern over the array, laying notes end to end."""
+    pattern = rhythm_pattern.pattern
+    size = len(array)
+    if not pattern or not size:
+        return array
+    duration = np.resize(np.array([note.duration for note in pattern], dtype=np.float64), size)
+    offset = np.resize(np.array([note.position for note in pattern], dtype=np.float64), size)
+    accent = np.resize(np.array([note.accent for note in pattern], dtype=bool), size)
+
+    start = np.empty(size)
+    start[0] = 0.0
+    np.cumsum(duration[:-1], out=start[1:])
+    velocity = np.where(accent, np.minimum(array.velocity + ACCENT_VELOCITY, MAX_VELOCITY), array.velocity)
+    return NoteArray._from_columns(
+        array.midi, duration, velocity.astype(np.int16), start + offset, array.channel, array.flat
+    )
+
+
+def apply_note_pattern(array: NoteArray, note_pattern: NotePattern, scale_info: ScaleInfo) -> NoteArray:
+    """Spell the notes as in the key, as the standard engine's note-pattern stage does."""
+    if not note_pattern.pattern:
+        return array
+    return array.respell(scale_info.key, scale_info.scale_type)
+
+
+def generate_array(
+    chord_progression: ChordProgression,
+    note_pattern: NotePattern,
+    rhythm_pattern: RhythmPattern,
+    scale_info: ScaleInfo,
+    voicing_mode: VoicingMode = VoicingMode.ROOT_POSITION
+) -> NoteArray:
+    """
+    Run every generation stage as array operations.
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    array = chord_tone_array(chord_progression, voicing_mode)
+    array = apply_rhythm(array, rhythm_pattern)
+    return apply_note_pattern(array, note_pattern, scale_info)
+
+
+__all__ = [
+    'HAS_NUMPY', 'chord_tone_array', 'apply_rhythm', 'apply_note_pattern', 'generate_array'
+]
@@ -1,9 +1,16 @@
 """Chord model definition."""
-from typing import Optional, List, Dict, ClassVar, Union
+from typing import Any, Optional, List, ClassVar, Mapping, Tuple
 from pydantic import Field, ConfigDict, field_validator, model_validator
 from .base import BaseModelWithConfig
 from .note import Note
+from ..core.chord_symbols import format_symbol, parse_symbol
+from ..core.chord_voicing import fit_octave, get_voicing
+from ..core.constants import CHORD_INTERVALS
 from ..core.enums import ChordQuality  # Updated import
+from ..core.pitch_class_set import PitchClassSet
+
+# Pitch classes of each quality with a root of C; rotated to the chord's root
+_QUALITY_PITCH_CLASSES = {quality: PitchClassSet.of(intervals) for quality, intervals in CHORD_INTERVALS.items()}
 
 class Chord(BaseModelWithConfig):
     """Model representing a musical chord."""
@@ -39,19 +46,7 @@ class Chord(BaseModelWithConfig):
         return self
 
     # Class variable for chord quality intervals
-    QUALITY_INTERVALS: ClassVar[Dict[ChordQuality, List[int]]] = {
-        ChordQuality.MAJOR: [0, 4, 7],
-        ChordQuality.MINOR: [0, 3, 7],
-        ChordQuality.DIMINISHED: [0, 3, 6],
-        ChordQuality.AUGMENTED: [0, 4, 8],
-        ChordQuality.DOMINANT_SEVENTH: [0, 4, 7, 10],
-        ChordQuality.MAJOR_SEVENTH: [0, 4, 7, 11],
-        ChordQuality.MINOR_SEVENTH: [0, 3, 7, 10],
-        ChordQuality.DIMINISHED_SEVENTH: [0, 3, 6, 9],
-        ChordQuality.HALF_DIMINISHED_SEVENTH: [0, 3, 6, 10],
-        ChordQuality.SUSPENDED_SECOND: [0, 2, 7],
-        ChordQuality.SUSPENDED_FOURTH: [0, 5, 7]
-    }
+    QUALITY_INTERVALS: ClassVar[Mapping[ChordQuality, Tuple[int, ...]]] = CHORD_INTERVALS
 
     def get_notes(self) -> List[Note]:
         """Get the list of notes in the chord."""
@@ -59,16 +54,20 @@ class Chord(BaseModelWithConfig):
             self._generate_notes()
         return self.notes
 
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        """Get the chord's pitch classes as a bitmask set."""
+        return _QUALITY_PITCH_CLASSES[self.quality].transpose(Note.MIDI_BASE_NOTES[self.root])
+
+    def is_chord_tone(self, note: Note) -> bool:
+        """Check if a note's pitch class is one of the chord's tones."""
+        return note.pitch in self.pitch_class_set
+
     def _generate_notes(self) -> None:
         """Generate the notes for this chord based on root and quality."""
-        # Create the base note with octave in the name string
-        base_note = Note.from_name(f"{self.root}4")  # Use middle octave as default
-        intervals = self.QUALITY_INTERVALS[self.quality]
-
-        self.notes = []
-        for interval in intervals:
-            note = base_note.transpose(interval)
-            self.notes.append(note)
+        octave = 4 if self.octave is None else self.octave  # Use middle octave as default
+        octave = fit_octave(self.root, self.quality, octave)
+        self.notes = [Note.from_pitch(pitch) for pitch in get_voicing(self.root, self.quality, octave)]
 
     def transpose(self, semitones: int) -> 'Chord':
         """
@@ -84,7 +83,7 @@ class Chord(BaseModelWithConfig):
         transposed_note = base_note.transpose(semitones)
 
         return Chord(
-            root=transposed_note.note_name,
+            root=transposed_note.pitch,
             quality=self.quality
         )
 
@@ -93,45 +92,42 @@ class Chord(BaseModelWithConfig):
         Convert the chord to its symbol representation.
 
         Returns:
-            str: Chord symbol (e.g., 'C', 'Am', 'F7')
+            str: Chord symbol (e.g., 'C', 'Am', 'F7', 'Dm7b5')
         """
-        quality_symbols = {
-            ChordQuality.MAJOR: '',
-            ChordQuality.MINOR: 'm',
-            ChordQuality.DIMINISHED: 'dim',
-            ChordQuality.AUGMENTED: 'aug',
-            ChordQuality.MAJOR_SEVENTH: 'maj7',
-            ChordQuality.MINOR_SEVENTH: 'm7',
-            ChordQuality.DOMINANT_SEVENTH: '7'
-        }
-        return f"{self.root}{quality_symbols[self.quality]}"
+        return format_symbol(self.root, self.quality)
 
     @classmethod
-    def from_symbol(cls, symbol: str) -> 'Chord':
+    def from_notes(cls, notes: List[Note], **kwargs: Any) -> Optional['Chord']:
         """
-        Create a Chord instance from a chord symbol.
+        Recognize the chord formed by a group of notes.
 
         Args:
-            symbol: Chord symbol (e.g., 'C', 'Am', 'F7')
+            notes: The sounding notes; the lowest is taken as the bass
+            **kwargs: Extra Chord fields, e.g. duration
 
         Returns:
-            Chord: New chord instance
+            Chord: The best matching chord, or None if no chord matches
+        """
+        from ..core.chord_recognition import recognize_chord
+        match = recognize_chord(notes)
+        return None if match is None else cls(root=match.root, quality=match.quality, **kwargs)
+
+    @classmethod
+    def from_symbol(cls, symbol: str) -> 'Chord':
         """
-        # Parse root note
-        root = symbol[0]
-        idx = 1
+        Create a Chord instance from a chord symbol.
 
-        # Handle sharp/flat
-        if idx < len(symbol) and symbol[idx] in '#b':
-            root += symbol[idx]
-            idx += 1
+        Args:
+            symbol: Chord symbol (e.g., 'C', 'Am', 'F7', 'Gsus4/C'); a slash
+                bass is accepted but not stored on the chord
 
-        # Parse quality
-        quality_str = symbol[idx:] if idx < len(symbol) else ''
-        # Default to MAJOR if no quality specified
-        quality = ChordQuality.MAJOR if not quality_str else ChordQuality.from_string(quality_str)
+        Returns:
+            Chord: New chord instance
 
-        return cls(root=root, quality=quality)
+        Raises:
+            ValueError: If the symbol is invalid
+        """
+        return parse_symbol(symbol).to_chord()
 
 
 class ChordProgressionItem(BaseModelWithConfig):
@@ -3,6 +3,7 @@
 from typing import Optional
 from pydantic import Field, model_validator
 from note_gen.models.base import BaseModelWithConfig
+from note_gen.core.chord_symbols import parse_symbol
 from note_gen.core.enums import ChordQuality
 from note_gen.models.chord import Chord
 
@@ -11,7 +12,7 @@ class ChordProgressionItem(BaseModelWithConfig):
     Represents a chord within a progression with additional properties.
 
     Attributes:
-        chord_symbol: The chord symbol (e.g., 'C', 'Am', 'F7')
+        chord_symbol: The chord symbol (e.g., 'C', 'Am', 'F7', 'G7/B')
         duration: Duration of the chord in beats
         position: Position of the chord in beats from start
         chord: The actual Chord object
@@ -25,7 +26,7 @@ class ChordProgressionItem(BaseModelWithConfig):
     def create_chord(self) -> 'ChordProgressionItem':
         """Create the Chord object from the chord symbol."""
         if self.chord is None:
-            self.chord = Chord.from_symbol(self.chord_symbol)
+            self.chord = parse_symbol(self.chord_symbol).to_chord()
         return self
 
     @classmethod
@@ -77,12 +78,12 @@ class ChordProgressionItem(BaseModelWithConfig):
         Returns:
             ChordProgressionItem: New transposed chord progression item
         """
-        # Create a Chord object to handle the transposition
-        chord = Chord.from_symbol(self.chord_symbol)
-        transposed_chord = chord.transpose(semitones)
+        # Transpose the parsed (cached) symbol so slash basses are kept
+        transposed = parse_symbol(self.chord_symbol).transpose(semitones)
 
         return ChordProgressionItem(
-            chord_symbol=transposed_chord.to_symbol(),
+            chord_symbol=transposed.symbol,
             duration=self.duration,
-            position=self.position
+            position=self.position,
+            chord=transposed.to_chord()
         )
@@ -1,8 +1,9 @@
 """Note model module."""
 from typing import Any, ClassVar, Optional, Dict
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
-import re
-from note_gen.core.constants import FULL_NOTE_REGEX
+from note_gen.core.note_parser import FULL_NOTE_NAMES, parse_note_name, parse_pitch
+from note_gen.core.pitch import Pitch
+from note_gen.core.spelling import ENHARMONIC_NAMES, spell
 
 class Note(BaseModel):
     """A musical note model."""
@@ -53,40 +54,17 @@ class Note(BaseModel):
     @classmethod
     def normalize_pitch(cls, pitch: str) -> str:
         """Normalize pitch string to standard format."""
-        # Convert to uppercase but preserve 'b' for flats
-        pitch = pitch.strip()
-        if pitch.endswith('b'):
-            pitch = pitch[:-1].upper() + 'b'
-        else:
-            pitch = pitch.upper()
-
-        if not re.match(r'^[A-G][#b]?$', pitch):
-            raise ValueError(f"Invalid pitch format: {pitch}")
-        return pitch
+        return parse_pitch(pitch)
 
     @classmethod
     def from_name(cls, name: str, duration: float = 1.0, velocity: int = 64,
                  position: float = 0.0, default_octave: int = 4, stored_midi_number: Optional[int] = None) -> 'Note':
         """Create a Note from a name string with optional parameters."""
-        name = name.strip()
-
-        # First try matching with octave
-        match = re.match(r'^([A-G][#b]?)(\d)$', name)
-
-        if match:
-            pitch, octave = match.groups()
-            octave = int(octave)
-        else:
-            # Try matching without octave
-            match = re.match(r'^([A-G][#b]?)$', name)
-            if not match:
-                raise ValueError(f"Invalid note name: {name}")
-            pitch = match.group(1)
-            octave = default_octave
+        pitch, octave = parse_note_name(name)
 
         return cls(
             pitch=pitch,
-            octave=octave,
+            octave=default_octave if octave is None else octave,
             duration=duration,
             velocity=velocity,
             position=position,
@@ -95,27 +73,39 @@ class Note(BaseModel):
 
     @classmethod
     def from_midi_number(cls, midi_number: int, duration: float = 1.0,
-                        velocity: int = 64, position: float = 0.0) -> 'Note':
-        """Create a Note from a MIDI note number."""
-        from note_gen.validation.midi_validation import midi_to_octave_pitch
+                        velocity: int = 64, position: float = 0.0,
+                        key: Optional[str] = None, scale_type: Any = None) -> 'Note':
+        """Create a Note from a MIDI note number.
 
+        Without a key the note is spelled with sharps; with one, it is
+        spelled as in that key (scale_type defaults to major).
+        """
         cls.validate_midi_number(midi_number)
+        pitch = Pitch.from_midi(midi_number)
+        if key is not None:
+            name = spell(midi_number, key, scale_type or 'MAJOR')
+            pitch = Pitch.of(name, pitch.octave) if name != pitch.name else pitch
+        return cls.from_pitch(pitch, duration=duration, velocity=velocity, position=position)
 
-        octave, pitch_number = midi_to_octave_pitch(midi_number)
-        pitch_map = {
-            0: 'C', 1: 'C#', 2: 'D', 3: 'D#', 4: 'E', 5: 'F',
-            6: 'F#', 7: 'G', 8: 'G#', 9: 'A', 10: 'A#', 11: 'B'
-        }
-
+    @classmethod
+    def from_pitch(cls, pitch: Pitch, duration: float = 1.0,
+                   velocity: int = 64, position: float = 0.0) -> 'Note':
+        """Create a Note event from a pooled Pitch."""
         return cls(
-            pitch=pitch_map[pitch_number],
-            octave=octave,
+            pitch=pitch.name,
+            octave=pitch.octave,
             duration=duration,
             velocity=velocity,
             position=position,
-            stored_midi_number=midi_number
+            stored_midi_number=pitch.midi
         )
 
+    def to_pitch(self) -> Pitch:
+        """Get the pooled, immutable Pitch for this note."""
+        if self.octave is None:
+            raise ValueError("Octave must be set to convert to a pitch")
+        return Pitch.of(self.pitch, self.octave)
+
     def to_midi_number(self) -> int:
         """Convert note to MIDI note number."""
         if self.stored_midi_number is not None:
@@ -132,41 +122,35 @@ class Note(BaseModel):
         if self.octave is None:
             raise ValueError("Cannot transpose note without octave")
 
-        midi_num = self.to_midi_number()
-        new_midi = midi_num + semitones
-
+        new_midi = self.to_midi_number() + semitones
         self.validate_midi_number(new_midi)
-        return self.from_midi_number(
-            new_midi,
-            duration=self.duration,
-            velocity=self.velocity,
-            position=self.position
-        )
+
+        # The pooled pitch is already valid and timing is copied from this
+        # (validated) note, so skip re-validating the model.
+        pitch = Pitch.from_midi(new_midi)
+        return self.model_copy(update={
+            'pitch': pitch.name,
+            'octave': pitch.octave,
+            'stored_midi_number': pitch.midi
+        })
 
     def get_enharmonic(self, prefer_flats: bool = False) -> 'Note':
-        """Get the enharmonic equivalent of this note."""
-        enharmonic_map = {
-            'C#': 'Db', 'Db': 'C#',
-            'D#': 'Eb', 'Eb': 'D#',
-            'F#': 'Gb', 'Gb': 'F#',
-            'G#': 'Ab', 'Ab': 'G#',
-            'A#': 'Bb', 'Bb': 'A#'
-        }
-
-        if self.pitch in enharmonic_map:
-            new_pitch = enharmonic_map[self.pitch]
-            if prefer_flats and not new_pitch.endswith('b'):
-                new_pitch = enharmonic_map[new_pitch]
-
-            return Note(
-                pitch=new_pitch,
-                octave=self.octave,
-                duration=self.duration,
-                velocity=self.velocity,
-                position=self.position,
-                stored_midi_number=self.stored_midi_number
-            )
-        return self.model_copy()
+        """Get the enharmonic equivalent of this note.
+
+        Accidentals toggle between sharp and flat spellings; with
+        prefer_flats the flat spelling is always returned.
+        """
+        new_pitch = ENHARMONIC_NAMES.get(self.pitch)
+        if new_pitch is None:
+            return self.model_copy()
+        if prefer_flats and not new_pitch.endswith('b'):
+            new_pitch = self.pitch
+        return self.model_copy(update={'pitch': new_pitch})
+
+    def respell(self, key: str, scale_type: Any = 'MAJOR') -> 'Note':
+        """Spell this note as in a key, e.g. A# -> Bb in F major."""
+        name = spell(self.pitch, key, scale_type)
+        return self if name == self.pitch else self.model_copy(update={'pitch': name})
 
     @field_validator('pitch')
     @classmethod
@@ -197,4 +181,4 @@ class Note(BaseModel):
     @classmethod
     def validate_note_name(cls, note_name: str) -> bool:
         """Validate note name format."""
-        return bool(re.fullmatch(FULL_NOTE_REGEX, note_name))
+        return note_name in FULL_NOTE_NAMES
@@ -0,0 +1,226 @@
+"""Columnar, NumPy-backed storage for note sequences.
+
+A :class:`NoteArray` keeps one array per note attribute (MIDI number,
+duration, velocity, position, channel) so whole-sequence operations such as
+transposition or time-stretching are single vectorized passes. Notes are only
+materialized as :class:`~note_gen.models.note.Note` objects at the boundary,
+via :meth:`NoteArray.to_notes`.
+
+NumPy is optional; check ``HAS_NUMPY`` before choosing the columnar path.
+"""
+from numbers import Integral
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+from note_gen.core.constants import MIDI_MIN, MIDI_MAX, MIDI_VELOCITY_MIN, MIDI_VELOCITY_MAX
+from note_gen.core.pitch import Pitch
+from note_gen.core.spelling import FLAT_NAMES, get_spelling
+from note_gen.models.note import Note
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None  # type: ignore[assignment]
+
+HAS_NUMPY = np is not None
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("NoteArray requires numpy; install it with 'pip install numpy'")
+
+
+class NoteArray:
+    """Columnar note storage with vectorized operations.
+
+    Columns:
+        midi: MIDI note numbers (int16)
+        duration: Durations in beats (float64)
+        velocity: MIDI velocities (int16)
+        position: Positions in beats (float64)
+        channel: MIDI channels (int8)
+        flat: Whether each note is spelled with a flat (bool)
+    """
+    __slots__ = ('midi', 'duration', 'velocity', 'position', 'channel', 'flat')
+
+    def __init__(
+        self,
+        midi: Iterable[int],
+        duration: Iterable[float],
+        velocity: Iterable[int],
+        position: Iterable[float],
+        channel: Optional[Iterable[int]] = None,
+        flat: Optional[Iterable[bool]] = None
+    ) -> None:
+        _require_numpy()
+        self.midi = np.asarray(midi, dtype=np.int16)
+        self.duration = np.asarray(duration, dtype=np.float64)
+        self.velocity = np.asarray(velocity, dtype=np.int16)
+        self.position = np.asarray(position, dtype=np.float64)
+        size = len(self.midi)
+        self.channel = (np.zeros(size, dtype=np.int8) if channel is None
+                        else np.asarray(channel, dtype=np.int8))
+        self.flat = (np.zeros(size, dtype=bool) if flat is None
+                     else np.asarray(flat, dtype=bool))
+        self._validate()
+
+    def _validate(self) -> None:
+        """Validate column lengths and value ranges."""
+        size = len(self.midi)
+        for column in (self.duration, self.velocity, self.position, self.channel, self.flat):
+            if len(column) != size:
+                raise ValueError("All NoteArray columns must have the same length")
+        if size == 0:
+            return
+        if self.midi.min() < MIDI_MIN or self.midi.max() > MIDI_MAX:
+            raise ValueError(f"MIDI numbers must be between {MIDI_MIN} and {MIDI_MAX}")
+        if (self.duration <= 0).any():
+            raise ValueError("Durations must be positive")
+        if self.velocity.min() < MIDI_VELOCITY_MIN or self.velocity.max() > MIDI_VELOCITY_MAX:
+            raise ValueError(f"Velocities must be between {MIDI_VELOCITY_MIN} and {MIDI_VELOCITY_MAX}")
+        if (self.position < 0).any():
+            raise ValueError("Positions cannot be negative")
+
+    @classmethod
+    def _from_columns(cls, midi: Any, duration: Any, velocity: Any, position: Any,
+                      channel: Any, flat: Any) -> 'NoteArray':
+        """Wrap already-validated columns without copying or re-validating."""
+        array = cls.__new__(cls)
+        array.midi = midi
+        array.duration = duration
+        array.velocity = velocity
+        array.position = position
+        array.channel = channel
+        array.flat = flat
+        return array
+
+    @classmethod
+    def empty(cls) -> 'NoteArray':
+        """Create an empty note array."""
+        return cls([], [], [], [])
+
+    @classmethod
+    def from_notes(cls, notes: Sequence[Note]) -> 'NoteArray':
+        """
+        Build a note array from Note objects.
+
+        Raises:
+            ValueError: If any note has no octave
+        """
+        return cls(
+            midi=[note.to_midi_number() for note in notes],
+            duration=[note.duration for note in notes],
+            velocity=[note.velocity for note in notes],
+            position=[note.position for note in notes],
+            flat=[note.pitch.endswith('b') for note in notes]
+        )
+
+    def to_notes(self) -> List[Note]:
+        """Materialize the array as Note objects."""
+        notes: List[Note] = []
+        for midi, duration, velocity, position, flat in zip(
+            self.midi.tolist(), self.duration.tolist(), self.velocity.tolist(),
+            self.position.tolist(), self.flat.tolist()
+        ):
+            pitch = Pitch.from_midi(midi)
+            if flat:
+                pitch = Pitch.of(FLAT_NAMES[pitch.pitch_class], pitch.octave)
+            notes.append(Note(
+                pitch=pitch.name,
+                octave=pitch.octave,
+                duration=duration,
+                velocity=velocity,
+                position=position,
+                stored_midi_number=pitch.midi
+            ))
+        return notes
+
+    def __len__(self) -> int:
+        return len(self.midi)
+
+    def __getitem__(self, index: Union[slice, Any]) -> 'NoteArray':
+        """Slice the array (by slice, index array or boolean mask); an integer index gives one note."""
+        if isinstance(index, Integral):
+            # NumPy integers (e.g. from np.flatnonzero) are Integral too
+            index = int(index)
+            index = slice(index, index + 1 or None)
+        return self._from_columns(
+            self.midi[index], self.duration[index], self.velocity[index],
+            self.position[index], self.channel[index], self.flat[index]
+        )
+
+    def copy(self) -> 'NoteArray':
+        """Create an independent copy of the array."""
+        return self._from_columns(
+            self.midi.copy(), self.duration.copy(), self.velocity.copy(),
+            self.position.copy(), self.channel.copy(), self.flat.copy()
+        )
+
+    @property
+    def total_duration(self) -> float:
+        """Sum of note durations."""
+        return float(self.duration.sum())
+
+    def transpose(self, semitones: int) -> 'NoteArray':
+        """
+        Transpose all notes by the given number of semitones.
+
+        Transposed notes are spelled with sharps, matching Note.transpose.
+
+        Raises:
+            ValueError: If any note leaves the MIDI range
+        """
+        midi = self.midi.astype(np.int32) + semitones
+        if len(midi) and (midi.min() < MIDI_MIN or midi.max() > MIDI_MAX):
+            raise ValueError(f"MIDI number must be between {MIDI_MIN} and {MIDI_MAX}")
+        return self._from_columns(
+            midi.astype(np.int16), self.duration.copy(), self.velocity.copy(),
+            self.position.copy(), self.channel.copy(), np.zeros(len(midi), dtype=bool)
+        )
+
+    def respell(self, key: str, scale_type: Any = 'MAJOR') -> 'NoteArray':
+        """Spell every note as in a key (one table lookup for the whole array)."""
+        key_flats = np.array([name.endswith('b') for name in get_spelling(key, scale_type)], dtype=bool)
+        return self._from_columns(
+            self.midi.copy(), self.duration.copy(), self.velocity.copy(),
+            self.position.copy(), self.channel.copy(), key_flats[self.midi % 12]
+        )
+
+    def time_stretch(self, factor: float) -> 'NoteArray':
+        """Scale durations and positions by the given factor."""
+        if factor <= 0:
+            raise ValueError("Stretch factor must be positive")
+        return self._from_columns(
+            self.midi.copy(), self.duration * factor, self.velocity.copy(),
+            self.position * factor, self.channel.copy(), self.flat.copy()
+        )
+
+    def scale_velocity(self, factor: float) -> 'NoteArray':
+        """Scale velocities by the given factor, clamped to the MIDI range."""
+        velocity = np.clip(np.rint(self.velocity * factor), MIDI_VELOCITY_MIN, MIDI_VELOCITY_MAX)
+        return self._from_columns(
+            self.midi.copy(), self.duration.copy(), velocity.astype(np.int16),
+            self.position.copy(), self.channel.copy(), self.flat.copy()
+        )
+
+    @classmethod
+    def concatenate(cls, arrays: Sequence['NoteArray']) -> 'NoteArray':
+        """Concatenate arrays, keeping each note's own position."""
+        if not arrays:
+            return cls.empty()
+        return cls._from_columns(
+            np.concatenate([a.midi for a in arrays]),
+            np.concatenate([a.duration for a in arrays]),
+            np.concatenate([a.velocity for a in arrays]),
+            np.concatenate([a.position for a in arrays]),
+            np.concatenate([a.channel for a in arrays]),
+            np.concatenate([a.flat for a in arrays])
+        )
+
+    def append(self, other: 'NoteArray') -> 'NoteArray':
+        """Concatenate another array after this one, shifting its positions
+        by this array's total duration."""
+        shifted = self._from_columns(
+            other.midi, other.duration, other.velocity,
+            other.position + self.total_duration, other.channel, other.flat
+        )
+        return self.concatenate([self, shifted])
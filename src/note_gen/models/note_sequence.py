@@ -1,14 +1,16 @@
 """Models for note sequences."""
+from copy import deepcopy
 from typing import List, Optional, Dict, Any, Tuple
 from pydantic import Field
 from note_gen.models.note import Note
+from note_gen.models.note_array import NoteArray
 from note_gen.models.scale_info import ScaleInfo
 from note_gen.models.chord_progression import ChordProgression
 from note_gen.models.sequence import Sequence
 from note_gen.core.constants import DEFAULTS
 from note_gen.validation.base_validation import ValidationResult
 from note_gen.core.enums import ValidationLevel
-from note_gen.validation.sequence_validation import validate_note_sequence
+from note_gen.validation.rule_registry import RULES
 
 class NoteSequence(Sequence):
     """Model for note sequences."""
@@ -26,18 +28,8 @@ class NoteSequence(Sequence):
     rhythm_pattern_name: Optional[str] = None
 
     def validate_sequence(self, level: ValidationLevel = ValidationLevel.NORMAL) -> ValidationResult:
-        """Validate the sequence using sequence validation rules."""
-        result = validate_note_sequence(self.notes, level)
-
-        # Additional validations
-        total_duration = sum(note.duration for note in self.notes)
-        if abs(total_duration - self.duration) > 0.001:  # Allow small floating-point differences
-            result.add_error(
-                field="duration",
-                message=f"Total duration ({self.duration}) does not match sum of note durations ({total_duration})"
-            )
-
-        return result
+        """Validate the sequence with the rules registered for note sequences."""
+        return RULES.validate(self, level)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert sequence to dictionary."""
@@ -56,13 +48,23 @@ class NoteSequence(Sequence):
 
     def clone(self) -> 'NoteSequence':
         """Create a deep copy of the sequence."""
-        return self.__class__(**self.model_dump())
+        # Note fields are immutable values, so a shallow copy per note is a deep
+        # copy; this avoids the full dump/validate round-trip.
+        return self._copy_with_notes([note.model_copy() for note in self.notes])
+
+    def _copy_with_notes(self, notes: List[Note]) -> 'NoteSequence':
+        """Deep-copy everything except the notes, which are taken as given."""
+        fields = {name: value for name, value in self.__dict__.items() if name != 'notes'}
+        return self.model_copy(update={**deepcopy(fields), 'notes': notes})
+
+    def to_array(self) -> NoteArray:
+        """Get the notes in columnar form for vectorized operations."""
+        return NoteArray.from_notes(self.notes)
 
     def transpose(self, semitones: int) -> 'NoteSequence':
         """Create a new sequence with all notes transposed by the specified number of semitones."""
-        new_sequence = self.clone()
-        new_sequence.notes = [note.transpose(semitones) for note in self.notes]
-        return new_sequence
+        # Per-note copies beat a NoteArray round trip, which re-validates every note it builds
+        return self._copy_with_notes([note.transpose(semitones) for note in self.notes])
 
     @classmethod
     def from_notes(cls, notes: List[Note], **kwargs) -> 'NoteSequence':
@@ -74,6 +76,14 @@ class NoteSequence(Sequence):
             **kwargs
         )
 
+    @classmethod
+    def from_array(cls, array: NoteArray, **kwargs) -> 'NoteSequence':
+        """Create a sequence from a NoteArray, materializing its notes."""
+        kwargs.setdefault('duration', array.total_duration)
+        sequence = cls(**kwargs)
+        sequence.notes = array.to_notes()
+        return sequence
+
     @classmethod
     def empty(cls, **kwargs) -> 'NoteSequence':
         """Create an empty sequence."""
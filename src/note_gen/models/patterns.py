@@ -26,6 +26,7 @@ from ..core.constants import (
     PATTERN_VALIDATION_LIMITS,  # Add this import
     DEFAULTS  # Add this import
 )
+from ..core.note_parser import parse_many
 from ..core.enums import (
     ValidationLevel,
     ScaleType,
@@ -169,14 +170,27 @@ class NotePattern(Pattern):
     def _convert_pattern(self, pattern_data: Sequence[Union[str, Note, Dict[str, Any]]]) -> List[Note]:
         """Convert pattern data to Note objects."""
         result: List[Note] = []
+        # Parse all note-name strings in one batch up front
+        parsed_names = iter(parse_many(
+            [item for item in pattern_data if isinstance(item, str)],
+            strict=False
+        ))
         for item in pattern_data:
             if isinstance(item, str):
-                try:
-                    note = Note.from_name(item)
-                    result.append(note)
-                except Exception as e:
-                    print(f"Error converting string note: {e}")
-                    # Skip this note
+                parsed = next(parsed_names)
+                if parsed is None:
+                    print(f"Error converting string note: Invalid note name: {item.strip()}")
+                    continue
+                pitch, octave = parsed
+                # Parsed names are already canonical, so skip re-validation
+                result.append(Note.model_construct(
+                    pitch=pitch,
+                    octave=4 if octave is None else octave,
+                    duration=1.0,
+                    velocity=64,
+                    position=0.0,
+                    stored_midi_number=None
+                ))
             elif isinstance(item, Note):
                 result.append(item)
             elif isinstance(item, dict):
@@ -15,6 +15,7 @@ from .note import Note
 from .patterns import NotePattern, NotePatternData
 from note_gen.core.enums import ScaleType, ChordQuality
 from note_gen.core.constants import COMMON_PROGRESSIONS, DEFAULTS
+from note_gen.core.roman_numerals import resolve_progression
 
 # Default values
 DEFAULT_KEY = "C"
@@ -37,39 +38,45 @@ class ChordProgressionPreset(BaseModel):
     def to_chord_progression(self, key: str, scale_type: ScaleType) -> ChordProgression:
         """Convert preset to ChordProgression."""
         scale_info = ScaleInfo(key=key, scale_type=scale_type)
-        chords: Sequence[ChordProgressionItem] = []
+        resolved = resolve_progression(self.numerals, key, scale_type)
 
-        for i, numeral in enumerate(self.numerals):
+        chords: List[Chord] = []
+        items: List[ChordProgressionItem] = []
+        position = 0.0
+        for i, chord_info in enumerate(resolved):
             duration = self.durations[i] if self.durations else 1.0
-            quality_str = self.qualities[i] if self.qualities else None
-            roman = RomanNumeral.from_string(numeral)
-            chord = roman.to_chord(scale_info)
-
-            # Determine the quality
-            if quality_str is not None:
-                quality = ChordQuality(quality_str)  # Convert string to enum
-            else:
-                quality = (ChordQuality.MINOR if roman.is_minor()
-                          else ChordQuality.MAJOR)
-
-            # Create ChordProgressionItem
-            chord_item = ChordProgressionItem(
-                chord=numeral,  # Use the roman numeral string
-                root=chord.root.note_name,  # Get the note name string from the root Note object
+            quality = chord_info.quality
+            if self.qualities:
+                quality = _parse_quality(self.qualities[i])
+
+            chord = Chord(root=chord_info.root, quality=quality, duration=duration)
+            chords.append(chord)
+            items.append(ChordProgressionItem(
+                chord_symbol=chord.to_symbol(),
+                chord=chord,
                 duration=duration,
-                position=float(sum(self.durations[:i] if self.durations else [1.0] * i)),
-                quality=quality  # Now properly typed as ChordQuality
-            )
-            chords.append(chord_item)
+                position=position
+            ))
+            position += duration
 
         return ChordProgression(
             name=self.name,
-            chords=list(chords),  # Convert Sequence to List
+            chords=chords,
+            items=items,
             key=key,
             scale_type=scale_type,
-            scale_info=scale_info
+            scale_info=scale_info,
+            total_duration=position
         )
 
+
+def _parse_quality(quality: str) -> ChordQuality:
+    """Parse a quality given as an enum value ('MAJOR') or a chord-symbol suffix ('m7')."""
+    try:
+        return ChordQuality(quality.upper())
+    except ValueError:
+        return ChordQuality.from_string(quality)
+
 def create_default_note_pattern() -> NotePattern:
     """Create default note pattern."""
     return NotePattern(
@@ -117,9 +124,12 @@ class Presets(BaseModel):
         if name not in self.common_progressions:
             raise ValueError(f"Unknown progression: {name}")
 
+        # Progression names spell their numerals, e.g. 'I-V-vi-IV'
+        progression = self.common_progressions[name]
+        numerals = progression['name'].split('-') if isinstance(progression, dict) else progression
         return [
-            RomanNumeral.from_string(numeral).to_chord(scale_info)
-            for numeral in self.common_progressions[name]
+            Chord(root=chord.root, quality=chord.quality)
+            for chord in resolve_progression(numerals, scale_info.key, scale_info.scale_type)
         ]
 
     def create_pattern(self, pattern_data: Dict[str, Any]) -> NotePattern:
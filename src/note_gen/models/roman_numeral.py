@@ -9,7 +9,12 @@ from note_gen.core.constants import (
     SCALE_DEGREE_QUALITIES,
     DEFAULT_SCALE_DEGREE_QUALITIES
 )
+from note_gen.core.enums import ScaleType
+from note_gen.core.roman_numerals import ACCIDENTAL_OFFSETS, ParsedNumeral, parse_numeral, resolve_parsed
 from note_gen.models.chord import Chord
+from note_gen.models.scale_info import ScaleInfo
+
+_OFFSET_ACCIDENTALS = {offset: accidental or None for accidental, offset in ACCIDENTAL_OFFSETS.items()}
 
 ROMAN_NUMERAL_PATTERN = r'^[IViv]+$'
 
@@ -78,29 +83,36 @@ class RomanNumeral(BaseModel):
 
     @classmethod
     def from_string(cls, value: str) -> 'RomanNumeral':
-        """Create a RomanNumeral from a string representation."""
-        import re
-
-        match = re.match(ROMAN_NUMERAL_PATTERN, value)
-        if not match:
-            raise ValueError(f"Invalid Roman numeral format: {value}")
+        """Create a RomanNumeral from a string representation (e.g. 'bVII', 'V65', 'V7/V')."""
+        return cls._from_parsed(parse_numeral(value))
 
-        accidental, numeral, quality_str, *_ = match.groups()
-
-        # Create base instance
-        instance = cls(
-            numeral=numeral,
-            accidental=accidental if accidental else None
+    @classmethod
+    def _from_parsed(cls, parsed: ParsedNumeral) -> 'RomanNumeral':
+        """Create a RomanNumeral from a compiled numeral."""
+        return cls(
+            numeral=parsed.numeral,
+            quality=parsed.quality,
+            inversion=parsed.inversion or None,
+            accidental=_OFFSET_ACCIDENTALS[parsed.accidental],
+            secondary=None if parsed.secondary is None else cls._from_parsed(parsed.secondary)
         )
 
-        # Add quality if present
-        if quality_str:
-            try:
-                instance.quality = ChordQuality.from_string(quality_str)
-            except ValueError:
-                pass  # Keep default quality if string conversion fails
-
-        return instance
+    def to_parsed(self) -> ParsedNumeral:
+        """Compile this numeral for the Roman-numeral engine."""
+        lower = self.numeral.islower()
+        quality = self.quality
+        if quality is None:
+            quality = ChordQuality.MINOR if lower else ChordQuality.MAJOR
+        return ParsedNumeral(
+            numeral=self.numeral,
+            degree=ROMAN_TO_INT[self.numeral.upper()],
+            accidental=ACCIDENTAL_OFFSETS[self.accidental or ''],
+            quality=quality,
+            inversion=self.inversion or 0,
+            # Case-implied qualities follow the scale (e.g. vii in major is diminished)
+            implied=lower and quality in (ChordQuality.MINOR, ChordQuality.MINOR_SEVENTH),
+            secondary=None if self.secondary is None else self.secondary.to_parsed()
+        )
 
     def __str__(self) -> str:
         """String representation of the Roman numeral."""
@@ -116,10 +128,20 @@ class RomanNumeral(BaseModel):
             parts.append(f"/{str(self.secondary)}")
         return "".join(parts)
 
-    def to_chord(self) -> Chord:
-        """Convert Roman numeral to a Chord object."""
-        # Implementation...
-        pass
+    def to_chord(self, scale_info: Optional[ScaleInfo] = None) -> Chord:
+        """
+        Convert Roman numeral to a Chord object.
+
+        Args:
+            scale_info: Key to resolve the numeral in (defaults to C major)
+
+        Returns:
+            Chord: The resolved chord
+        """
+        key = scale_info.key if scale_info is not None else 'C'
+        scale_type = scale_info.scale_type if scale_info is not None else ScaleType.MAJOR
+        resolved = resolve_parsed(self.to_parsed(), key, scale_type)
+        return Chord(root=resolved.root, quality=resolved.quality)
 
     @property
     def is_minor(self) -> bool:
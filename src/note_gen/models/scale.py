@@ -3,7 +3,10 @@ from typing import List, Optional, Union, Dict, Any
 from pydantic import Field, field_validator, ConfigDict, model_validator
 from note_gen.models.base import BaseModelWithConfig
 from note_gen.models.note import Note
+from note_gen.core.constants import NOTE_TO_SEMITONE
 from note_gen.core.enums import ScaleType
+from note_gen.core.pitch_class_set import PitchClassSet
+from note_gen.core.scale_catalog import get_scale_table
 
 class ScaleInfo(BaseModelWithConfig):
     """Information about a musical scale."""
@@ -38,12 +41,19 @@ class Scale(BaseModelWithConfig):
 
     def generate_notes(self) -> 'Scale':
         """Generate the notes of the scale based on root note and scale type."""
-        intervals = self.scale_type.intervals
         # Ensure root is a Note object
         if isinstance(self.root, str):
             self.root = Note.from_name(self.root)
         root_midi = self.root.to_midi_number()
 
+        if self.root.octave is not None:
+            table = get_scale_table(self.root.pitch, self.scale_type, self.root.octave)
+            if table.root_midi == root_midi:
+                self.notes = [Note.from_pitch(pitch) for pitch in table.ascending]
+                return self
+
+        # Root with a stored MIDI number that disagrees with its spelling
+        intervals = self.scale_type.intervals
         self.notes = []
         for interval in intervals:
             note_midi = root_midi + interval
@@ -76,20 +86,19 @@ class Scale(BaseModelWithConfig):
             return None
         return self.notes[degree - 1]
 
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        """Get the scale's pitch classes as a bitmask set."""
+        root_semitone = self.root.to_midi_number() % 12
+        if NOTE_TO_SEMITONE.get(self.root.pitch) == root_semitone:
+            return get_scale_table(self.root.pitch, self.scale_type).pitch_classes
+        # Root with a stored MIDI number that disagrees with its spelling
+        return PitchClassSet.from_intervals(root_semitone, self.scale_type.intervals)
+
     def contains_note(self, note: Note) -> bool:
         """Check if a note is in the scale."""
-        note_midi = note.to_midi_number()
-        # All notes should have a MIDI number, but just in case
-        if note_midi is None:
-            # This is technically unreachable since to_midi_number always returns an int
-            # but we keep it for type safety
-            return False
-
         # Check if the note's pitch class (note % 12) is in the scale
-        return any(
-            (n.to_midi_number() or 0) % 12 == note_midi % 12
-            for n in self.notes
-        )
+        return note.to_midi_number() in self.pitch_class_set
 
     def transpose(self, semitones: int) -> 'Scale':
         """Create a new scale transposed by the specified number of semitones."""
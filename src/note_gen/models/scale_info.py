@@ -1,12 +1,10 @@
 """Scale information model."""
 from typing import List
 from pydantic import BaseModel, Field, field_validator
-from ..core.constants import (
-    SCALE_INTERVALS,
-    NOTE_TO_SEMITONE,
-    SEMITONE_TO_NOTE
-)
 from ..core.enums import ScaleType
+from ..core.note_parser import PITCH_NAMES
+from ..core.pitch_class_set import PitchClassSet
+from ..core.scale_catalog import ScaleTable, get_scale_table
 from .note import Note
 
 class ScaleInfo(BaseModel):
@@ -20,34 +18,30 @@ class ScaleInfo(BaseModel):
         # Remove any whitespace
         v = v.strip()
 
-        # Check if the key matches the pattern: [A-G](#|b)?
-        import re
-        if not re.match(r'^[A-G][#b]?$', v):
+        # Keys must use a canonical spelling: [A-G](#|b)?
+        if v not in PITCH_NAMES:
             raise ValueError(f"Invalid key format: {v}")
         return v
 
+    def get_table(self, octave: int = 4) -> ScaleTable:
+        """Get the precomputed scale table for a given octave."""
+        return get_scale_table(self.key, self.scale_type, octave)
+
     def get_scale_notes(self, octave: int = 4) -> List[Note]:
         """Get all notes in the scale for a given octave."""
-        root_semitone = NOTE_TO_SEMITONE[self.key]
-        intervals = SCALE_INTERVALS[self.scale_type.value]  # Use the enum's value
-
-        notes = []
-        for interval in intervals:
-            # Calculate the semitone for this scale degree
-            note_semitone = (root_semitone + interval) % 12
-            note_name = SEMITONE_TO_NOTE[note_semitone]
-            notes.append(Note(pitch=note_name, octave=octave, duration=1.0, velocity=64, position=0.0, stored_midi_number=None))
+        return [
+            Note(pitch=pitch.name, octave=pitch.octave, duration=1.0, velocity=64, position=0.0, stored_midi_number=None)
+            for pitch in self.get_table(octave).pitches
+        ]
 
-        return notes
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        """Get the scale's pitch classes as a bitmask set."""
+        return self.get_table().pitch_classes
 
     def is_note_in_scale(self, note: Note) -> bool:
-        """Check if a note is in the scale."""
-        if note.octave is None:
-            # Default to octave 4 if not specified
-            scale_notes = self.get_scale_notes(4)
-        else:
-            scale_notes = self.get_scale_notes(note.octave)
-        return any(n.pitch == note.pitch for n in scale_notes)
+        """Check if a note is in the scale (enharmonic spellings match)."""
+        return note.pitch in self.pitch_class_set
 
     def get_scale_degree(self, pitch: str) -> int:
         """Get the scale degree (1-based) for a given pitch.
@@ -58,11 +52,7 @@ class ScaleInfo(BaseModel):
         Returns:
             The scale degree (1-7) if the pitch is in the scale, raises ValueError otherwise
         """
-        scale_notes = self.get_scale_notes()
-        for i, note in enumerate(scale_notes, 1):
-            if note.pitch == pitch:
-                return i
-        raise ValueError(f"Pitch {pitch} is not in the scale {self.key} {self.scale_type.value}")
+        return self.get_table().degree_of(pitch)
 
     def __str__(self) -> str:
         """String representation of the scale."""
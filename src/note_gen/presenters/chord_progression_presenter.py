@@ -9,18 +9,20 @@ from typing import List, Dict, Any, Optional
 
 from note_gen.models.chord_progression import ChordProgression
 from note_gen.models.chord import Chord
+from note_gen.core.chord_voicing import fit_octave, get_voicing
 
 
 class ChordProgressionPresenter:
     """Presenter for chord progression data."""
 
     @staticmethod
-    def present(progression: ChordProgression) -> Dict[str, Any]:
+    def present(progression: ChordProgression, include_voicings: bool = False) -> Dict[str, Any]:
         """
         Format a chord progression for API response.
 
         Args:
             progression: The chord progression to format
+            include_voicings: Whether to add each chord's voiced note names
 
         Returns:
             Formatted chord progression data
@@ -34,11 +36,11 @@ class ChordProgressionPresenter:
 
         # Add chords if available
         if progression.chords:
-            result["chords"] = ChordProgressionPresenter._format_chords(progression.chords)
+            result["chords"] = ChordProgressionPresenter._format_chords(progression.chords, include_voicings)
 
         # Add items if available
         if progression.items:
-            result["items"] = ChordProgressionPresenter._format_items(progression.items)
+            result["items"] = ChordProgressionPresenter._format_items(progression.items, include_voicings)
 
         # Add description if available
         if progression.description:
@@ -51,46 +53,66 @@ class ChordProgressionPresenter:
         return result
 
     @staticmethod
-    def present_many(progressions: List[ChordProgression]) -> List[Dict[str, Any]]:
+    def present_many(progressions: List[ChordProgression], include_voicings: bool = False) -> List[Dict[str, Any]]:
         """
         Format multiple chord progressions for API response.
 
         Args:
             progressions: The chord progressions to format
+            include_voicings: Whether to add each chord's voiced note names
 
         Returns:
             List of formatted chord progression data
         """
-        return [ChordProgressionPresenter.present(prog) for prog in progressions]
+        return [ChordProgressionPresenter.present(prog, include_voicings) for prog in progressions]
 
     @staticmethod
-    def _format_chords(chords: List[Chord]) -> List[Dict[str, Any]]:
+    def _format_voicing(chord: Chord) -> List[str]:
+        """
+        Get the voiced note names of a chord from the shared voicing cache.
+
+        Args:
+            chord: The chord to voice
+
+        Returns:
+            Note names, e.g. ['C4', 'E4', 'G4']
+        """
+        octave = fit_octave(chord.root, chord.quality, 4 if chord.octave is None else chord.octave)
+        return [pitch.note_name for pitch in get_voicing(chord.root, chord.quality, octave)]
+
+    @staticmethod
+    def _format_chords(chords: List[Chord], include_voicings: bool = False) -> List[Dict[str, Any]]:
         """
         Format chord data for API response.
 
         Args:
             chords: The chords to format
+            include_voicings: Whether to add each chord's voiced note names
 
         Returns:
             List of formatted chord data
         """
-        return [
-            {
+        result = []
+        for chord in chords:
+            chord_dict = {
                 "root": chord.root,
                 "quality": chord.quality.value if hasattr(chord.quality, "value") else chord.quality,
                 "duration": chord.duration,
                 "position": chord.position if hasattr(chord, "position") else None,
             }
-            for chord in chords
-        ]
+            if include_voicings:
+                chord_dict["voicing"] = ChordProgressionPresenter._format_voicing(chord)
+            result.append(chord_dict)
+        return result
 
     @staticmethod
-    def _format_items(items: List[Any]) -> List[Dict[str, Any]]:
+    def _format_items(items: List[Any], include_voicings: bool = False) -> List[Dict[str, Any]]:
         """
         Format chord progression items for API response.
 
         Args:
             items: The chord progression items to format
+            include_voicings: Whether to add each chord's voiced note names
 
         Returns:
             List of formatted chord progression item data
@@ -113,6 +135,8 @@ class ChordProgressionPresenter:
                         "root": item.chord.root,
                         "quality": item.chord.quality.value if hasattr(item.chord.quality, "value") else item.chord.quality,
                     }
+                    if include_voicings and isinstance(item.chord, Chord):
+                        item_dict["chord"]["voicing"] = ChordProgressionPresenter._format_voicing(item.chord)
                 else:
                     item_dict["chord"] = str(item.chord)
 
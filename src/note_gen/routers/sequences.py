@@ -2,11 +2,13 @@ from fastapi import APIRouter, HTTPException, Depends, Body, Query
 from typing import Dict, Any, List, Optional
 
 from note_gen.controllers.sequence_controller import SequenceController
+from note_gen.core.enums import VoicingMode
 from note_gen.presenters.sequence_presenter import SequencePresenter
 from note_gen.dependencies import get_sequence_controller
 from note_gen.models.note import Note
 from note_gen.models.sequence import Sequence
 from note_gen.models.note_sequence import NoteSequence
+from note_gen.schemas.sequence_request import SequenceGenerationRequest
 
 router = APIRouter(tags=["sequences"])
 
@@ -58,6 +60,7 @@ async def generate_sequence(
     progression_name: str = Body(...),
     pattern_name: str = Body(...),
     rhythm_pattern_name: str = Body(...),
+    voicing_mode: VoicingMode = Body(VoicingMode.ROOT_POSITION),
     controller: SequenceController = Depends(get_sequence_controller)
 ):
     """Generate a sequence from a chord progression and patterns."""
@@ -65,14 +68,76 @@ async def generate_sequence(
         sequence = await controller.generate_sequence(
             progression_name=progression_name,
             pattern_name=pattern_name,
-            rhythm_pattern_name=rhythm_pattern_name
+            rhythm_pattern_name=rhythm_pattern_name,
+            voicing_mode=voicing_mode
         )
         return SequencePresenter.present_note_sequence(sequence)
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/generate-long-form")
+async def generate_long_form(
+    progression_name: str = Body(...),
+    pattern_name: str = Body(...),
+    rhythm_pattern_name: str = Body(...),
+    total_bars: int = Body(..., gt=0),
+    chunk_bars: Optional[int] = Body(None, gt=0),
+    job_id: Optional[str] = Body(None),
+    genre: Optional[str] = Body(None),
+    seed: Optional[int] = Body(None),
+    voicing_mode: VoicingMode = Body(VoicingMode.ROOT_POSITION),
+    controller: SequenceController = Depends(get_sequence_controller)
+):
+    """Generate a long piece in chunks, saving each chunk; repeating a job_id resumes it."""
+    try:
+        checkpoint = await controller.generate_long_form(
+            progression_name=progression_name,
+            pattern_name=pattern_name,
+            rhythm_pattern_name=rhythm_pattern_name,
+            total_bars=total_bars,
+            chunk_bars=chunk_bars,
+            job_id=job_id,
+            genre=genre,
+            seed=seed,
+            voicing_mode=voicing_mode
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "job_id": checkpoint.job_id,
+        "chunks": checkpoint.chunk,
+        "bars": checkpoint.bar,
+        "complete": checkpoint.complete
+    }
+
+@router.post("/generate-batch")
+async def generate_sequences_batch(
+    requests: List[SequenceGenerationRequest] = Body(..., embed=True),
+    controller: SequenceController = Depends(get_sequence_controller)
+):
+    """Generate many sequences in one batch, sharing work between requests with the same inputs."""
+    try:
+        results = await controller.generate_sequences_batch(requests)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "results": [
+            {"sequence": SequencePresenter.present_note_sequence(result["sequence"])}
+            if "sequence" in result else result
+            for result in results
+        ]
+    }
+
 @router.get("/by-name/{sequence_name}")
 async def get_sequence_by_name(
     sequence_name: str,
@@ -143,3 +143,15 @@ async def validate_config(
         return {"is_valid": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Validation error: {str(e)}")
+
+@router.get("/cache-stats")
+async def validation_cache_stats(
+    controller: ValidationController = Depends(get_validation_controller)
+):
+    """
+    Get the validation cache's size and hit rate.
+
+    Returns:
+        Dict[str, Any]: The cache metrics
+    """
+    return await controller.cache_metrics()
@@ -0,0 +1,11 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+from note_gen.core.enums import VoicingMode
+
+class SequenceGenerationRequest(BaseModel):
+    """Request model for generating one sequence from stored inputs."""
+    progression_name: str
+    pattern_name: str
+    rhythm_pattern_name: str
+    transpose: Optional[int] = Field(default=None, description="Semitones to transpose the sequence by")
+    voicing_mode: VoicingMode = Field(default=VoicingMode.ROOT_POSITION)
@@ -9,6 +9,7 @@ from note_gen.core.constants import (
     COLLECTION_NAMES,
     VALID_KEYS,
     CHORD_INTERVALS,
+    CHORD_EXTENSION_INTERVALS,
     DURATION_LIMITS,
     RANGE_LIMITS,
     PATTERN_VALIDATION_LIMITS,
@@ -57,8 +58,11 @@ class ConstantValidator:
             if not all(isinstance(i, int) for i in interval_tuple):
                 result.add_error("interval_type", f"All intervals for {quality} must be integers")
                 
-            if not all(0 <= i <= 11 for i in interval_tuple):
-                result.add_error("interval_range", f"All intervals for {quality} must be between 0 and 11")
+            if not all(0 <= i <= 11 or i in CHORD_EXTENSION_INTERVALS for i in interval_tuple):
+                result.add_error(
+                    "interval_range",
+                    f"All intervals for {quality} must be between 0 and 11, or a ninth, eleventh or thirteenth extension"
+                )
                 
         return result
 
@@ -2,6 +2,7 @@
 from typing import Dict, Any, List, TypeVar, Type, Optional
 from .base_validation import ValidationResult, ValidationViolation
 from .pattern_types import PatternValidatable
+from .rule_registry import RULES
 from ..core.enums import ValidationLevel
 from ..core.constants import DURATION_LIMITS
 from ..models.rhythm import RhythmPattern
@@ -25,41 +26,8 @@ class PatternValidation:
 
     @staticmethod
     def validate_rhythm_pattern(pattern: RhythmPattern) -> ValidationResult:
-        """Validate a rhythm pattern."""
-        violations = []
-
-        if not pattern.pattern:
-            violations.append(
-                ValidationViolation(
-                    code="EMPTY_PATTERN",
-                    message="Pattern cannot be empty"
-                )
-            )
-
-        # Validate time signature
-        numerator, denominator = pattern.time_signature
-        if denominator not in [1, 2, 4, 8, 16, 32, 64]:
-            violations.append(
-                ValidationViolation(
-                    code="INVALID_TIME_SIGNATURE",
-                    message="Time signature denominator must be a power of 2"
-                )
-            )
-
-        # Validate note positions are ordered
-        positions = [note.position for note in pattern.pattern]
-        if positions != sorted(positions):
-            violations.append(
-                ValidationViolation(
-                    code="UNORDERED_POSITIONS",
-                    message="Notes must be ordered by position"
-                )
-            )
-
-        return ValidationResult(
-            is_valid=len(violations) == 0,
-            violations=violations
-        )
+        """Validate a rhythm pattern with the rules registered for rhythm patterns."""
+        return RULES.validate(pattern)
 
     @staticmethod
     def validate_pattern_structure(data: Dict[str, Any]) -> List[ValidationViolation]:
@@ -0,0 +1,371 @@
+"""
+Registry of level-aware validation rules, compiled into per-model pipelines.
+
+Each rule declares the validation levels and model types it applies to, so
+picking the rules for a request is done once: the first validation of a
+(model type, level) pair compiles the matching rules into a
+:class:`ValidationPipeline`, which later validations reuse.
+
+Rules come in two kinds:
+
+- model rules see the whole model once (an empty sequence, a duration that
+  does not match the notes, an unordered rhythm);
+- per-note rules see one note index of the model's notes, and may look back
+  at earlier notes for intervals or motion.
+
+A pipeline fuses all its per-note rules into a single traversal of the notes,
+however many of them apply. Violations are still reported grouped by rule,
+in registration order, so the result does not depend on the fusion.
+
+Model types are matched by class name along the model's MRO, as in
+:class:`~note_gen.validation.validation_factory.ValidationFactory`; a plain
+list of notes is validated as model type ``list``.
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+from note_gen.core.constants import MIDI_MAX, MIDI_MIN
+from note_gen.core.enums import ValidationLevel
+from note_gen.validation.base_validation import ValidationResult, ValidationViolation
+from note_gen.validation.note_validation import ALLOWED_PITCH_REGEX
+
+Violations = Optional[List[ValidationViolation]]
+
+ALL_LEVELS: FrozenSet[ValidationLevel] = frozenset(ValidationLevel)
+
+# Every level but RELAXED, which only checks what a note is
+CHECKED_LEVELS: FrozenSet[ValidationLevel] = ALL_LEVELS - {ValidationLevel.RELAXED}
+
+STRICT_LEVELS: FrozenSet[ValidationLevel] = frozenset({ValidationLevel.STRICT})
+
+# Model types whose notes the musical rules check; a NoteSequence only has
+# its durations checked, as sequence validation always did
+NOTE_LISTS: FrozenSet[str] = frozenset({'list'})
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """A validation rule and where it applies.
+
+    Attributes:
+        name: Rule name
+        check: ``check(model)`` for model rules, ``check(notes, index)`` for
+            per-note rules; returns the violations found, or None
+        levels: Validation levels the rule runs at
+        model_types: Class names of the models the rule applies to
+        per_note: Whether the rule runs once per note
+        once: Whether a per-note rule stops at its first violation
+    """
+    name: str
+    check: Callable[..., Violations]
+    levels: FrozenSet[ValidationLevel] = ALL_LEVELS
+    model_types: FrozenSet[str] = NOTE_LISTS
+    per_note: bool = False
+    once: bool = False
+
+
+@dataclass(frozen=True)
+class ValidationPipeline:
+    """The rules compiled for one (model type, level) pair.
+
+    Attributes:
+        rules: Matching rules, in registration order
+    """
+    rules: Tuple[ValidationRule, ...]
+
+    def run(self, model: Any) -> ValidationResult:
+        """
+        Validate a model with every rule, walking its notes once.
+
+        Args:
+            model: Model to validate (or a list of notes)
+
+        Returns:
+            ValidationResult with the violations of every rule
+        """
+        found: List[List[ValidationViolation]] = [[] for _ in self.rules]
+        active = []
+        for rule, violations in zip(self.rules, found):
+            if rule.per_note:
+                active.append((rule.check, rule.once, violations))
+            else:
+                violations.extend(rule.check(model) or ())
+
+        if active:
+            notes = model if isinstance(model, list) else model.notes
+            for index in range(len(notes)):
+                done = False
+                for check, once, violations in active:
+                    found_here = check(notes, index)
+                    if found_here:
+                        violations.extend(found_here)
+                        done = done or once
+                if done:
+                    active = [entry for entry in active if not (entry[1] and entry[2])]
+                    if not active:
+                        break
+
+        violations = [violation for rule_violations in found for violation in rule_violations]
+        return ValidationResult(is_valid=not violations, violations=violations)
+
+
+class RuleRegistry:
+    """Validation rules, and the pipelines compiled from them."""
+
+    def __init__(self) -> None:
+        self._rules: List[ValidationRule] = []
+        self._pipelines: Dict[Tuple[type, ValidationLevel], ValidationPipeline] = {}
+        self.version = 0
+
+    def register(self, rule: ValidationRule) -> ValidationRule:
+        """
+        Add a rule, discarding the pipelines compiled without it.
+
+        Bumps :attr:`version`, so results cached under the old rules are
+        no longer found.
+
+        Args:
+            rule: Rule to add
+
+        Returns:
+            The rule
+        """
+        self._rules.append(rule)
+        self._pipelines.clear()
+        self.version += 1
+        return rule
+
+    def rule(
+        self,
+        name: str,
+        levels: Iterable[ValidationLevel] = ALL_LEVELS,
+        model_types: Iterable[str] = NOTE_LISTS,
+        per_note: bool = False,
+        once: bool = False
+    ) -> Callable[[Callable[..., Violations]], Callable[..., Violations]]:
+        """Decorator registering a function as a rule's check."""
+        def decorator(check: Callable[..., Violations]) -> Callable[..., Violations]:
+            self.register(ValidationRule(
+                name=name,
+                check=check,
+                levels=frozenset(levels),
+                model_types=frozenset(model_types),
+                per_note=per_note,
+                once=once
+            ))
+            return check
+        return decorator
+
+    def pipeline(
+        self, model_type: type, level: Union[ValidationLevel, str] = ValidationLevel.NORMAL
+    ) -> ValidationPipeline:
+        """
+        Get the compiled pipeline for a model type and level.
+
+        Args:
+            model_type: Class of the models to validate
+            level: Validation level
+
+        Returns:
+            The rules matching the type and level
+        """
+        level = ValidationLevel(level)
+        key = (model_type, level)
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            names = {cls.__name__ for cls in model_type.__mro__}
+            pipeline = ValidationPipeline(tuple(
+                rule for rule in self._rules
+                if level in rule.levels and not names.isdisjoint(rule.model_types)
+            ))
+            self._pipelines[key] = pipeline
+        return pipeline
+
+    def applies_to(self, model_type: type) -> bool:
+        """Whether any rule applies to a model type, at any level."""
+        names = {cls.__name__ for cls in model_type.__mro__}
+        return any(not names.isdisjoint(rule.model_types) for rule in self._rules)
+
+    def validate(
+        self, model: Any, level: Union[ValidationLevel, str] = ValidationLevel.NORMAL
+    ) -> ValidationResult:
+        """
+        Validate a model with the pipeline compiled for its type and the level.
+
+        Args:
+            model: Model to validate (or a list of notes)
+            level: Validation level
+
+        Returns:
+            ValidationResult with the violations found
+        """
+        return self.pipeline(type(model), level).run(model)
+
+
+RULES = RuleRegistry()
+
+_PITCH_FORMAT = re.compile(ALLOWED_PITCH_REGEX)
+
+# The violations of the note-list rules are built by these helpers, which
+# the vectorized validator shares so both report exactly the same
+
+
+def _empty_sequence_violation() -> ValidationViolation:
+    return ValidationViolation(code="empty_sequence", message="Empty note sequence", path="notes")
+
+
+def _note_field_violations(
+    index: int, pitch: str, octave: Optional[int], velocity: int, duration: float, checked: bool
+) -> List[ValidationViolation]:
+    """Violations of one note's fields; velocity and duration only when ``checked``."""
+    violations = []
+    if not pitch:
+        violations.append(ValidationViolation(
+            code="invalid_pitch", message="Note pitch is required", path=f"notes[{index}].pitch"
+        ))
+    elif not _PITCH_FORMAT.match(pitch):
+        violations.append(ValidationViolation(
+            code="invalid_pitch_format", message=f"Invalid pitch format: {pitch}", path=f"notes[{index}].pitch"
+        ))
+    if octave is not None and not 0 <= octave <= 8:
+        violations.append(ValidationViolation(
+            code="invalid_octave", message="Octave must be between 0 and 8", path=f"notes[{index}].octave"
+        ))
+    if checked and not MIDI_MIN <= velocity <= MIDI_MAX:
+        violations.append(ValidationViolation(
+            code="invalid_velocity",
+            message=f"Velocity must be between {MIDI_MIN} and {MIDI_MAX}",
+            path=f"notes[{index}].velocity"
+        ))
+    if checked and duration <= 0:
+        violations.append(ValidationViolation(
+            code="invalid_duration", message="Duration must be positive", path=f"notes[{index}].duration"
+        ))
+    return violations
+
+
+def _large_interval_violation(index: int, interval: int) -> ValidationViolation:
+    """Violation of the leap from note ``index`` to the next."""
+    return ValidationViolation(
+        code="large_interval",
+        message=f"Large interval ({interval} semitones) between positions {index} and {index + 1}",
+        path=f"notes[{index}]"
+    )
+
+
+def _parallel_motion_violation(index: int) -> ValidationViolation:
+    """Violation of the equal leaps starting at note ``index``."""
+    return ValidationViolation(
+        code="parallel_motion",
+        message=f"Parallel motion detected at position {index}",
+        path=f"notes[{index}]"
+    )
+
+
+def _excessive_repetition_violation() -> ValidationViolation:
+    return ValidationViolation(
+        code="excessive_repetition", message="Excessive note repetition detected", path="notes"
+    )
+
+
+@RULES.rule("empty_sequence", model_types={'list'})
+def _empty_sequence(notes: Sequence[Any]) -> Violations:
+    return None if notes else [_empty_sequence_violation()]
+
+
+@RULES.rule("note_fields", levels={ValidationLevel.RELAXED}, per_note=True)
+def _relaxed_note_fields(notes: Sequence[Any], index: int) -> Violations:
+    note = notes[index]
+    return _note_field_violations(index, note.pitch, note.octave, note.velocity, note.duration, False)
+
+
+@RULES.rule("note_fields", levels=CHECKED_LEVELS, per_note=True)
+def _note_fields(notes: Sequence[Any], index: int) -> Violations:
+    note = notes[index]
+    return _note_field_violations(index, note.pitch, note.octave, note.velocity, note.duration, True)
+
+
+@RULES.rule("large_interval", levels=CHECKED_LEVELS, per_note=True)
+def _large_interval(notes: Sequence[Any], index: int) -> Violations:
+    if index == 0:
+        return None
+    interval = abs(notes[index].to_midi_number() - notes[index - 1].to_midi_number())
+    return [_large_interval_violation(index - 1, interval)] if interval > 12 else None
+
+
+@RULES.rule("parallel_motion", levels=STRICT_LEVELS, per_note=True)
+def _parallel_motion(notes: Sequence[Any], index: int) -> Violations:
+    if index < 2:
+        return None
+    first = notes[index - 1].to_midi_number() - notes[index - 2].to_midi_number()
+    second = notes[index].to_midi_number() - notes[index - 1].to_midi_number()
+    return [_parallel_motion_violation(index - 2)] if first == second and abs(first) > 4 else None
+
+
+@RULES.rule("excessive_repetition", levels=STRICT_LEVELS, per_note=True, once=True)
+def _excessive_repetition(notes: Sequence[Any], index: int) -> Violations:
+    if index < 3:
+        return None
+    pitch = notes[index].pitch
+    if pitch == notes[index - 1].pitch == notes[index - 2].pitch == notes[index - 3].pitch:
+        return [_excessive_repetition_violation()]
+    return None
+
+
+@RULES.rule("note_duration", model_types={'NoteSequence'}, per_note=True)
+def _note_duration(notes: Sequence[Any], index: int) -> Violations:
+    duration = notes[index].duration
+    if isinstance(duration, (int, float)) and duration > 0:
+        return None
+    return [ValidationViolation(
+        code="VALIDATION_ERROR", message="Note has invalid duration", path=f"notes[{index}].duration"
+    )]
+
+
+@RULES.rule("total_duration", model_types={'NoteSequence'})
+def _total_duration(sequence: Any) -> Violations:
+    total = sum(note.duration for note in sequence.notes)
+    if abs(total - sequence.duration) <= 0.001:  # Allow small floating-point differences
+        return None
+    return [ValidationViolation(
+        code="VALIDATION_ERROR",
+        message=f"Total duration ({sequence.duration}) does not match sum of note durations ({total})",
+        path="duration"
+    )]
+
+
+@RULES.rule("empty_pattern", model_types={'RhythmPattern'})
+def _empty_rhythm(pattern: Any) -> Violations:
+    if pattern.pattern:
+        return None
+    return [ValidationViolation(code="EMPTY_PATTERN", message="Pattern cannot be empty")]
+
+
+@RULES.rule("time_signature", model_types={'RhythmPattern'})
+def _time_signature(pattern: Any) -> Violations:
+    if pattern.time_signature[1] in (1, 2, 4, 8, 16, 32, 64):
+        return None
+    return [ValidationViolation(
+        code="INVALID_TIME_SIGNATURE", message="Time signature denominator must be a power of 2"
+    )]
+
+
+@RULES.rule("ordered_positions", model_types={'RhythmPattern'})
+def _ordered_positions(pattern: Any) -> Violations:
+    positions = [note.position for note in pattern.pattern]
+    if positions == sorted(positions):
+        return None
+    return [ValidationViolation(code="UNORDERED_POSITIONS", message="Notes must be ordered by position")]
+
+
+__all__ = [
+    'ALL_LEVELS',
+    'CHECKED_LEVELS',
+    'NOTE_LISTS',
+    'RULES',
+    'RuleRegistry',
+    'STRICT_LEVELS',
+    'ValidationPipeline',
+    'ValidationRule',
+]
@@ -0,0 +1,151 @@
+"""
+Cache of validation results, keyed by content hash, model type and level.
+
+Validating a model is a pure function of its content and the validation
+level, so a result is cached under a SHA-256 hash of the canonical JSON of
+the content (database ids excluded), the model type's name, the level and the
+version of the rule registry. Content is a model, a list of models or a
+request payload: a payload is hashed as sent, and shares a key with a model
+only when its JSON is the same.
+
+Because the key is the content itself, an entry can never go stale: editing
+a document changes its hash. Entries are bounded by an LRU size limit, and
+registering a rule changes the registry version, which leaves the old
+entries to be evicted.
+
+The repositories validate each document they write into the cache, so
+validating a stored document later is a lookup.
+"""
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from note_gen.core.config import get_settings
+from note_gen.core.enums import ValidationLevel
+from note_gen.core.lru import LRUCache
+from note_gen.validation.base_validation import ValidationResult
+from note_gen.validation.rule_registry import RULES
+
+# (content hash, model type name, level, rule registry version)
+ValidationKey = Tuple[str, str, str, int]
+
+# Fields that identify a document rather than describe it
+_IDENTITY_FIELDS = ('id', '_id')
+
+
+def _canonical(content: Any) -> Any:
+    if isinstance(content, BaseModel):
+        return content.model_dump(mode='json', exclude={'id'})
+    if isinstance(content, dict):
+        return {name: value for name, value in content.items() if name not in _IDENTITY_FIELDS}
+    if isinstance(content, (list, tuple)):
+        return [_canonical(item) for item in content]
+    return content
+
+
+def content_hash(content: Any) -> str:
+    """
+    Stable hash of a model's (or a payload's) content.
+
+    Equal content gives equal hashes across processes and restarts.
+    """
+    payload = json.dumps(_canonical(content), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ValidationCache:
+    """LRU cache of validation results, keyed by content."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Results kept before the least recently used is
+                evicted (0 disables caching)
+
+        Raises:
+            ValueError: If the limit is negative
+        """
+        self._entries: LRUCache[ValidationKey, ValidationResult] = LRUCache(max_entries)
+        self.max_entries = max_entries
+        self.stats = self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: ValidationKey) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def key(model_type: Union[type, str], content: Any,
+            level: Union[ValidationLevel, str] = ValidationLevel.NORMAL) -> ValidationKey:
+        """
+        Cache key of validating content as a model type at a level.
+
+        Args:
+            model_type: Model class (or its name) the content is validated as
+            content: Model, list of models or request payload
+            level: Validation level
+
+        Returns:
+            The cache key
+        """
+        name = model_type if isinstance(model_type, str) else model_type.__name__
+        return content_hash(content), name, ValidationLevel(level).value, RULES.version
+
+    def get(self, key: ValidationKey) -> Optional[ValidationResult]:
+        """Get a copy of the result cached under a key, counting a hit or miss."""
+        result = self._entries.get(key)
+        return None if result is None else result.model_copy(deep=True)
+
+    def put(self, key: ValidationKey, result: ValidationResult) -> None:
+        """Cache a copy of a result under a key."""
+        if self.max_entries:
+            self._entries.put(key, result.model_copy(deep=True))
+
+    def get_or_validate(
+        self,
+        model_type: Union[type, str],
+        content: Any,
+        level: Union[ValidationLevel, str],
+        validate: Callable[[], ValidationResult]
+    ) -> ValidationResult:
+        """
+        Get the cached result of validating content, validating it on a miss.
+
+        Args:
+            model_type: Model class (or its name) the content is validated as
+            content: Model, list of models or request payload
+            level: Validation level
+            validate: Validates the content when it is not cached
+
+        Returns:
+            The validation result
+        """
+        key = self.key(model_type, content, level)
+        result = self.get(key)
+        if result is None:
+            result = validate()
+            self.put(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop every entry (the stats are kept)."""
+        self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Size, limit and counters, for monitoring."""
+        return self._entries.metrics()
+
+
+@lru_cache(maxsize=1)
+def get_validation_cache() -> ValidationCache:
+    """Get the shared validation cache, sized by the application settings."""
+    return ValidationCache(max_entries=get_settings().validation_cache_size)
+
+
+__all__ = ['ValidationCache', 'ValidationKey', 'content_hash', 'get_validation_cache']
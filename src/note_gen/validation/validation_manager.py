@@ -6,6 +6,8 @@ from .base_validation import ValidationResult, ValidationViolation
 from ..models.note import Note
 from pydantic import BaseModel
 from .pattern_validation import PatternValidator
+from .rule_registry import RULES
+from .validation_cache import get_validation_cache
 
 class Pattern(Protocol):
     """Protocol for pattern classes."""
@@ -37,6 +39,57 @@ class ValidationManager:
 
         return result
 
+    @staticmethod
+    def has_rules(model_type: type) -> bool:
+        """Whether validation rules are registered for a model type."""
+        return RULES.applies_to(model_type)
+
+    @staticmethod
+    def validate_rules(model: Any, level: ValidationLevel = ValidationLevel.NORMAL) -> ValidationResult:
+        """
+        Validate a model with the rules registered for its type and level.
+
+        The matching rules are compiled into a pipeline on the first call for
+        each (model type, level) and reused after that.
+
+        Args:
+            model: Model to validate (or a list of notes)
+            level: Validation level to apply
+
+        Returns:
+            ValidationResult containing validation status and violations
+        """
+        return RULES.validate(model, level)
+
+    @staticmethod
+    def can_validate_content(model_type: type) -> bool:
+        """Whether :meth:`validate_content` knows how to validate a model type."""
+        return RULES.applies_to(model_type) or hasattr(model_type, "check_musical_rules")
+
+    @staticmethod
+    def validate_content(model: Any, level: ValidationLevel = ValidationLevel.NORMAL) -> ValidationResult:
+        """
+        Validate a model's content at a level, through the validation cache.
+
+        Models with registered rules run their compiled pipeline; patterns
+        check their musical rules, unless they skip validation.
+
+        Args:
+            model: Model to validate (or a list of notes)
+            level: Validation level to apply
+
+        Returns:
+            ValidationResult containing validation status and violations
+        """
+        def validate() -> ValidationResult:
+            if RULES.applies_to(type(model)):
+                return RULES.validate(model, level)
+            if getattr(model, "skip_validation", False):
+                return ValidationResult(is_valid=True)
+            return cast(ValidationResult, model.check_musical_rules())
+
+        return get_validation_cache().get_or_validate(type(model), model, level, validate)
+
     @staticmethod
     def validate_pattern(pattern: Any, level: ValidationLevel = ValidationLevel.NORMAL) -> ValidationResult:
         """Validate a pattern."""
@@ -49,7 +102,9 @@ class ValidationManager:
         level: ValidationLevel
     ) -> ValidationResult:
         """
-        Validate model data.
+        Validate model data, through the validation cache.
+
+        A cached result is returned without instantiating the model.
 
         Args:
             model_class: Class to validate against (Pattern or related models)
@@ -61,33 +116,41 @@ class ValidationManager:
         """
         from ..models.patterns import Pattern  # Import here to avoid circular import
 
-        violations: List[ValidationViolation] = []
-
-        try:
-            # Create instance using model_validate if it's a BaseModel, otherwise use constructor
-            if issubclass(model_class, BaseModel):
-                instance = model_class.model_validate(data)
-                # Only run pattern validation if instance is a Pattern
-                if isinstance(instance, Pattern):
-                    pattern_result = ValidationManager.validate_pattern(instance, level)
-                    violations.extend(pattern_result.violations)
-            else:
-                # For non-BaseModel classes, just create an instance
-                model_class(**data)
-
-            # We've already handled Pattern validation above
-
-        except Exception as e:
-            violations.append(
-                ValidationViolation(
-                    message=str(e),
-                    code="MODEL_VALIDATION_ERROR"
+        def validate() -> ValidationResult:
+            violations: List[ValidationViolation] = []
+
+            try:
+                # Create instance using model_validate if it's a BaseModel, otherwise use constructor
+                if issubclass(model_class, BaseModel):
+                    instance = model_class.model_validate(data)
+                    # Only run pattern validation if instance is a Pattern
+                    if isinstance(instance, Pattern):
+                        pattern_result = ValidationManager.validate_pattern(instance, level)
+                        violations.extend(pattern_result.violations)
+                    elif RULES.applies_to(model_class):
+                        violations.extend(RULES.validate(instance, level).violations)
+                else:
+                    # For non-BaseModel classes, just create an instance
+                    model_class(**data)
+
+                # We've already handled Pattern validation above
+
+            except Exception as e:
+                violations.append(
+                    ValidationViolation(
+                        message=str(e),
+                        code="MODEL_VALIDATION_ERROR"
+                    )
                 )
+
+            return ValidationResult(
+                is_valid=len(violations) == 0,
+                violations=violations
             )
 
-        return ValidationResult(
-            is_valid=len(violations) == 0,
-            violations=violations
+        # Keyed apart from validate_content, which validates models differently
+        return get_validation_cache().get_or_validate(
+            f"model_data:{model_class.__name__}", data, level, validate
         )
 
     @staticmethod
@@ -0,0 +1,227 @@
+"""
+Vectorized musical validation for large note sequences.
+
+The per-note rules of :mod:`note_gen.validation.rule_registry` cost a few
+Python calls per note and rule. For long sequences the same checks are done
+here on NumPy columns in one pass: consecutive MIDI differences give the
+large leaps and the parallel-motion windows, and equal neighbouring pitch
+names give the repetition runs. Only the notes the masks flag are looked at
+again, to build their violations with the registry's own helpers, so the
+result is identical to the rule pipeline's.
+
+The columns are read from Note objects, or taken as they are from a
+:class:`~note_gen.models.note_array.NoteArray`, which is where the
+millisecond validation of very long sequences comes from.
+
+Which checks run, and in which order, is read from the compiled pipeline of
+the level, so levels behave exactly as in the registry. A pipeline with a
+rule this module does not implement is not vectorized (see :func:`covers`).
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from note_gen.core.constants import MIDI_MAX, MIDI_MIN
+from note_gen.core.enums import ValidationLevel
+from note_gen.core.spelling import FLAT_NAMES, SHARP_NAMES
+from note_gen.models.note_array import NoteArray, _require_numpy, np
+from note_gen.validation.base_validation import ValidationResult, ValidationViolation
+from note_gen.validation.rule_registry import (
+    RULES, _PITCH_FORMAT, _empty_sequence, _empty_sequence_violation, _excessive_repetition,
+    _excessive_repetition_violation, _large_interval, _large_interval_violation,
+    _note_field_violations, _note_fields, _parallel_motion, _parallel_motion_violation,
+    _relaxed_note_fields
+)
+
+# Below this many notes the per-note rule pipeline is faster
+VECTORIZE_MIN_NOTES = 64
+
+# (pitch, octave, velocity, duration) of one note
+NoteFields = Tuple[str, Optional[int], int, float]
+
+
+class _NoteColumns:
+    """Column view of a note sequence; MIDI numbers are read only when needed."""
+
+    def __init__(
+        self,
+        size: int,
+        pitch_ids: Any,
+        pitches: Sequence[str],
+        octave: Any,
+        velocity: Any,
+        duration: Any,
+        midi: Callable[[], Any],
+        fields: Callable[[int], NoteFields]
+    ) -> None:
+        self.size = size
+        self.pitch_ids = pitch_ids
+        self.pitches = pitches
+        self.octave = octave
+        self.velocity = velocity
+        self.duration = duration
+        self.fields = fields
+        self._midi = midi
+        self._steps: Optional[Any] = None
+
+    @property
+    def steps(self) -> Any:
+        """Signed semitone step from each note to the next."""
+        if self._steps is None:
+            # Fewer than two notes make no steps, so their MIDI numbers are not needed
+            self._steps = np.diff(self._midi()) if self.size > 1 else np.zeros(0, dtype=np.int64)
+        return self._steps
+
+    @classmethod
+    def from_notes(cls, notes: Sequence[Any]) -> '_NoteColumns':
+        size = len(notes)
+        ids: Dict[str, int] = {}
+        pitch_ids = np.fromiter(
+            (ids.setdefault(note.pitch, len(ids)) for note in notes), dtype=np.intp, count=size
+        )
+        # A missing octave is never invalid; 4 stands in for it
+        octave = np.fromiter(
+            (4 if note.octave is None else note.octave for note in notes), dtype=np.int64, count=size
+        )
+        velocity = np.fromiter((note.velocity for note in notes), dtype=np.int64, count=size)
+        duration = np.fromiter((note.duration for note in notes), dtype=np.float64, count=size)
+
+        def midi() -> Any:
+            return np.fromiter((
+                note.to_midi_number() if note.stored_midi_number is None else note.stored_midi_number
+                for note in notes
+            ), dtype=np.int64, count=size)
+
+        def fields(index: int) -> NoteFields:
+            note = notes[index]
+            return note.pitch, note.octave, note.velocity, note.duration
+
+        return cls(size, pitch_ids, list(ids), octave, velocity, duration, midi, fields)
+
+    @classmethod
+    def from_array(cls, array: NoteArray) -> '_NoteColumns':
+        midi = array.midi.astype(np.int64)
+        pitch_class = midi % 12
+        names = SHARP_NAMES + FLAT_NAMES
+        ids: Dict[str, int] = {}
+        name_ids = np.array([ids.setdefault(name, len(ids)) for name in names], dtype=np.intp)
+        spelled = pitch_class + 12 * array.flat
+        octave = midi // 12 - 1
+
+        def fields(index: int) -> NoteFields:
+            return (names[spelled[index]], int(octave[index]), int(array.velocity[index]),
+                    float(array.duration[index]))
+
+        return cls(len(midi), name_ids[spelled], list(ids), octave, array.velocity, array.duration,
+                   lambda: midi, fields)
+
+
+def _empty(columns: _NoteColumns) -> List[ValidationViolation]:
+    return [] if columns.size else [_empty_sequence_violation()]
+
+
+def _field_check(checked: bool) -> Callable[[_NoteColumns], List[ValidationViolation]]:
+    def check(columns: _NoteColumns) -> List[ValidationViolation]:
+        # Each distinct pitch name is checked once
+        bad_pitch = np.array(
+            [not pitch or not _PITCH_FORMAT.match(pitch) for pitch in columns.pitches], dtype=bool
+        )
+        bad = bad_pitch[columns.pitch_ids] | (columns.octave < 0) | (columns.octave > 8)
+        if checked:
+            bad |= (columns.velocity < MIDI_MIN) | (columns.velocity > MIDI_MAX) | (columns.duration <= 0)
+        violations: List[ValidationViolation] = []
+        for index in np.flatnonzero(bad).tolist():
+            violations.extend(_note_field_violations(index, *columns.fields(index), checked))
+        return violations
+    return check
+
+
+def _leaps(columns: _NoteColumns) -> List[ValidationViolation]:
+    intervals = np.abs(columns.steps)
+    return [
+        _large_interval_violation(index, int(intervals[index]))
+        for index in np.flatnonzero(intervals > 12).tolist()
+    ]
+
+
+def _parallels(columns: _NoteColumns) -> List[ValidationViolation]:
+    steps = columns.steps
+    windows = (steps[:-1] == steps[1:]) & (np.abs(steps[:-1]) > 4)
+    return [_parallel_motion_violation(index) for index in np.flatnonzero(windows).tolist()]
+
+
+def _repetition(columns: _NoteColumns) -> List[ValidationViolation]:
+    same = columns.pitch_ids[1:] == columns.pitch_ids[:-1]
+    # Four equal pitches in a row are three equal neighbours in a row
+    if (same[:-2] & same[1:-1] & same[2:]).any():
+        return [_excessive_repetition_violation()]
+    return []
+
+
+# Vectorized counterpart of each per-note-list rule check
+_VECTORIZED: Dict[Callable[..., Any], Callable[[_NoteColumns], List[ValidationViolation]]] = {
+    _empty_sequence: _empty,
+    _relaxed_note_fields: _field_check(False),
+    _note_fields: _field_check(True),
+    _large_interval: _leaps,
+    _parallel_motion: _parallels,
+    _excessive_repetition: _repetition,
+}
+
+
+def covers(level: Union[ValidationLevel, str] = ValidationLevel.NORMAL) -> bool:
+    """Whether every rule for note lists at the level has a vectorized counterpart."""
+    return all(rule.check in _VECTORIZED for rule in RULES.pipeline(list, level).rules)
+
+
+def _validate(columns: _NoteColumns, level: Union[ValidationLevel, str]) -> ValidationResult:
+    pipeline = RULES.pipeline(list, level)
+    if not covers(level):
+        raise ValueError(f"No vectorized validation for the {ValidationLevel(level).value} note-list rules")
+    violations: List[ValidationViolation] = []
+    for rule in pipeline.rules:
+        violations.extend(_VECTORIZED[rule.check](columns))
+    return ValidationResult(is_valid=not violations, violations=violations)
+
+
+def validate_notes(
+    notes: Sequence[Any], level: Union[ValidationLevel, str] = ValidationLevel.NORMAL
+) -> ValidationResult:
+    """
+    Validate a list of notes with NumPy.
+
+    Args:
+        notes: Notes to validate
+        level: Validation level to apply
+
+    Returns:
+        The ValidationResult the note-list rule pipeline would return
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If a rule for the level has no vectorized counterpart
+    """
+    _require_numpy()
+    return _validate(_NoteColumns.from_notes(notes), level)
+
+
+def validate_note_array(
+    array: NoteArray, level: Union[ValidationLevel, str] = ValidationLevel.NORMAL
+) -> ValidationResult:
+    """
+    Validate a NoteArray as the list of notes it materializes to.
+
+    Args:
+        array: Notes in columnar form
+        level: Validation level to apply
+
+    Returns:
+        The ValidationResult of validating ``array.to_notes()``
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If a rule for the level has no vectorized counterpart
+    """
+    _require_numpy()
+    return _validate(_NoteColumns.from_array(array), level)
+
+
+__all__ = ['VECTORIZE_MIN_NOTES', 'covers', 'validate_note_array', 'validate_notes']
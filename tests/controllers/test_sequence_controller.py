@@ -3,10 +3,12 @@ import pytest
 from unittest.mock import AsyncMock
 
 from note_gen.controllers.sequence_controller import SequenceController
+from note_gen.generators.generation_cache import GenerationCache
 from note_gen.models.sequence import Sequence
 from note_gen.models.note_sequence import NoteSequence
 from note_gen.models.note import Note
 from note_gen.core.enums import ChordQuality, ScaleType
+from note_gen.schemas.sequence_request import SequenceGenerationRequest
 
 
 @pytest.fixture
@@ -42,7 +44,8 @@ def controller(mock_sequence_repository, mock_pattern_controller, mock_chord_pro
     return SequenceController(
         mock_sequence_repository,
         mock_pattern_controller,
-        mock_chord_progression_repository
+        mock_chord_progression_repository,
+        cache=GenerationCache()
     )
 
 
@@ -194,3 +197,96 @@ async def test_get_sequence_by_name(controller, mock_sequence_repository):
     # Assert
     assert result == expected_sequence
     mock_sequence_repository.find_many.assert_called_once_with({"name": sequence_name})
+
+
+@pytest.mark.asyncio
+async def test_generate_sequences_batch(
+    controller, mock_sequence_repository, mock_pattern_controller, mock_chord_progression_repository
+):
+    """Test generating a batch of sequences, loading shared inputs once."""
+    from note_gen.models.chord_progression import ChordProgression
+    from note_gen.models.chord import Chord
+    from note_gen.models.chord_progression_item import ChordProgressionItem
+    from note_gen.models.patterns import NotePattern, RhythmPattern, RhythmNote
+
+    progression = ChordProgression(
+        name="Batch Progression",
+        key="C",
+        scale_type=ScaleType.MAJOR,
+        chords=[Chord(root="C", quality=ChordQuality.MAJOR, duration=1)],
+        items=[ChordProgressionItem(chord_symbol="C", chord=Chord(root="C", quality=ChordQuality.MAJOR, duration=1), position=0.0)]
+    )
+    mock_chord_progression_repository.find_many.return_value = [progression]
+
+    note_pattern = NotePattern(
+        name="Batch Pattern",
+        pattern=[Note(pitch="C", octave=4, duration=1.0, velocity=64, position=0.0, stored_midi_number=60)]
+    )
+    rhythm_pattern = RhythmPattern(
+        name="Batch Rhythm",
+        pattern=[RhythmNote(position=0.0, duration=1.0)]
+    )
+    mock_pattern_controller.get_pattern_by_name.side_effect = lambda name, type: (
+        note_pattern if name == "Batch Pattern" and type == "note" else
+        rhythm_pattern if name == "Batch Rhythm" and type == "rhythm" else
+        None
+    )
+    mock_sequence_repository.create.side_effect = lambda sequence: sequence
+
+    requests = [
+        SequenceGenerationRequest(progression_name="Batch Progression", pattern_name="Batch Pattern",
+                                  rhythm_pattern_name="Batch Rhythm", transpose=transpose)
+        for transpose in (0, 5)
+    ]
+    requests.append(SequenceGenerationRequest(progression_name="Batch Progression", pattern_name="Missing",
+                                              rhythm_pattern_name="Batch Rhythm"))
+
+    results = await controller.generate_sequences_batch(requests)
+
+    assert [n.pitch for n in results[0]["sequence"].notes][:1] == ["C"]
+    assert [n.pitch for n in results[1]["sequence"].notes][:1] == ["F"]
+    assert results[2] == {"error": "Note pattern not found: Missing"}
+    # One lookup per distinct input, whatever it is combined with
+    assert mock_chord_progression_repository.find_many.call_count == 1
+    assert mock_pattern_controller.get_pattern_by_name.call_count == 3
+    assert mock_sequence_repository.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_sequence_uses_cache(
+    controller, mock_sequence_repository, mock_pattern_controller, mock_chord_progression_repository
+):
+    """Test that repeated generations are served from the cache until an input changes."""
+    from note_gen.models.chord_progression import ChordProgression
+    from note_gen.models.chord_progression_item import ChordProgressionItem
+    from note_gen.models.patterns import NotePattern, RhythmPattern, RhythmNote
+
+    progression = ChordProgression(
+        id="cached-progression",
+        name="Cached Progression",
+        key="C",
+        scale_type=ScaleType.MAJOR,
+        items=[ChordProgressionItem(chord_symbol="C", duration=4.0, position=0.0)]
+    )
+    mock_chord_progression_repository.find_many.return_value = [progression]
+    note_pattern = NotePattern(
+        name="Cached Pattern",
+        pattern=[Note(pitch="C", octave=4, duration=1.0, velocity=64, position=0.0, stored_midi_number=60)]
+    )
+    rhythm_pattern = RhythmPattern(name="Cached Rhythm", pattern=[RhythmNote(position=0.0, duration=1.0)])
+    mock_pattern_controller.get_pattern_by_name.side_effect = lambda name, type: (
+        note_pattern if type == "note" else rhythm_pattern
+    )
+    mock_sequence_repository.create.side_effect = lambda sequence: sequence
+    names = ("Cached Progression", "Cached Pattern", "Cached Rhythm")
+
+    first = await controller.generate_sequence(*names)
+    second = await controller.generate_sequence(*names)
+
+    assert second == first and second is not first
+    assert mock_chord_progression_repository.find_many.call_count == 1
+    assert controller.cache.stats.hits == 1
+
+    controller.cache.invalidate("chord_progressions", "cached-progression")
+    await controller.generate_sequence(*names)
+    assert mock_chord_progression_repository.find_many.call_count == 2
@@ -0,0 +1,53 @@
+"""Tests for table-driven chord recognition."""
+import pytest
+from note_gen.core.chord_recognition import identify, label_sequence, recognize_chord, recognize_many
+from note_gen.core.enums import ChordQuality
+from note_gen.core.pitch_class_set import PitchClassSet
+from note_gen.models.chord import Chord
+from note_gen.models.note import Note
+
+
+@pytest.mark.parametrize("quality", [q for q in ChordQuality if q != ChordQuality.DOMINANT])
+def test_recognizes_every_voiced_quality(quality):
+    chord = Chord(root="F#", quality=quality)
+    match = recognize_chord(chord.get_notes())
+    assert (match.root, match.quality, match.inversion) == ("F#", quality, 0)
+
+
+def test_inversions_and_bass_tie_breaks():
+    assert recognize_chord([64, 67, 72]).inversion == 1
+    assert recognize_chord([67, 72, 76]).inversion == 2
+    # Augmented triads are symmetric; the bass picks the root
+    assert recognize_chord([64, 68, 72]).root == "E"
+    assert recognize_chord([60, 64, 68]).root == "C"
+
+
+def test_best_match_for_incomplete_and_extended_sets():
+    assert recognize_chord([57, 60, 64, 67]).quality == ChordQuality.MINOR_SEVENTH
+    assert recognize_chord([60, 64, 67, 70, 74]).quality == ChordQuality.DOMINANT_SEVENTH
+    assert recognize_chord([60]) is None
+    assert recognize_chord([]) is None
+    assert identify(PitchClassSet.of([0, 4])).quality == ChordQuality.MAJOR
+
+
+def test_batch_apis():
+    assert [m.symbol for m in recognize_many([[60, 64, 67], [62, 65, 69]])] == ["C MAJOR", "D MINOR"]
+
+    notes = [
+        Note(pitch="G", octave=3, position=1.0),
+        Note(pitch="B", octave=3, position=1.0),
+        Note(pitch="D", octave=4, position=1.0),
+        Note(pitch="C", octave=4, position=0.0),
+        Note(pitch="E", octave=4, position=0.0),
+        Note(pitch="G", octave=4, position=0.0),
+        Note(pitch="A", octave=4, position=2.0),
+    ]
+    labels = label_sequence(notes)
+    assert [(pos, m.symbol if m else None) for pos, m in labels] == [
+        (0.0, "C MAJOR"), (1.0, "G MAJOR"), (2.0, None)
+    ]
+
+
+def test_chord_from_notes():
+    chord = Chord.from_notes([Note(pitch=p, octave=4) for p in ("D", "F", "A", "C")], duration=2.0)
+    assert (chord.root, chord.quality, chord.duration) == ("D", ChordQuality.MINOR_SEVENTH, 2.0)
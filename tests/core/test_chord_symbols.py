@@ -0,0 +1,57 @@
+"""Tests for the chord-symbol grammar."""
+import pytest
+from note_gen.core.chord_symbols import ChordSymbol, QUALITY_SUFFIXES, format_symbol, parse_many, parse_symbol
+from note_gen.core.enums import ChordQuality
+from note_gen.models.chord import Chord
+from note_gen.models.chord_progression_item import ChordProgressionItem
+
+
+@pytest.mark.parametrize("quality", list(ChordQuality))
+def test_every_quality_round_trips(quality):
+    symbol = format_symbol("Eb", quality)
+    assert parse_symbol(symbol) == ChordSymbol("Eb", quality)
+    assert parse_symbol(f"Eb{quality.value}").quality == quality
+    for suffix in QUALITY_SUFFIXES[quality]:
+        assert parse_symbol(f"Eb{suffix}").quality == quality
+
+
+@pytest.mark.parametrize("symbol, expected", [
+    ("C", ("C", ChordQuality.MAJOR, None)),
+    (" am ", ("A", ChordQuality.MINOR, None)),
+    ("Bbm7b5", ("Bb", ChordQuality.HALF_DIMINISHED_SEVENTH, None)),
+    ("F#ø", ("F#", ChordQuality.HALF_DIMINISHED_SEVENTH, None)),
+    ("Gsus/C", ("G", ChordQuality.SUSPENDED_FOURTH, "C")),
+    ("Dm9/F", ("D", ChordQuality.MINOR_NINTH, "F")),
+    ("C11", ("C", ChordQuality.DOMINANT_ELEVENTH, None)),
+])
+def test_parse_symbol(symbol, expected):
+    parsed = parse_symbol(symbol)
+    assert (parsed.root, parsed.quality, parsed.bass) == expected
+
+
+@pytest.mark.parametrize("symbol", ["", "H", "Cxyz", "C/", "C/H", "Cb7"])
+def test_invalid_symbols(symbol):
+    with pytest.raises(ValueError, match="Invalid chord symbol"):
+        parse_symbol(symbol)
+
+
+def test_parse_is_memoized_and_batched():
+    assert parse_symbol("Am7") is parse_symbol("Am7")
+    assert parse_many(["C", "Xm", "C"], strict=False) == [ChordSymbol("C", ChordQuality.MAJOR), None,
+                                                         ChordSymbol("C", ChordQuality.MAJOR)]
+    with pytest.raises(ValueError):
+        parse_many(["C", "Xm"])
+
+
+def test_transpose_keeps_slash_bass():
+    assert parse_symbol("G7/B").transpose(3).symbol == "A#7/D"
+    item = ChordProgressionItem(chord_symbol="Dm7b5/C").transpose(2)
+    assert item.chord_symbol == "Em7b5/D"
+    assert (item.chord.root, item.chord.quality) == ("E", ChordQuality.HALF_DIMINISHED_SEVENTH)
+
+
+def test_chord_symbol_methods():
+    assert Chord.from_symbol("Bbmaj9").to_symbol() == "Bbmaj9"
+    assert Chord(root="C", quality=ChordQuality.SUSPENDED_SECOND).to_symbol() == "Csus2"
+    assert Chord(root="C").transpose(2).root == "D"
+    assert ChordQuality.from_string("m7b5") == ChordQuality.HALF_DIMINISHED_SEVENTH
@@ -0,0 +1,62 @@
+"""Tests for the chord interval registry and voicing cache."""
+import pytest
+from note_gen.core.chord_voicing import clear_voicing_cache, fit_octave, get_voicing, voicing_cache_info
+from note_gen.core.constants import CHORD_INTERVALS
+from note_gen.core.enums import ChordQuality, VoicingStyle
+from note_gen.models.chord import Chord
+
+
+def midis(voicing):
+    return [pitch.midi for pitch in voicing]
+
+
+def test_registry_covers_every_quality():
+    for quality in ChordQuality:
+        assert ChordQuality.get_intervals(quality) == list(CHORD_INTERVALS[quality])
+    assert Chord.QUALITY_INTERVALS is CHORD_INTERVALS
+    with pytest.raises(TypeError):
+        CHORD_INTERVALS[ChordQuality.MAJOR] = (0, 4)  # type: ignore[index]
+
+
+def test_close_voicing_and_inversions():
+    assert midis(get_voicing("C", ChordQuality.MAJOR)) == [60, 64, 67]
+    assert midis(get_voicing("C", ChordQuality.MAJOR, inversion=1)) == [64, 67, 72]
+    assert midis(get_voicing("C", ChordQuality.MAJOR, inversion=2)) == [67, 72, 76]
+    with pytest.raises(ValueError):
+        get_voicing("C", ChordQuality.MAJOR, inversion=3)
+
+
+def test_voicing_styles():
+    assert midis(get_voicing("C", ChordQuality.MAJOR_SEVENTH, style=VoicingStyle.DROP2)) == [55, 60, 64, 71]
+    assert midis(get_voicing("C", ChordQuality.MAJOR, style="open")) == [60, 67, 76]
+
+
+def test_voicings_are_shared_and_normalized():
+    clear_voicing_cache()
+    first = get_voicing("Bb", ChordQuality.MINOR, 3)
+    assert get_voicing(" Bb ", "MINOR", 3) is first
+    assert voicing_cache_info().hits == 1
+    assert [p.name for p in first] == ["A#", "C#", "F"]
+
+
+def test_invalid_voicings():
+    with pytest.raises(ValueError):
+        get_voicing("H", ChordQuality.MAJOR)
+    with pytest.raises(ValueError):
+        get_voicing("G", ChordQuality.MAJOR_NINTH, octave=9)
+
+
+def test_fit_octave():
+    assert fit_octave("C", ChordQuality.MAJOR, 8) == 8
+    assert fit_octave("B", ChordQuality.DOMINANT_SEVENTH, 8) == 7
+    assert fit_octave("G", ChordQuality.MAJOR_NINTH, 9) == 7
+    assert fit_octave("D", ChordQuality.MINOR, 3) == 3
+
+
+def test_chord_notes_use_voicing():
+    chord = Chord(root="D", quality=ChordQuality.MINOR_NINTH, octave=3)
+    assert [n.note_name for n in chord.get_notes()] == ["D3", "F3", "A3", "C4", "E4"]
+    # Too high to voice at its octave, the chord drops to the highest that fits
+    high = Chord(root="B", quality=ChordQuality.DOMINANT_SEVENTH, octave=8)
+    assert [n.note_name for n in high.get_notes()] == ["B7", "D#8", "F#8", "A8"]
+    assert [n.note_name for n in Chord(root="C", octave=8).get_notes()] == ["C8", "E8", "G8"]
@@ -0,0 +1,25 @@
+"""Tests for the bounded LRU store shared by the caches."""
+import pytest
+from note_gen.core.lru import LRUCache
+
+
+def test_lru_eviction_and_stats():
+    evicted = []
+    cache = LRUCache(2, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1 and cache.get("missing") is None
+    cache.put("c", 3)
+    # "b" was the least recently used; peeking refreshes nothing
+    assert evicted == [("b", 2)] and "b" not in cache
+    assert cache.peek("a") == 1
+    assert cache.pop("a") == 1 and len(cache) == 1
+    assert cache.metrics() == {
+        "size": 1, "max_entries": 2, "hits": 1, "misses": 1, "hit_rate": 0.5, "evictions": 1
+    }
+
+    disabled = LRUCache(0)
+    disabled.put("a", 1)
+    assert len(disabled) == 0
+    with pytest.raises(ValueError):
+        LRUCache(-1)
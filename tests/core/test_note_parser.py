@@ -0,0 +1,48 @@
+"""Tests for table-driven note name parsing."""
+import pytest
+from note_gen.core.note_parser import parse_note_name, parse_pitch, parse_many
+from note_gen.core.accessors import NoteAccessor
+from note_gen.models.note import Note
+from note_gen.models.scale_info import ScaleInfo
+from note_gen.core.enums import ScaleType
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("C#4", ("C#", 4)),
+    ("Bb", ("Bb", None)),
+    ("e", ("E", None)),
+    (" F# ", ("F#", None)),
+    ("bb3", ("Bb", 3)),
+])
+def test_parse_note_name(name, expected):
+    assert parse_note_name(name) == expected
+
+
+@pytest.mark.parametrize("name", ["H", "C##", "C10", "", "BB", "C-1"])
+def test_parse_note_name_invalid(name):
+    with pytest.raises(ValueError):
+        parse_note_name(name)
+
+
+def test_parse_pitch_rejects_octave():
+    assert parse_pitch(" db ") == "Db"
+    with pytest.raises(ValueError, match="Invalid pitch format"):
+        parse_pitch("C4")
+
+
+def test_parse_many():
+    assert parse_many(["C4", "Eb", "g#2"]) == [("C", 4), ("Eb", None), ("G#", 2)]
+    assert parse_many(["C4", "X"], strict=False) == [("C", 4), None]
+    with pytest.raises(ValueError):
+        parse_many(["C4", "X"])
+
+
+def test_entry_points_share_table():
+    assert Note.from_name(" Bb3 ").note_name == "Bb3"
+    assert Note.from_name("F#").octave == 4
+    assert Note.validate_note_name("C#4")
+    assert not Note.validate_note_name("c#4")
+    assert NoteAccessor.normalize_note_name("db") == "Db"
+    assert ScaleInfo(key=" F# ", scale_type=ScaleType.MAJOR).key == "F#"
+    with pytest.raises(ValueError):
+        ScaleInfo(key="f", scale_type=ScaleType.MAJOR)
@@ -0,0 +1,50 @@
+"""Tests for the interned Pitch pool."""
+import pytest
+from note_gen.core.pitch import Pitch
+from note_gen.models.note import Note
+
+
+def test_pitches_are_interned():
+    assert Pitch.of("C#", 4) is Pitch.of("C#", 4)
+    assert Pitch.from_midi(61) is Pitch.of("C#", 4)
+    assert Pitch.of("Db", 4) is not Pitch.of("C#", 4)
+    assert Pitch.of("Db", 4).midi == Pitch.of("C#", 4).midi == 61
+
+
+def test_pitch_is_immutable_and_hashable():
+    pitch = Pitch.of("A", 4)
+    with pytest.raises(AttributeError):
+        pitch.octave = 5  # type: ignore[misc]
+    assert {pitch: "a440"}[Pitch.from_midi(69)] == "a440"
+
+
+def test_pool_covers_midi_range():
+    assert Pitch.from_midi(0).note_name == "C-1"
+    assert Pitch.from_midi(127).note_name == "G9"
+    with pytest.raises(ValueError):
+        Pitch.from_midi(128)
+    with pytest.raises(ValueError):
+        Pitch.of("H", 4)
+
+
+def test_transpose_is_table_lookup():
+    pitch = Pitch.of("Bb", 3)
+    assert pitch.transpose(2) is Pitch.of("C", 4)
+    with pytest.raises(ValueError):
+        Pitch.from_midi(120).transpose(12)
+
+
+def test_note_round_trip():
+    note = Note.from_pitch(Pitch.of("Eb", 5), duration=2.0, velocity=90, position=1.0)
+    assert note.pitch == "Eb"
+    assert note.midi_number == 75
+    assert note.to_pitch() is Pitch.of("Eb", 5)
+
+
+def test_note_transpose_keeps_timing():
+    note = Note(pitch="C", octave=4, duration=0.5, velocity=100, position=3.0)
+    transposed = note.transpose(7)
+    assert transposed.note_name == "G4"
+    assert transposed.stored_midi_number == 67
+    assert (transposed.duration, transposed.velocity, transposed.position) == (0.5, 100, 3.0)
+    assert note.note_name == "C4"
@@ -0,0 +1,59 @@
+"""Tests for the bitmask pitch-class set."""
+import pytest
+from note_gen.core.enums import ChordQuality, ScaleType
+from note_gen.core.pitch_class_set import PitchClassSet
+from note_gen.core.scale_catalog import get_scale_table
+from note_gen.models.chord import Chord
+from note_gen.models.note import Note
+from note_gen.models.scale import Scale
+from note_gen.models.scale_info import ScaleInfo
+
+C_MAJOR = PitchClassSet.of([0, 2, 4, 5, 7, 9, 11])
+
+
+def test_construction_and_membership():
+    assert C_MAJOR.mask == 0b101010110101
+    assert PitchClassSet.of(["C", "E", "G"]) == PitchClassSet.of([60, 64, 67])
+    assert 4 in C_MAJOR and 64 in C_MAJOR and "E" in C_MAJOR
+    assert "Eb" not in C_MAJOR and "H" not in C_MAJOR
+    assert len(C_MAJOR) == 7
+    assert list(PitchClassSet.of([7, 0, 4])) == [0, 4, 7]
+    with pytest.raises(ValueError):
+        PitchClassSet(1 << 12)
+    with pytest.raises(ValueError):
+        PitchClassSet.of(["H"])
+
+
+def test_set_operations():
+    triad = PitchClassSet.of([0, 4, 7])
+    assert triad <= C_MAJOR and C_MAJOR >= triad
+    assert not PitchClassSet.of([1]).issubset(C_MAJOR)
+    assert triad | PitchClassSet.of([10]) == PitchClassSet.of([0, 4, 7, 10])
+    assert triad & PitchClassSet.of([4, 5]) == PitchClassSet.of([4])
+    assert C_MAJOR - triad == PitchClassSet.of([2, 5, 9, 11])
+    assert C_MAJOR.complement() == PitchClassSet.of([1, 3, 6, 8, 10])
+
+
+def test_transpose_rotates():
+    assert PitchClassSet.of([0, 4, 7]).transpose(11) == PitchClassSet.of([11, 3, 6])
+    assert C_MAJOR.transpose(-5) == PitchClassSet.from_intervals("G", [0, 2, 4, 5, 7, 9, 11])
+    assert C_MAJOR.transpose(12) == C_MAJOR
+
+
+def test_models_expose_pitch_class_sets():
+    info = ScaleInfo(key="C", scale_type=ScaleType.MINOR)
+    assert info.pitch_class_set == PitchClassSet.of([0, 2, 3, 5, 7, 8, 10])
+    assert info.is_note_in_scale(Note(pitch="Eb", octave=4))
+
+    scale = Scale.from_root("D", ScaleType.MAJOR)
+    assert scale.pitch_class_set == C_MAJOR.transpose(2)
+    assert scale.contains_note(Note(pitch="F#", octave=2))
+    # Read from the scale catalog, not rebuilt from the scale's notes
+    assert scale.pitch_class_set is get_scale_table("D", ScaleType.MAJOR).pitch_classes
+    odd_root = Scale(root=Note(pitch="C", octave=4, stored_midi_number=62), scale_type=ScaleType.MAJOR)
+    assert odd_root.pitch_class_set == C_MAJOR.transpose(2)
+
+    chord = Chord(root="Bb", quality=ChordQuality.DOMINANT_SEVENTH)
+    assert chord.pitch_class_set == PitchClassSet.of(["Bb", "D", "F", "Ab"])
+    assert chord.is_chord_tone(Note(pitch="G#", octave=5))
+    assert not chord.is_chord_tone(Note(pitch="G", octave=5))
@@ -0,0 +1,46 @@
+"""Tests for the compiled preset registry."""
+import pytest
+from note_gen.core.constants import NOTE_PATTERNS, PROGRESSION_PRESETS, RHYTHM_PATTERNS
+from note_gen.core.preset_registry import PresetRegistry, get_preset_registry
+from note_gen.core.sequence_generator import generate_sequence_from_presets
+
+
+def test_registry_compiles_every_preset():
+    registry = get_preset_registry()
+    assert registry is get_preset_registry()
+    assert set(NOTE_PATTERNS) <= set(registry.note_patterns)
+    assert set(RHYTHM_PATTERNS) <= set(registry.rhythm_patterns)
+    assert set(registry.progressions) == set(PROGRESSION_PRESETS)
+    assert registry.progressions['pop'].roots == (0, 7, 9, 5)
+    assert registry.note_patterns['walking_bass'].intervals == (-12, -8, -5, -3)
+    assert registry.rhythm_patterns['waltz'].time_signature == (3, 4)
+    with pytest.raises(TypeError):
+        registry.progressions['new'] = registry.progressions['pop']
+
+
+def test_realize_is_cached_and_key_aware():
+    registry = get_preset_registry()
+    rows, duration = registry.realize('minor_triad', 'quarter_notes', 'basic', 'F')
+    assert rows is registry.realize('minor_triad', 'quarter_notes', 'basic', 'F')[0]
+    assert duration == 16.0 and len(rows) == 16
+    # I chord: F Ab C F, then IV chord rooted on Bb
+    assert [row[0] for row in rows[:5]] == ['F', 'Ab', 'C', 'F', 'Bb']
+    assert [row[5] for row in rows[:5]] == [65, 68, 72, 65, 70]
+    assert PresetRegistry.compile().realize('minor_triad', 'quarter_notes', 'basic', 'F') == (rows, duration)
+
+
+@pytest.mark.asyncio
+async def test_generate_sequence_from_presets():
+    sequence = await generate_sequence_from_presets(
+        'triad_arpeggio', 'basic_rock', 'pop', {'key': 'D', 'scale_type': 'MAJOR'}
+    )
+    assert sequence.duration == 16.0
+    assert len(sequence.notes) == 16
+    assert sequence.notes[0].note_name == 'D4'
+    assert sequence.notes[1].note_name == 'F#4'
+    assert sequence.notes[4].position == 4.0 and sequence.notes[4].note_name == 'A4'
+    assert sequence.progression_name == 'pop'
+
+    for names in [('missing', 'basic_rock', 'pop'), ('basic', 'missing', 'pop'), ('basic', 'basic', 'missing')]:
+        with pytest.raises(ValueError, match="Invalid"):
+            await generate_sequence_from_presets(*names, {'key': 'C', 'scale_type': 'MAJOR'})
@@ -0,0 +1,78 @@
+"""Tests for the compiled Roman-numeral engine."""
+import pytest
+from note_gen.core.enums import ChordQuality, ScaleType
+from note_gen.core.roman_numerals import parse_numeral, resolve_numeral, resolve_progression
+from note_gen.models.presets import ChordProgressionPreset, Presets
+from note_gen.models.roman_numeral import RomanNumeral
+from note_gen.models.scale_info import ScaleInfo
+
+
+@pytest.mark.parametrize("numeral, key, scale_type, expected", [
+    ("I", "C", ScaleType.MAJOR, ("C", ChordQuality.MAJOR, 0)),
+    ("vii", "C", ScaleType.MAJOR, ("B", ChordQuality.DIMINISHED, 0)),
+    ("vii7", "C", ScaleType.MAJOR, ("B", ChordQuality.HALF_DIMINISHED_SEVENTH, 0)),
+    ("ii", "A", ScaleType.MINOR, ("B", ChordQuality.DIMINISHED, 0)),
+    ("V65", "C", ScaleType.MAJOR, ("G", ChordQuality.DOMINANT_SEVENTH, 1)),
+    ("IV64", "G", ScaleType.MAJOR, ("C", ChordQuality.MAJOR, 2)),
+    ("bVII", "D", ScaleType.MAJOR, ("C", ChordQuality.MAJOR, 0)),
+    ("viio7", "C", ScaleType.MAJOR, ("B", ChordQuality.DIMINISHED_SEVENTH, 0)),
+    ("iiø7", "C", ScaleType.MAJOR, ("D", ChordQuality.HALF_DIMINISHED_SEVENTH, 0)),
+    ("IVmaj7", "F", ScaleType.MAJOR, ("Bb", ChordQuality.MAJOR_SEVENTH, 0)),
+    ("III+", "A", ScaleType.MINOR, ("C", ChordQuality.AUGMENTED, 0)),
+    ("V7/V", "C", ScaleType.MAJOR, ("D", ChordQuality.DOMINANT_SEVENTH, 0)),
+    ("V/ii", "C", ScaleType.MAJOR, ("A", ChordQuality.MAJOR, 0)),
+    ("viio7/V", "C", ScaleType.MAJOR, ("F#", ChordQuality.DIMINISHED_SEVENTH, 0)),
+    ("V/V/V", "C", ScaleType.MAJOR, ("A", ChordQuality.MAJOR, 0)),
+])
+def test_resolve_numeral(numeral, key, scale_type, expected):
+    resolved = resolve_numeral(numeral, key, scale_type)
+    assert (resolved.root, resolved.quality, resolved.inversion) == expected
+
+
+@pytest.mark.parametrize("numeral", ["", "VIII", "IIV", "V9", "ivmaj7", "V/", "xV"])
+def test_invalid_numerals(numeral):
+    with pytest.raises(ValueError, match="Invalid Roman numeral format"):
+        parse_numeral(numeral)
+
+
+def test_resolution_is_cached():
+    assert resolve_numeral("ii7", "Eb") is resolve_numeral("ii7", "Eb")
+    assert parse_numeral("V7/V") is parse_numeral("V7/V")
+    with pytest.raises(ValueError):
+        resolve_numeral("I", "H")
+
+
+def test_altered_numerals_keep_their_degree_letter():
+    borrowed = resolve_progression(["bVII", "bVI", "bIII", "bII"], "C")
+    assert [chord.root for chord in borrowed] == ["Bb", "Ab", "Eb", "Db"]
+    assert resolve_numeral("bII", "A", ScaleType.MINOR).root == "Bb"
+    # Raising a flat scale degree gives its natural
+    assert resolve_numeral("#iv", "F").root == "B"
+    assert resolve_numeral("#iv", "Eb").root == "A"
+
+
+def test_resolve_progression_in_every_key():
+    for tonic in ("C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B"):
+        chords = resolve_progression(["I", "IV", "V7"], tonic)
+        assert [c.quality for c in chords] == [ChordQuality.MAJOR, ChordQuality.MAJOR, ChordQuality.DOMINANT_SEVENTH]
+
+
+def test_roman_numeral_model():
+    roman = RomanNumeral.from_string("bVII6")
+    assert (roman.numeral, roman.accidental, roman.inversion) == ("VII", "b", 1)
+    secondary = RomanNumeral.from_string("V7/V")
+    assert secondary.secondary.numeral == "V"
+    chord = secondary.to_chord(ScaleInfo(key="G", scale_type=ScaleType.MAJOR))
+    assert (chord.root, chord.quality) == ("A", ChordQuality.DOMINANT_SEVENTH)
+    assert RomanNumeral.from_string("vii").to_chord().quality == ChordQuality.DIMINISHED
+
+
+def test_presets_expand_numerals():
+    preset = ChordProgressionPreset(name="Test", numerals=["ii", "V", "I"], durations=[1.0, 1.0, 2.0])
+    progression = preset.to_chord_progression("Bb", ScaleType.MAJOR)
+    assert [item.chord_symbol for item in progression.items] == ["Cm", "F", "Bb"]
+    assert [item.position for item in progression.items] == [0.0, 1.0, 2.0]
+    assert progression.total_duration == 4.0
+
+    chords = Presets().get_progression_chords("I_V_vi_IV", ScaleInfo(key="D", scale_type=ScaleType.MAJOR))
+    assert [c.to_symbol() for c in chords] == ["D", "A", "Bm", "G"]
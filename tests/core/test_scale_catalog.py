@@ -0,0 +1,49 @@
+"""Tests for the precomputed scale catalog."""
+import pytest
+from note_gen.core.constants import NOTE_TO_SEMITONE
+from note_gen.core.enums import ScaleType
+from note_gen.core.scale_catalog import SCALE_CATALOG, get_scale_table
+from note_gen.models.scale import Scale
+from note_gen.models.scale_info import ScaleInfo
+
+
+def test_catalog_covers_every_key_type_and_octave():
+    assert len(SCALE_CATALOG) == len(NOTE_TO_SEMITONE) * len(ScaleType) * 11
+    assert get_scale_table("C", ScaleType.MAJOR) is get_scale_table("C", "MAJOR", 4)
+
+
+def test_table_contents():
+    table = get_scale_table("B", ScaleType.MAJOR, 4)
+    assert [p.note_name for p in table.pitches] == ["B4", "C#4", "D#4", "E4", "F#4", "G#4", "A#4"]
+    assert [p.midi for p in table.ascending] == [71, 73, 75, 76, 78, 80, 82]
+    assert table.pitch_at(5).name == "F#"
+    assert table.degree_of("E") == 4
+    assert "C" not in table
+    assert list(table.pitch_classes) == [1, 3, 4, 6, 8, 10, 11]
+    with pytest.raises(ValueError):
+        table.pitch_at(8)
+    with pytest.raises(ValueError):
+        table.degree_of("C")
+    with pytest.raises(TypeError):
+        table.pitch_degrees["C"] = 1  # type: ignore[index]
+
+
+def test_ascending_drops_out_of_range_pitches():
+    table = get_scale_table("G", ScaleType.MAJOR, 9)
+    assert [p.midi for p in table.ascending] == [127]
+
+
+def test_unknown_scale_raises():
+    with pytest.raises(ValueError):
+        get_scale_table("H", ScaleType.MAJOR)
+    with pytest.raises(ValueError):
+        get_scale_table("C", ScaleType.MAJOR, 10)
+
+
+def test_models_read_from_catalog():
+    info = ScaleInfo(key="D", scale_type=ScaleType.DORIAN)
+    table = get_scale_table("D", ScaleType.DORIAN, 3)
+    assert [n.note_name for n in info.get_scale_notes(3)] == [p.note_name for p in table.pitches]
+
+    scale = Scale.from_root("A", ScaleType.MINOR)
+    assert [n.to_midi_number() for n in scale.notes] == [p.midi for p in get_scale_table("A", ScaleType.MINOR).ascending]
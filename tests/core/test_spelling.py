@@ -0,0 +1,81 @@
+"""Tests for key-aware enharmonic spelling."""
+import pytest
+from note_gen.core.enums import ScaleType
+from note_gen.core.scale_catalog import get_scale_table
+from note_gen.core.spelling import (
+    ENHARMONIC_NAMES, FLAT_NAMES, SHARP_NAMES, get_spelling, respell_notes, spell, transpose_key
+)
+from note_gen.models.note import Note
+from note_gen.models.note_array import HAS_NUMPY, NoteArray
+
+
+@pytest.mark.parametrize("key, scale_type, expected", [
+    ("C", ScaleType.MAJOR, SHARP_NAMES),
+    ("G", ScaleType.MAJOR, SHARP_NAMES),
+    ("F", ScaleType.MAJOR, FLAT_NAMES),
+    ("Bb", ScaleType.MAJOR, FLAT_NAMES),
+    ("D", ScaleType.MINOR, FLAT_NAMES),
+    ("E", ScaleType.MINOR, SHARP_NAMES),
+])
+def test_key_preference(key, scale_type, expected):
+    assert get_spelling(key, scale_type) == expected
+
+
+def test_mixed_spelling_follows_scale_letters():
+    # D harmonic minor: D E F G A Bb C#
+    names = [spell(pc, "D", ScaleType.HARMONIC_MINOR) for pc in (2, 4, 5, 7, 9, 10, 1)]
+    assert names == ["D", "E", "F", "G", "A", "Bb", "C#"]
+
+
+def test_spell_accepts_midi_and_names():
+    assert spell(70, "F") == "Bb"
+    assert spell("A#", "F", "MAJOR") == "Bb"
+    assert spell("Db", "E") == "C#"
+    with pytest.raises(ValueError):
+        spell("H", "C")
+    with pytest.raises(ValueError):
+        get_spelling("H")
+
+
+def test_transpose_key_prefers_readable_spelling():
+    assert [transpose_key("C", i) for i in range(12)] == list(FLAT_NAMES)
+    assert transpose_key("A", 4, ScaleType.MINOR) == "C#"
+    assert transpose_key("E", -1, "MINOR") == "Eb"
+    assert transpose_key("G", 12) == "G"
+    with pytest.raises(ValueError):
+        transpose_key("H", 1)
+
+
+def test_enharmonic_names_are_symmetric():
+    for name, other in ENHARMONIC_NAMES.items():
+        assert ENHARMONIC_NAMES[other] == name
+
+
+def test_respell_notes_keeps_octave_and_identity():
+    notes = [Note(pitch="A#", octave=3), Note(pitch="C", octave=4), Note(pitch="D#", octave=5)]
+    respelled = respell_notes(notes, "Bb")
+    assert [n.note_name for n in respelled] == ["Bb3", "C4", "Eb5"]
+    assert [n.to_midi_number() for n in respelled] == [n.to_midi_number() for n in notes]
+    assert respelled[1] is notes[1]
+
+
+def test_note_from_midi_number_in_key():
+    assert Note.from_midi_number(70).pitch == "A#"
+    assert Note.from_midi_number(70, key="F").note_name == "Bb4"
+    assert Note.from_midi_number(61, key="D", scale_type=ScaleType.MINOR).pitch == "Db"
+    assert Note(pitch="G#", octave=2).respell("Eb").note_name == "Ab2"
+
+
+def test_scale_tables_use_key_spelling():
+    table = get_scale_table("F", ScaleType.MAJOR)
+    assert [p.name for p in table.pitches] == ["F", "G", "A", "Bb", "C", "D", "E"]
+    assert [p.name for p in table.ascending][3] == "Bb"
+    assert table.degree_of("Bb") == table.degree_of("A#") == 4
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_note_array_respell():
+    notes = [Note(pitch="A#", octave=3), Note(pitch="Eb", octave=4), Note(pitch="E", octave=4)]
+    respelled = NoteArray.from_notes(notes).respell("Bb").to_notes()
+    assert [n.note_name for n in respelled] == ["Bb3", "Eb4", "E4"]
+    assert [n.pitch for n in NoteArray.from_notes(notes).respell("A").to_notes()] == ["A#", "D#", "E"]
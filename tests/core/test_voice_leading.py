@@ -0,0 +1,43 @@
+"""Tests for minimum-movement voice leading."""
+import pytest
+from note_gen.core.chord_voicing import get_voicing
+from note_gen.core.enums import ChordQuality
+from note_gen.core.voice_leading import clear_voice_leading_cache, lead_voices, movement
+
+
+def midis(voicings):
+    return [[pitch.midi for pitch in voicing] for voicing in voicings]
+
+
+def test_movement():
+    c_major = get_voicing("C", ChordQuality.MAJOR)
+    f_major = get_voicing("F", ChordQuality.MAJOR, octave=3, inversion=2)
+    assert movement(c_major, f_major) == 3
+    assert movement(c_major, c_major) == 0
+    # Each voice of the larger chord goes to the nearest voice of the smaller
+    assert movement(get_voicing("G", ChordQuality.DOMINANT_SEVENTH, octave=3, inversion=1), c_major) == 4
+
+
+def test_lead_voices_minimizes_movement():
+    clear_voice_leading_cache()
+    voicings = lead_voices([("C", ChordQuality.MAJOR), ("F", "MAJOR"), ("G", ChordQuality.MAJOR)])
+    assert midis(voicings) == [[64, 67, 72], [65, 69, 72], [67, 71, 74]]
+    assert lead_voices([]) == []
+
+
+def test_lead_voices_keeps_chord_tones():
+    chords = [("C", "MAJOR"), ("A", "MINOR"), ("D", "MINOR_SEVENTH"), ("G", "DOMINANT_SEVENTH")] * 125
+    voicings = lead_voices(chords)
+    assert len(voicings) == 500
+    for (root, quality), voicing in zip(chords, voicings):
+        expected = {pitch.midi % 12 for pitch in get_voicing(root, quality)}
+        assert {pitch.midi % 12 for pitch in voicing} == expected
+    # A repeating progression settles into a repeating voicing
+    assert voicings[4:8] == voicings[-4:]
+
+
+def test_invalid_chords():
+    with pytest.raises(ValueError):
+        lead_voices([("H", ChordQuality.MAJOR)])
+    with pytest.raises(ValueError):
+        lead_voices([("C", "NOT_A_QUALITY")])
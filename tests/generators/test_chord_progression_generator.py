@@ -51,3 +51,18 @@ async def test_genre_patterns(generator):
         assert len(progression.chords) == len(pattern)
 
 # Add similar async decorators and await calls for other test methods
+
+@pytest.mark.asyncio
+async def test_voice_led_progression():
+    """Voice-led progressions get inverted chord notes; root position keeps the defaults."""
+    pattern = [(1, ChordQuality.MAJOR), (4, ChordQuality.MAJOR), (5, ChordQuality.MAJOR)]
+    root_position = await ChordProgressionGenerator(name="Root", key="C").generate_from_pattern(pattern)
+    assert [n.note_name for n in root_position.chords[1].get_notes()] == ["F4", "A4", "C5"]
+
+    generator = ChordProgressionGenerator(name="Led", key="C", voicing_mode="voice_led")
+    progression = await generator.generate_from_pattern(pattern)
+    assert [[n.note_name for n in chord.get_notes()] for chord in progression.chords] == [
+        ["E4", "G4", "C5"], ["F4", "A4", "C5"], ["G4", "B4", "D5"]
+    ]
+    assert progression.items[0].chord.notes == progression.chords[0].notes
+    assert generator.to_dict()["voicing_mode"] == "voice_led"
@@ -0,0 +1,109 @@
+"""Tests for the generation executors."""
+import asyncio
+
+import pytest
+from note_gen.core.enums import ExecutorKind, PatternDirection, ScaleType
+from note_gen.core.exceptions import GenerationBusyError
+from note_gen.generators.executor import (
+    GenerationExecutor, decode_requests, decode_sequence, encode_requests, encode_sequence
+)
+from note_gen.generators.note_sequence_generator import GenerationRequest, NoteSequenceGenerator
+from note_gen.models.chord_progression import ChordProgression, ChordProgressionItem
+from note_gen.models.note import Note
+from note_gen.models.patterns import NotePattern, NotePatternData
+from note_gen.models.rhythm import RhythmNote, RhythmPattern
+from note_gen.models.scale_info import ScaleInfo
+
+
+@pytest.fixture
+def requests():
+    scale_info = ScaleInfo(key="Eb", scale_type=ScaleType.MAJOR)
+    chord_progression = ChordProgression(
+        name="Executor Progression",
+        key="Eb",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(["Eb", "Cm7", "Abmaj7", "Bb7"])
+        ],
+        total_duration=16.0
+    )
+    note_pattern = NotePattern(
+        name="Executor Pattern",
+        pattern=[Note.from_name("Eb4")],
+        data=NotePatternData(
+            key="Eb", root_note="Eb", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[
+            RhythmNote(position=0.0, duration=1.0, velocity=64, accent=True),
+            RhythmNote(position=1.0, duration=0.5, velocity=64)
+        ],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+    return [
+        GenerationRequest(
+            chord_progression=chord_progression, note_pattern=note_pattern,
+            rhythm_pattern=rhythm_pattern, scale_info=scale_info, transpose=transpose
+        )
+        for transpose in (None, 3, -2)
+    ]
+
+
+def test_request_encoding_shares_inputs(requests):
+    payload = encode_requests(requests)
+    decoded = decode_requests(payload)
+    assert payload.count('"Executor Progression"') == 1
+    assert [r.transpose for r in decoded] == [None, 3, -2]
+    assert decoded[0].chord_progression is decoded[2].chord_progression
+    assert decoded[0].chord_progression == requests[0].chord_progression
+
+
+def test_sequence_encoding_round_trip(requests):
+    sequence = NoteSequenceGenerator.generate_many_sync(requests[:1])[0]
+    assert decode_sequence(encode_sequence(sequence)) == sequence
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", list(ExecutorKind))
+async def test_executors_match_inline_generation(kind, requests):
+    expected = await NoteSequenceGenerator.generate_many(requests)
+    executor = GenerationExecutor(kind, max_workers=2)
+    try:
+        results = await executor.generate_many(requests)
+        single = await executor.generate(requests[1])
+    finally:
+        executor.shutdown()
+    assert [r.notes for r in results] == [e.notes for e in expected]
+    assert single.notes == expected[1].notes
+    assert executor.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_errors(requests):
+    empty = requests[0].model_copy(
+        update={"chord_progression": requests[0].chord_progression.model_copy(update={"items": []})}
+    )
+    executor = GenerationExecutor(ExecutorKind.THREAD, max_workers=1, max_queue=1)
+    try:
+        results = await executor.generate_many([empty, requests[0]], return_exceptions=True)
+        assert isinstance(results[0], ValueError)
+        with pytest.raises(ValueError):
+            await executor.generate(empty)
+
+        jobs = [executor.generate_many(requests) for _ in range(2)]
+        outcomes = await asyncio.gather(*jobs, return_exceptions=True)
+        assert sum(isinstance(o, GenerationBusyError) for o in outcomes) == 1
+    finally:
+        executor.shutdown()
+
+    with pytest.raises(ValueError):
+        GenerationExecutor("fiber")
+    with pytest.raises(ValueError):
+        GenerationExecutor(max_queue=0)
@@ -0,0 +1,111 @@
+"""Tests for the generation result cache."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from note_gen.core.enums import ScaleType
+from note_gen.database.repositories.base import BaseRepository
+from note_gen.generators.generation_cache import (
+    GenerationCache, content_key, get_generation_cache, input_dependencies
+)
+from note_gen.models.chord_progression import ChordProgression, ChordProgressionItem
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.patterns import NotePattern
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_sequence(name):
+    return NoteSequence(name=name, notes=[Note.from_name("C4")])
+
+
+@pytest.fixture
+def progression():
+    return ChordProgression(
+        id="p1",
+        name="Cache Progression",
+        key="C",
+        scale_type=ScaleType.MAJOR,
+        items=[ChordProgressionItem(chord_symbol="C", duration=4.0, position=0.0)],
+        total_duration=4.0
+    )
+
+
+def test_content_key_is_stable(progression):
+    key = content_key(progression, None, None, "C", ScaleType.MAJOR)
+    assert key == content_key(progression.model_copy(update={"id": "other"}), None, None, "C", "MAJOR")
+    assert key != content_key(progression, None, None, "C", ScaleType.MAJOR, transpose=2)
+    renamed = progression.model_copy(update={"name": "Renamed"})
+    assert key != content_key(renamed, None, None, "C", ScaleType.MAJOR)
+    assert input_dependencies("chord_progressions", progression) == {
+        ("chord_progressions", "id:p1"), ("chord_progressions", "name:Cache Progression")
+    }
+
+
+def test_lru_ttl_and_metrics():
+    clock = FakeClock()
+    cache = GenerationCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put("a", make_sequence("a"), alias=("x",))
+    cache.put("b", make_sequence("b"))
+    assert cache.get_alias(("x",)).name == "a"
+    cache.put("c", make_sequence("c"))  # evicts b, the least recently used
+    assert "b" not in cache and cache.get("b") is None
+
+    copy = cache.get("a")
+    copy.notes.clear()
+    assert len(cache.get("a").notes) == 1
+
+    clock.now = 11
+    assert cache.get_alias(("x",)) is None
+    assert cache.get("c") is None
+    assert cache.metrics() == {
+        "size": 0, "max_entries": 2, "ttl_seconds": 10, "hits": 3, "misses": 2,
+        "hit_rate": 0.6, "evictions": 1, "expirations": 2, "invalidations": 0
+    }
+
+    disabled = GenerationCache(max_entries=0)
+    disabled.put("a", make_sequence("a"))
+    assert len(disabled) == 0
+    with pytest.raises(ValueError):
+        GenerationCache(ttl_seconds=0)
+
+
+def test_invalidate_by_id_and_name():
+    cache = GenerationCache()
+    dependencies = {("note_patterns", "id:n1"), ("note_patterns", "name:Arp")}
+    cache.put("a", make_sequence("a"), dependencies, alias=("p", "Arp"))
+    cache.put("b", make_sequence("b"), {("note_patterns", "id:n2")})
+    assert cache.invalidate("note_patterns", "n1") == 1
+    assert cache.get_alias(("p", "Arp")) is None
+    assert cache.invalidate("note_patterns", name="Arp") == 0
+    assert cache.invalidate("rhythm_patterns", "n2") == 0
+    assert cache.invalidate("note_patterns", "n2") == 1
+    assert len(cache) == 0 and cache.stats.invalidations == 2
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_invalidate_shared_cache():
+    cache = get_generation_cache()
+    cache.clear()
+    collection = MagicMock()
+    collection.name = "note_patterns"
+    collection.update_one = AsyncMock(return_value=MagicMock(modified_count=0))
+    collection.delete_one = AsyncMock(return_value=MagicMock(deleted_count=1))
+    repository = BaseRepository[NotePattern](collection)
+    pattern_id = "0123456789abcdef01234567"
+
+    cache.put("a", make_sequence("a"), {("note_patterns", f"id:{pattern_id}")})
+    cache.put("b", make_sequence("b"), {("note_patterns", "name:Arp")})
+    cache.put("c", make_sequence("c"), {("rhythm_patterns", f"id:{pattern_id}")})
+    await repository.update(pattern_id, NotePattern(name="Arp", pattern=[Note.from_name("C4")]))
+    assert "a" not in cache and "b" not in cache and "c" in cache
+
+    collection.name = "rhythm_patterns"
+    assert await repository.delete(pattern_id)
+    assert len(cache) == 0
@@ -0,0 +1,158 @@
+"""Tests for chunked long-form generation."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from note_gen.core.enums import PatternDirection, ScaleType
+from note_gen.database.repositories.base import BaseRepository
+from note_gen.generators.long_form import (
+    FileCheckpointStore, LongFormCheckpoint, LongFormGenerator, MemoryCheckpointStore
+)
+from note_gen.generators.note_sequence_generator import NoteSequenceGenerator
+from note_gen.models.chord_progression import ChordProgression, ChordProgressionItem
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.patterns import NotePattern, NotePatternData
+from note_gen.models.rhythm import RhythmNote, RhythmPattern
+from note_gen.models.scale_info import ScaleInfo
+
+SYMBOLS = ["D", "Bm", "G", "A7", "F#m"]
+
+
+def make_generator(repeats=1):
+    scale_info = ScaleInfo(key="D", scale_type=ScaleType.MAJOR)
+    chord_progression = ChordProgression(
+        name="Long Progression",
+        key="D",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(SYMBOLS * repeats)
+        ],
+        total_duration=20.0 * repeats
+    )
+    note_pattern = NotePattern(
+        name="Long Pattern",
+        pattern=[Note.from_name("D4")],
+        data=NotePatternData(
+            key="D", root_note="D", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[
+            RhythmNote(position=0.0, duration=0.5, velocity=64, accent=True),
+            RhythmNote(position=0.25, duration=0.75, velocity=64),
+            RhythmNote(position=0.5, duration=1.0 / 3, velocity=64)
+        ],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+    return NoteSequenceGenerator(
+        chord_progression=chord_progression, note_pattern=note_pattern, rhythm_pattern=rhythm_pattern
+    )
+
+
+@pytest.mark.asyncio
+async def test_chunks_match_one_long_sequence():
+    """Chunks of a repeated progression join into the sequence generated in one go."""
+    expected = await make_generator(repeats=7).generate(transpose=3)
+    job = LongFormGenerator(make_generator(), total_bars=len(SYMBOLS) * 7, chunk_bars=4, transpose=3)
+
+    chunks = list(job.iter_chunks())
+    assert len(chunks) == 9
+    assert [note for sequence, _ in chunks for note in sequence.notes] == expected.notes
+    sequence, checkpoint = chunks[-1]
+    assert sequence.id == f"{job.job_id}-8"
+    assert sequence.metadata["long_form"]["first_bar"] == 32
+    assert checkpoint.complete and checkpoint.note_index == len(expected.notes)
+    assert checkpoint.position == pytest.approx(expected.duration)
+
+
+@pytest.mark.asyncio
+async def test_crashed_job_resumes_from_checkpoint():
+    """A job that fails mid-way resumes after its last saved chunk and yields the same piece."""
+    def job():
+        return LongFormGenerator(
+            make_generator(), total_bars=30, chunk_bars=8, genre="jazz", seed=11, job_id="resumable"
+        )
+
+    uninterrupted = []
+
+    async def collect(sequence):
+        uninterrupted.append(sequence)
+
+    await job().run(collect, MemoryCheckpointStore())
+
+    store = MemoryCheckpointStore()
+    saved = []
+
+    async def crash_after_two(sequence):
+        if len(saved) == 2:
+            raise RuntimeError("worker died")
+        saved.append(sequence)
+
+    with pytest.raises(RuntimeError):
+        await job().run(crash_after_two, store)
+    checkpoint = await store.load("resumable")
+    assert checkpoint.chunk == 2 and checkpoint.rng_state is not None
+
+    async def resume(sequence):
+        saved.append(sequence)
+
+    final = await job().run(resume, store)
+    assert final.complete and final.chunk == 4
+    assert [s.notes for s in saved] == [s.notes for s in uninterrupted]
+    assert [s.id for s in saved] == [f"resumable-{i}" for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_crash_before_checkpoint_rewrites_chunk_in_place():
+    """A chunk persisted but not checkpointed is written again on resume, replacing its first copy."""
+    documents = {}
+
+    async def replace_one(query, document, upsert=False):
+        assert upsert
+        documents[query["_id"]] = document
+
+    collection = MagicMock()
+    collection.name = "sequences"
+    collection.replace_one = AsyncMock(side_effect=replace_one)
+    repository = BaseRepository[NoteSequence](collection)
+
+    class CrashingStore(MemoryCheckpointStore):
+        async def save(self, checkpoint):
+            if checkpoint.chunk == 2 and not self.crashed:
+                self.crashed = True
+                raise RuntimeError("worker died")
+            await super().save(checkpoint)
+
+    store = CrashingStore()
+    store.crashed = False
+    job = LongFormGenerator(make_generator(), total_bars=30, chunk_bars=8, job_id="upserted")
+    with pytest.raises(RuntimeError):
+        await job.run(repository.upsert, store)
+    assert list(documents) == ["upserted-0", "upserted-1"]
+    assert (await store.load("upserted")).chunk == 1
+
+    final = await job.run(repository.upsert, store)
+    assert final.complete and collection.replace_one.call_count == 5
+    assert sorted(documents) == [f"upserted-{i}" for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_file_checkpoint_store(tmp_path):
+    store = FileCheckpointStore(str(tmp_path))
+    job = LongFormGenerator(make_generator(), total_bars=12, chunk_bars=5, genre="pop", seed=3, job_id="filed")
+    _, checkpoint = next(job.iter_chunks())
+    await store.save(checkpoint)
+    assert await store.load("filed") == checkpoint
+    assert await store.load("missing") is None
+    with pytest.raises(ValueError):
+        await store.load("../escape")
+
+    other = LongFormGenerator(make_generator(), total_bars=12, chunk_bars=6, job_id="filed")
+    with pytest.raises(ValueError):
+        next(other.iter_chunks(LongFormCheckpoint.model_validate(checkpoint.model_dump())))
@@ -0,0 +1,66 @@
+"""Tests for the Markov chord progression model."""
+import random
+from collections import Counter
+
+import pytest
+from note_gen.core.enums import ChordQuality, ScaleType
+from note_gen.generators.chord_progression_generator import ChordProgressionGenerator
+from note_gen.generators.markov_progression import AliasTable, get_markov_model
+from note_gen.models.note_array import HAS_NUMPY
+
+
+def test_alias_table_matches_distribution():
+    weights = [1.0, 0.0, 3.0, 6.0]
+    table = AliasTable.from_weights(weights)
+    rng = random.Random(7)
+    counts = Counter(table.sample(rng) for _ in range(20000))
+    assert counts[1] == 0
+    for outcome, weight in enumerate(weights):
+        assert counts[outcome] / 20000 == pytest.approx(weight / 10, abs=0.02)
+    with pytest.raises(ValueError):
+        AliasTable.from_weights([0.0, 0.0])
+
+
+def test_model_is_cached_and_normalized():
+    model = get_markov_model("jazz")
+    assert get_markov_model("jazz") is model
+    assert (2, ChordQuality.MINOR) in model.states
+    for row in model.probabilities:
+        assert sum(row) == pytest.approx(1.0)
+    assert len(get_markov_model("jazz", smoothing=0.5).states) > len(model.states)
+    with pytest.raises(ValueError, match="Unsupported genre"):
+        get_markov_model("polka")
+
+
+def test_sampling_follows_observed_transitions():
+    model = get_markov_model("blues")
+    index = {state: i for i, state in enumerate(model.states)}
+    progression = model.sample(64, seed=3)
+    assert progression == model.sample(64, seed=3)
+    for current, following in zip(progression, progression[1:]):
+        assert model.probabilities[index[current]][index[following]] > 0
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_sample_many_is_reproducible_and_valid():
+    model = get_markov_model("pop", smoothing=0.2)
+    index = {state: i for i, state in enumerate(model.states)}
+    batch = model.sample_many(500, 8, seed=11)
+    assert batch == model.sample_many(500, 8, seed=11)
+    assert len(batch) == 500 and all(len(p) == 8 for p in batch)
+    assert len({tuple(p) for p in batch}) > 50
+    for progression in batch[:50]:
+        for current, following in zip(progression, progression[1:]):
+            assert model.probabilities[index[current]][index[following]] > 0
+
+
+@pytest.mark.asyncio
+async def test_generator_uses_markov_model():
+    generator = ChordProgressionGenerator(name="Markov", key="G", scale_type=ScaleType.MAJOR)
+    first = await generator.generate_random(6, genre="jazz", seed=5)
+    second = await generator.generate_random(6, genre="jazz", seed=5)
+    assert [c.to_symbol() for c in first.chords] == [c.to_symbol() for c in second.chords]
+    assert len(first.chords) == 6
+
+    chords = generator._generate_chord_sequence(32, complexity=0.9, seed=1)
+    assert len({(c.root, c.quality) for c in chords}) > 1
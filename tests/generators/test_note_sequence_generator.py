@@ -86,3 +86,470 @@ async def test_generate_sequence(scale_info):
     assert sequence.scale_info["key"] == scale_info.key
     assert sequence.progression_name == "Test Progression"
     assert sequence.note_pattern_name == "Test Pattern"
+
+
+@pytest.mark.asyncio
+async def test_vectorized_engine_matches_standard():
+    """The vectorized engine produces the same notes as the standard one."""
+    scale_info = ScaleInfo(key="F", scale_type=ScaleType.MAJOR)
+    symbols = ["F", "Dm7", "Bbmaj7", "C7", "A7"]
+    chord_progression = ChordProgression(
+        name="Engine Progression",
+        key="F",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(symbols * 8)
+        ],
+        total_duration=160.0
+    )
+    note_pattern = NotePattern(
+        name="Engine Pattern",
+        pattern=[Note.from_name("F4")],
+        data=NotePatternData(
+            key="F", root_note="F", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[
+            RhythmNote(position=0.0, duration=1.0, velocity=64, accent=True),
+            RhythmNote(position=0.5, duration=0.5, velocity=64),
+            RhythmNote(position=1.0, duration=0.75, velocity=64)
+        ],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+
+    sequences = {}
+    for engine in ("standard", "vectorized"):
+        generator = NoteSequenceGenerator(
+            chord_progression=chord_progression,
+            note_pattern=note_pattern,
+            rhythm_pattern=rhythm_pattern,
+            engine=engine
+        )
+        sequences[engine] = await generator.generate(transpose=2)
+
+    standard, vectorized = sequences["standard"], sequences["vectorized"]
+    assert vectorized.notes == standard.notes
+    assert vectorized.duration == standard.duration
+    assert standard.notes[0].velocity == 80
+
+
+@pytest.mark.asyncio
+async def test_streaming_matches_generate():
+    """Streaming yields the generated notes in bounded chunks."""
+    scale_info = ScaleInfo(key="Bb", scale_type=ScaleType.MAJOR)
+    chord_progression = ChordProgression(
+        name="Stream Progression",
+        key="Bb",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(["Bb", "Gm7", "Ebmaj7", "F7"] * 5)
+        ],
+        total_duration=80.0
+    )
+    note_pattern = NotePattern(
+        name="Stream Pattern",
+        pattern=[Note.from_name("Bb4")],
+        data=NotePatternData(
+            key="Bb", root_note="Bb", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[
+            RhythmNote(position=0.0, duration=0.5, velocity=64, accent=True),
+            RhythmNote(position=0.5, duration=1.5, velocity=64)
+        ],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+    generator = NoteSequenceGenerator(
+        chord_progression=chord_progression,
+        note_pattern=note_pattern,
+        rhythm_pattern=rhythm_pattern
+    )
+
+    expected = (await generator.generate(transpose=-3)).notes
+    chunks = list(generator.iter_chunks(transpose=-3, chunk_size=7))
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    assert [note for chunk in chunks for note in chunk] == expected
+    assert list(generator.iter_notes(transpose=-3)) == expected
+    assert [note async for note in generator.aiter_notes(transpose=-3, chunk_size=5)] == expected
+    with pytest.raises(ValueError):
+        next(generator.iter_chunks(chunk_size=0))
+
+
+@pytest.mark.asyncio
+async def test_generate_many_matches_generate():
+    """Batch generation shares work but returns the same notes as generate."""
+    from note_gen.generators.note_sequence_generator import GenerationRequest
+
+    scale_info = ScaleInfo(key="G", scale_type=ScaleType.MAJOR)
+    chord_progression = ChordProgression(
+        name="Batch Progression",
+        key="G",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(["G", "Em", "C", "D7"])
+        ],
+        total_duration=16.0
+    )
+    note_pattern = NotePattern(
+        name="Batch Pattern",
+        pattern=[Note.from_name("G4")],
+        data=NotePatternData(
+            key="G", root_note="G", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[RhythmNote(position=0.0, duration=1.0, velocity=64, accent=True)],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+    empty_progression = chord_progression.model_copy(update={"items": []})
+
+    requests = [
+        GenerationRequest(
+            chord_progression=chord_progression, note_pattern=note_pattern,
+            rhythm_pattern=rhythm_pattern, transpose=transpose
+        )
+        for transpose in (None, 2, -5, 2)
+    ]
+    requests.append(GenerationRequest(
+        chord_progression=empty_progression, note_pattern=note_pattern, rhythm_pattern=rhythm_pattern
+    ))
+
+    results = await NoteSequenceGenerator.generate_many(requests, return_exceptions=True)
+    assert isinstance(results[-1], ValueError)
+    generator = NoteSequenceGenerator(
+        chord_progression=chord_progression,
+        note_pattern=note_pattern,
+        rhythm_pattern=rhythm_pattern
+    )
+    for request, result in zip(requests[:-1], results):
+        expected = await generator.generate(transpose=request.transpose)
+        assert result.notes == expected.notes
+        assert result.duration == expected.duration
+    assert results[1].notes is not results[3].notes
+
+    with pytest.raises(ValueError):
+        await NoteSequenceGenerator.generate_many(requests)
+
+
+@pytest.mark.asyncio
+async def test_generate_many_shares_stages_by_content(monkeypatch):
+    """Equal inputs loaded as separate objects share their batch stages."""
+    from note_gen.generators import vectorized_engine
+    from note_gen.generators.note_sequence_generator import GenerationRequest
+
+    calls = []
+    chord_tone_array = vectorized_engine.chord_tone_array
+    monkeypatch.setattr(vectorized_engine, "chord_tone_array",
+                        lambda *args: calls.append(1) or chord_tone_array(*args))
+    progression = ChordProgression(
+        name="Shared", key="C", scale_type=ScaleType.MAJOR,
+        items=[ChordProgressionItem(chord_symbol="C", duration=4.0, position=0.0)]
+    )
+    rhythm_pattern = RhythmPattern(pattern=[RhythmNote(position=0.0, duration=1.0)], time_signature=(4, 4))
+    scale_info = ScaleInfo(key="C", scale_type=ScaleType.MAJOR)
+    requests = [
+        GenerationRequest(
+            chord_progression=progression.model_copy(deep=True),
+            note_pattern=NotePattern(name=name, pattern=[Note.from_name("C4")], skip_validation=True),
+            rhythm_pattern=rhythm_pattern.model_copy(deep=True),
+            scale_info=scale_info
+        )
+        for name in ("First", "Second")
+    ]
+    first, second = await NoteSequenceGenerator.generate_many(requests)
+    assert calls == [1] and first.notes == second.notes
+
+
+@pytest.mark.asyncio
+async def test_incremental_edits_match_regeneration():
+    """Chord and rhythm edits splice in the same notes a full regeneration gives."""
+    scale_info = ScaleInfo(key="F", scale_type=ScaleType.MAJOR)
+    chord_progression = ChordProgression(
+        name="Incremental Progression",
+        key="F",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(["F", "Dm7", "Bbmaj7", "C7"] * 4)
+        ],
+        total_duration=64.0
+    )
+    note_pattern = NotePattern(
+        name="Incremental Pattern",
+        pattern=[Note.from_name("F4")],
+        data=NotePatternData(
+            key="F", root_note="F", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[
+            RhythmNote(position=0.0, duration=0.5, velocity=64, accent=True),
+            RhythmNote(position=0.5, duration=1.0, velocity=64),
+            RhythmNote(position=1.5, duration=0.25, velocity=64)
+        ],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+    generator = NoteSequenceGenerator(
+        chord_progression=chord_progression,
+        note_pattern=note_pattern,
+        rhythm_pattern=rhythm_pattern
+    )
+    incremental = generator.generate_incremental(transpose=2)
+
+    async def assert_matches_regeneration(sequence):
+        expected = await incremental.generator.generate(transpose=2)
+        assert sequence.notes == expected.notes
+        assert sequence.duration == expected.duration
+        assert incremental.segments[-1][1] == len(sequence.notes)
+
+    await assert_matches_regeneration(incremental.sequence)
+    first = incremental.sequence
+    edited = incremental.replace_chord(5, ChordProgressionItem(chord_symbol="Gm7", duration=4.0))
+    assert edited.notes[:incremental.segments[5][0]] == first.notes[:incremental.segments[5][0]]
+    assert edited.id == first.id and edited is not first
+    await assert_matches_regeneration(edited)
+    await assert_matches_regeneration(incremental.replace_chord(2, ChordProgressionItem(chord_symbol="Bb")))
+    await assert_matches_regeneration(incremental.insert_chord(0, ChordProgressionItem(chord_symbol="Am")))
+    await assert_matches_regeneration(incremental.remove_chord(-1))
+    await assert_matches_regeneration(incremental.replace_rhythm_note(
+        1, RhythmNote(position=0.5, duration=0.75, velocity=64, accent=True)
+    ))
+    assert len(incremental.generator.chord_progression.items) == 16
+    assert generator.chord_progression.items[2].chord_symbol == "Bbmaj7"
+
+    with pytest.raises(IndexError):
+        incremental.replace_chord(16, ChordProgressionItem(chord_symbol="C"))
+
+
+@pytest.mark.asyncio
+async def test_compiled_plan_matches_generate():
+    """A compiled plan executes to the same sequence in any scale and transposition."""
+    import pickle
+
+    scale_info = ScaleInfo(key="Eb", scale_type=ScaleType.MAJOR)
+    chord_progression = ChordProgression(
+        name="Plan Progression",
+        key="Eb",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(["Eb", "Cm7", "Abmaj7", "Bb7"] * 3)
+        ],
+        total_duration=48.0
+    )
+    note_pattern = NotePattern(
+        name="Plan Pattern",
+        pattern=[Note.from_name("Eb4")],
+        data=NotePatternData(
+            key="Eb", root_note="Eb", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[
+            RhythmNote(position=0.0, duration=0.5, velocity=64, accent=True),
+            RhythmNote(position=0.5, duration=1.0, velocity=64),
+            RhythmNote(position=1.5, duration=0.25, velocity=64)
+        ],
+        time_signature=(3, 4),
+        swing_enabled=False
+    )
+    generator = NoteSequenceGenerator(
+        chord_progression=chord_progression,
+        note_pattern=note_pattern,
+        rhythm_pattern=rhythm_pattern
+    )
+    plan = pickle.loads(pickle.dumps(generator.compile_plan()))
+    assert len(plan.tones) < len(plan)
+
+    for scale in (scale_info, ScaleInfo(key="E", scale_type=ScaleType.MINOR)):
+        for transpose in (None, 5, -7):
+            expected = await generator.generate(scale, transpose)
+            result = plan.execute(scale, transpose)
+            assert result.notes == expected.notes
+            assert result.duration == expected.duration
+            assert result.time_signature == expected.time_signature
+            assert result.scale_info == expected.scale_info
+    with pytest.raises(ValueError):
+        plan.execute(scale_info, 80)
+
+
+@pytest.mark.asyncio
+async def test_voice_led_generation():
+    """Voice-led chords move less and every generation path agrees on them."""
+    from note_gen.generators.note_sequence_generator import GenerationRequest
+
+    scale_info = ScaleInfo(key="C", scale_type=ScaleType.MAJOR)
+    chord_progression = ChordProgression(
+        name="Voice-Led Progression",
+        key="C",
+        scale_type=ScaleType.MAJOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(["C", "Am", "F", "G7"] * 4)
+        ],
+        total_duration=64.0
+    )
+    note_pattern = NotePattern(
+        name="Voice-Led Pattern",
+        pattern=[Note.from_name("C4")],
+        data=NotePatternData(
+            key="C", root_note="C", scale_type=ScaleType.MAJOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[RhythmNote(position=0.0, duration=1.0, velocity=64, accent=True)],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+
+    def upper_voices(notes):
+        # Each chord contributes its root then its voicing
+        voices, index = [], 0
+        for item in chord_progression.items:
+            size = len(item.chord.get_notes()) + 1
+            voices.append([note.midi_number for note in notes[index + 1:index + size]])
+            index += size
+        return voices
+
+    def total_movement(voices):
+        return sum(
+            sum(min(abs(a - b) for b in current) for a in following)
+            for current, following in zip(voices, voices[1:])
+        )
+
+    sequences = {}
+    for engine in ("standard", "vectorized"):
+        for mode in ("root_position", "voice_led"):
+            generator = NoteSequenceGenerator(
+                chord_progression=chord_progression,
+                note_pattern=note_pattern,
+                rhythm_pattern=rhythm_pattern,
+                engine=engine,
+                voicing_mode=mode
+            )
+            sequences[engine, mode] = await generator.generate()
+
+    led = sequences["standard", "voice_led"].notes
+    assert sequences["vectorized", "voice_led"].notes == led
+    assert total_movement(upper_voices(led)) < total_movement(
+        upper_voices(sequences["standard", "root_position"].notes)
+    )
+
+    assert list(generator.iter_notes(chunk_size=5)) == led
+    assert generator.compile_plan().execute(scale_info).notes == led
+    [batched] = await NoteSequenceGenerator.generate_many([GenerationRequest(
+        chord_progression=chord_progression, note_pattern=note_pattern,
+        rhythm_pattern=rhythm_pattern, voicing_mode="voice_led"
+    )])
+    assert batched.notes == led
+    with pytest.raises(ValueError):
+        generator.generate_incremental()
+
+
+@pytest.mark.asyncio
+async def test_transposition_fan_out():
+    """Fanned-out keys share the timing, move every tone and are spelled in their key."""
+    from note_gen.core.spelling import get_spelling, transpose_key
+
+    scale_info = ScaleInfo(key="A", scale_type=ScaleType.MINOR)
+    chord_progression = ChordProgression(
+        name="Fan-Out Progression",
+        key="A",
+        scale_type=ScaleType.MINOR,
+        scale_info=scale_info,
+        items=[
+            ChordProgressionItem(chord_symbol=symbol, duration=4.0, position=4.0 * i)
+            for i, symbol in enumerate(["Am", "Dm7", "E7", "F", "G#dim"] * 3)
+        ],
+        total_duration=60.0
+    )
+    note_pattern = NotePattern(
+        name="Fan-Out Pattern",
+        pattern=[Note.from_name("A4")],
+        data=NotePatternData(
+            key="A", root_note="A", scale_type=ScaleType.MINOR,
+            direction=PatternDirection.UP, octave=4
+        ),
+        scale_info=scale_info,
+        skip_validation=True
+    )
+    rhythm_pattern = RhythmPattern(
+        pattern=[
+            RhythmNote(position=0.0, duration=0.5, velocity=64, accent=True),
+            RhythmNote(position=0.5, duration=1.5, velocity=64)
+        ],
+        time_signature=(4, 4),
+        swing_enabled=False
+    )
+    generator = NoteSequenceGenerator(
+        chord_progression=chord_progression,
+        note_pattern=note_pattern,
+        rhythm_pattern=rhythm_pattern
+    )
+
+    canonical = await generator.generate()
+    keys = generator.generate_transpositions()
+    assert sorted(keys) == list(range(12))
+    for offset, sequence in keys.items():
+        key = transpose_key("A", offset, ScaleType.MINOR)
+        assert sequence.scale_info["key"] == key
+        assert [n.midi_number for n in sequence.notes] == [n.midi_number + offset for n in canonical.notes]
+        assert [(n.duration, n.position, n.velocity) for n in sequence.notes] == [
+            (n.duration, n.position, n.velocity) for n in canonical.notes
+        ]
+        spelling = get_spelling(key, ScaleType.MINOR)
+        assert all(n.pitch == spelling[n.midi_number % 12] for n in sequence.notes)
+    assert keys[0].notes == canonical.notes
+    assert keys[4].notes[0].pitch == "C#"
+
+    # Far transpositions fold back by octaves, clamp to the range, or are rejected
+    high = generator.generate_transpositions(transpositions=[70])[70]
+    assert all(0 <= n.midi_number <= 127 for n in high.notes)
+    assert [n.midi_number % 12 for n in high.notes] == [(n.midi_number + 70) % 12 for n in canonical.notes]
+    clamped = generator.generate_transpositions(transpositions=[70], range_policy="clamp")[70]
+    assert max(n.midi_number for n in clamped.notes) == 127
+    with pytest.raises(ValueError):
+        generator.generate_transpositions(transpositions=[-70], range_policy="error")
+
+    # The columnar fan-out shares one set of timing columns across keys
+    arrays = generator.compile_plan().fan_out_arrays(scale_info)
+    assert arrays[0].duration is arrays[11].duration
+    assert not arrays[0].position.flags.writeable
+    for offset, array in arrays.items():
+        notes = keys[offset].notes
+        assert array.midi.tolist() == [n.midi_number for n in notes]
+        assert array.velocity.tolist() == [n.velocity for n in notes]
+        assert array.flat.tolist() == [n.pitch.endswith("b") for n in notes]
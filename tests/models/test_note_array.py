@@ -0,0 +1,78 @@
+"""Tests for the columnar NoteArray and its NoteSequence integration."""
+import pytest
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+
+np = pytest.importorskip("numpy")
+from note_gen.models.note_array import NoteArray  # noqa: E402
+
+
+@pytest.fixture
+def notes():
+    return [
+        Note(pitch="C", octave=4, duration=1.0, velocity=64, position=0.0),
+        Note(pitch="Eb", octave=4, duration=0.5, velocity=80, position=1.0),
+        Note(pitch="G", octave=4, duration=0.5, velocity=100, position=1.5),
+    ]
+
+
+def test_round_trip_preserves_spelling(notes):
+    array = NoteArray.from_notes(notes)
+    assert len(array) == 3
+    assert array.midi.tolist() == [60, 63, 67]
+    assert [n.note_name for n in array.to_notes()] == ["C4", "Eb4", "G4"]
+
+
+def test_transpose_matches_note_transpose(notes):
+    transposed = NoteArray.from_notes(notes).transpose(5).to_notes()
+    expected = [note.transpose(5) for note in notes]
+    assert [n.model_dump() for n in transposed] == [n.model_dump() for n in expected]
+    with pytest.raises(ValueError):
+        NoteArray.from_notes(notes).transpose(100)
+
+
+def test_time_stretch_and_velocity(notes):
+    array = NoteArray.from_notes(notes).time_stretch(2.0).scale_velocity(1.5)
+    assert array.duration.tolist() == [2.0, 1.0, 1.0]
+    assert array.position.tolist() == [0.0, 2.0, 3.0]
+    assert array.velocity.tolist() == [96, 120, 127]
+
+
+def test_slice_and_concatenate(notes):
+    array = NoteArray.from_notes(notes)
+    assert array[1:].midi.tolist() == [63, 67]
+    assert array[-1].midi.tolist() == [67]
+    index = np.flatnonzero(array.midi == 63)[0]
+    assert array[index].midi.tolist() == [63] and len(array[index].to_notes()) == 1
+    joined = array[:1].append(array[:1])
+    assert joined.midi.tolist() == [60, 60]
+    assert joined.position.tolist() == [0.0, 1.0]
+    assert len(NoteArray.concatenate([array, array])) == 6
+
+
+def test_invalid_columns_rejected():
+    with pytest.raises(ValueError):
+        NoteArray([60], [0.0], [64], [0.0])
+    with pytest.raises(ValueError):
+        NoteArray([60, 62], [1.0], [64], [0.0])
+
+
+def test_sequence_transpose_and_clone(notes):
+    sequence = NoteSequence(notes=notes, duration=2.0, scale_info={"key": "C"})
+    transposed = sequence.transpose(2)
+    assert [n.note_name for n in transposed.notes] == ["D4", "F4", "A4"]
+    assert [n.note_name for n in sequence.notes] == ["C4", "Eb4", "G4"]
+
+    clone = sequence.clone()
+    assert clone.model_dump() == sequence.model_dump()
+    clone.notes[0].velocity = 1
+    clone.scale_info["key"] = "D"
+    assert sequence.notes[0].velocity == 64
+    assert sequence.scale_info["key"] == "C"
+
+
+def test_sequence_from_array(notes):
+    sequence = NoteSequence.from_array(NoteArray.from_notes(notes).time_stretch(2.0), name="stretched")
+    assert sequence.duration == 4.0
+    assert sequence.name == "stretched"
+    assert sequence.notes[2].position == 3.0
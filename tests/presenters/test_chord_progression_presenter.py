@@ -89,3 +89,26 @@ def test_present_many():
     assert result[0]["name"] == progressions[0].name
     assert "id" in result[1]
     assert result[1]["name"] == progressions[1].name
+
+
+def test_present_with_voicings():
+    """Test presenting a chord progression with voiced chord notes."""
+    progression = ChordProgression(
+        name="Test Progression",
+        key="C",
+        scale_type=ScaleType.MAJOR,
+        chords=[
+            Chord(root="C", quality=ChordQuality.MAJOR, duration=1),
+            Chord(root="G", quality=ChordQuality.DOMINANT_SEVENTH, duration=1, octave=3),
+            Chord(root="B", quality=ChordQuality.DOMINANT_SEVENTH, duration=1, octave=8),
+        ]
+    )
+
+    result = ChordProgressionPresenter.present(progression, include_voicings=True)
+
+    assert result["chords"][0]["voicing"] == ["C4", "E4", "G4"]
+    assert result["chords"][1]["voicing"] == ["G3", "B3", "D4", "F4"]
+    # Voiced like the chord's own notes, an octave down to fit the MIDI range
+    assert result["chords"][2]["voicing"] == ["B7", "D#8", "F#8", "A8"]
+    assert result["chords"][2]["voicing"] == [n.note_name for n in progression.chords[2].get_notes()]
+    assert "voicing" not in ChordProgressionPresenter.present(progression)["chords"][0]
@@ -14,3 +14,11 @@ def test_router_exists():
 def test_router_tags():
     """Test that the router has the correct tags."""
     assert router.tags == ["sequences"]
+
+
+def test_router_has_batch_route():
+    """Test that the batch generation route is registered."""
+    assert any(
+        route.path == "/generate-batch" and "POST" in route.methods
+        for route in router.routes
+    )
@@ -0,0 +1,84 @@
+"""Tests for compiled, level-aware validation pipelines."""
+from note_gen.core.enums import ValidationLevel
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.rhythm import RhythmNote, RhythmPattern
+from note_gen.validation.base_validation import ValidationViolation
+from note_gen.validation.musical_validation import validate_note_sequence
+from note_gen.validation.rule_registry import RULES, RuleRegistry, ValidationRule
+from note_gen.validation.validation_manager import ValidationManager
+
+
+def notes(*names):
+    return [Note.from_name(name) for name in names]
+
+
+def codes(result):
+    return [violation.code for violation in result.violations]
+
+
+def test_pipelines_are_compiled_once_per_type_and_level():
+    strict = RULES.pipeline(list, ValidationLevel.STRICT)
+    assert RULES.pipeline(list, "strict") is strict
+    assert RULES.pipeline(list, ValidationLevel.NORMAL) is not strict
+    names = {rule.name for rule in strict.rules}
+    assert {"parallel_motion", "excessive_repetition"} <= names
+    assert "parallel_motion" not in {rule.name for rule in RULES.pipeline(list, ValidationLevel.NORMAL).rules}
+    assert "total_duration" in {rule.name for rule in RULES.pipeline(NoteSequence, ValidationLevel.RELAXED).rules}
+    assert "total_duration" not in names
+
+
+def test_musical_rules_by_level():
+    leaps = notes("C4", "G4", "D5", "A5", "A5", "A5", "A5")
+    strict = validate_note_sequence(leaps, ValidationLevel.STRICT)
+    # Violations are grouped by rule, whatever the traversal order
+    assert codes(strict) == ["parallel_motion", "parallel_motion", "excessive_repetition"]
+    assert strict.violations[1].path == "notes[1]"
+
+    wide = notes("C3", "D4", "C3")
+    assert codes(validate_note_sequence(wide, ValidationLevel.NORMAL)) == ["large_interval", "large_interval"]
+    assert validate_note_sequence(wide, ValidationLevel.RELAXED).is_valid
+    assert codes(validate_note_sequence([], ValidationLevel.RELAXED)) == ["empty_sequence"]
+
+
+def test_note_sequence_and_rhythm_rules():
+    sequence = NoteSequence(notes=notes("C4", "E4", "G4"), duration=4.0)
+    result = sequence.validate_sequence()
+    assert codes(result) == ["VALIDATION_ERROR"] and result.violations[0].path == "duration"
+    assert ValidationManager.validate_rules(sequence.model_copy(update={"duration": 3.0})).is_valid
+
+    # The musical rules are for note lists; a sequence has its durations checked at every level
+    wide = NoteSequence(notes=notes("C3", "C5"), duration=2.0)
+    assert wide.validate_sequence(ValidationLevel.STRICT).is_valid
+    silent = wide.model_copy(update={"notes": [notes("C3")[0].model_copy(update={"duration": 0.0})]})
+    for level in ValidationLevel:
+        result = silent.validate_sequence(level)
+        assert codes(result) == ["VALIDATION_ERROR", "VALIDATION_ERROR"]
+        assert [violation.path for violation in result.violations] == ["notes[0].duration", "duration"]
+
+    rhythm = RhythmPattern.model_construct(
+        pattern=[RhythmNote(position=1.0, duration=1.0), RhythmNote(position=0.0, duration=1.0)],
+        time_signature=(4, 3)
+    )
+    assert codes(ValidationManager.validate_rules(rhythm)) == ["INVALID_TIME_SIGNATURE", "UNORDERED_POSITIONS"]
+
+
+def test_registering_a_rule_recompiles():
+    registry = RuleRegistry()
+    calls = []
+
+    @registry.rule("high", levels={ValidationLevel.STRICT}, per_note=True, once=True)
+    def high(sequence, index):
+        calls.append(index)
+        if sequence[index].octave > 4:
+            return [ValidationViolation(code="too_high", message="Too high", path=f"notes[{index}]")]
+        return None
+
+    assert registry.validate(notes("C4", "C5", "C6"), ValidationLevel.NORMAL).is_valid
+    result = registry.validate(notes("C4", "C5", "C6"), ValidationLevel.STRICT)
+    # A once rule stops at its first violation
+    assert codes(result) == ["too_high"] and calls == [0, 1]
+
+    registry.register(ValidationRule(name="never", check=lambda model: None))
+    assert len(registry.pipeline(list, ValidationLevel.STRICT).rules) == 2
+    assert registry.applies_to(list) and not registry.applies_to(dict)
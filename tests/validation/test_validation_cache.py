@@ -0,0 +1,87 @@
+"""Tests for the content-addressed validation cache."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from note_gen.controllers.validation_controller import ValidationController
+from note_gen.core.enums import ValidationLevel
+from note_gen.database.repositories.base import BaseRepository
+from note_gen.models.note import Note
+from note_gen.models.note_sequence import NoteSequence
+from note_gen.models.patterns import RhythmPattern
+from note_gen.validation.base_validation import ValidationResult
+from note_gen.validation.rule_registry import RuleRegistry
+from note_gen.validation.validation_cache import ValidationCache, get_validation_cache
+from note_gen.validation.validation_manager import ValidationManager
+
+
+def make_sequence(sequence_id="seq"):
+    notes = [Note.from_name(name) for name in ("C4", "E4", "G4")]
+    return NoteSequence(id=sequence_id, notes=notes, duration=3.0)
+
+
+def test_keys_and_lru():
+    cache = ValidationCache(max_entries=2)
+    key = cache.key(NoteSequence, make_sequence("a"), ValidationLevel.STRICT)
+    # Ids are not content, levels are
+    assert key == cache.key("NoteSequence", make_sequence("b"), "strict")
+    assert key != cache.key(NoteSequence, make_sequence("a"), ValidationLevel.NORMAL)
+    assert cache.key(dict, {"id": 1, "a": [1]}) == cache.key(dict, {"_id": 2, "a": [1]})
+
+    assert cache.get(key) is None
+    cache.put(key, ValidationResult(is_valid=True))
+    result = cache.get(key)
+    result.add_error("notes", "changed by the caller")
+    assert cache.get(key).is_valid
+    for name in ("x", "y"):
+        cache.put(cache.key(name, {}), ValidationResult())
+    assert key not in cache
+    assert cache.metrics() == {
+        "size": 2, "max_entries": 2, "hits": 2, "misses": 1, "hit_rate": 2 / 3, "evictions": 1
+    }
+    ValidationCache(max_entries=0).put(key, ValidationResult())
+    with pytest.raises(ValueError):
+        ValidationCache(max_entries=-1)
+
+
+def test_validation_runs_once_per_content_and_level():
+    cache = get_validation_cache()
+    cache.clear()
+    calls = []
+
+    def validate():
+        calls.append(1)
+        return RuleRegistry().validate([])
+
+    cache.get_or_validate(list, [], ValidationLevel.STRICT, validate)
+    cache.get_or_validate(list, [], ValidationLevel.STRICT, validate)
+    assert calls == [1]
+
+    sequence = make_sequence()
+    first = ValidationManager.validate_content(sequence, ValidationLevel.STRICT)
+    hits = cache.stats.hits
+    assert ValidationManager.validate_content(make_sequence("other"), ValidationLevel.STRICT) == first
+    assert cache.stats.hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_payloads_and_repository_writes():
+    cache = get_validation_cache()
+    cache.clear()
+    controller = ValidationController()
+    payload = {"notes": [{"pitch": "C", "octave": 4}], "duration": 2.0}
+    first = await controller.validate_note_sequence(payload, ValidationLevel.NORMAL)
+    assert not first.is_valid
+    misses = cache.stats.misses
+    assert await controller.validate_note_sequence(dict(payload), ValidationLevel.NORMAL) == first
+    assert cache.stats.misses == misses
+
+    collection = MagicMock()
+    collection.name = "rhythm_patterns"
+    collection.insert_one = AsyncMock(return_value=MagicMock(inserted_id=ObjectId()))
+    repository = BaseRepository[RhythmPattern](collection)
+    created = await repository.create(RhythmPattern(name="Pulse", pattern=[{"position": 0.0, "duration": 1.0}]))
+    # The write validated the pattern, so validating it is a lookup
+    misses = cache.stats.misses
+    assert (await controller.validate_model(created)).is_valid
+    assert cache.stats.misses == misses
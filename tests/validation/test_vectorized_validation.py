@@ -0,0 +1,56 @@
+"""Tests for vectorized musical validation."""
+import random
+
+import pytest
+from note_gen.core.enums import ValidationLevel
+from note_gen.models.note import Note
+from note_gen.models.note_array import NoteArray
+from note_gen.validation.musical_validation import validate_note_sequence
+from note_gen.validation.rule_registry import RULES
+from note_gen.validation.vectorized_validation import covers, validate_note_array, validate_notes
+
+NAMES = ["C4", "Db4", "C#4", "E4", "G4", "B3", "C5", "A5", "C2"]
+
+
+def random_notes(size, seed):
+    rng = random.Random(seed)
+    notes = []
+    for _ in range(size):
+        # Long runs of one note make repetitions, steady leaps parallel motion
+        notes.extend(Note.from_name(rng.choice(NAMES)) for _ in range(rng.choice([1, 1, 2, 4])))
+    return notes[:size]
+
+
+@pytest.mark.parametrize("level", list(ValidationLevel))
+def test_matches_rule_pipeline(level):
+    assert covers(level)
+    for seed in range(5):
+        notes = random_notes(300, seed)
+        # Notes the model would reject, as stored data can hold
+        notes[7] = Note.model_construct(pitch="H", octave=9, duration=0.0, velocity=200, position=0.0,
+                                        stored_midi_number=61)
+        notes[8] = Note.model_construct(pitch="", octave=None, duration=1.0, velocity=64, position=0.0,
+                                        stored_midi_number=60)
+        expected = RULES.validate(notes, level)
+        assert validate_notes(notes, level) == expected
+        assert validate_note_sequence(notes, level) == expected
+
+    assert validate_notes([], level) == RULES.validate([], level)
+    # A lone note makes no steps, so it needs no MIDI number
+    lone = [Note.model_construct(pitch="C", octave=None, duration=1.0, velocity=64, position=0.0)]
+    assert validate_notes(lone, level) == RULES.validate(lone, level)
+
+
+def test_note_arrays():
+    tail = [Note.from_name(name) for name in ("C4", "G4", "D5", "Bb2")] + [Note.from_midi_number(1)]
+    notes = random_notes(2000, 11) + tail
+    array = NoteArray.from_notes(notes)
+    result = validate_note_array(array, ValidationLevel.STRICT)
+    assert result == RULES.validate(array.to_notes(), ValidationLevel.STRICT)
+    assert {"large_interval", "parallel_motion", "excessive_repetition", "invalid_octave"} <= {
+        violation.code for violation in result.violations
+    }
+
+    scale = NoteArray(midi=[60, 62, 64, 65, 67, 69, 71, 72] * 6250, duration=[0.5] * 50000,
+                      velocity=[80] * 50000, position=[0.5 * i for i in range(50000)])
+    assert validate_note_array(scale, ValidationLevel.STRICT).is_valid